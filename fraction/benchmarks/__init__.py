@@ -0,0 +1,7 @@
+"""
+Offline micro-benchmarks for the Fraction project.
+
+Run a benchmark from the ``fraction`` directory, for example::
+
+    python -m benchmarks.bench_memory
+"""
@@ -0,0 +1,103 @@
+"""
+Arithmetic benchmark: reduced-operand (Henrici) dunders versus the previous
+cross-product-then-gcd implementation.
+
+Usage::
+
+    python -m benchmarks.bench_arithmetic
+"""
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+from fraction import Fraction
+
+SIZES = (64, 1_000, 100_000)
+
+
+def cross_add(
+    x: Fraction,
+    y: Fraction,
+) -> Fraction:
+    """
+    The previous ``__add__``: full cross product, then one large gcd.
+    """
+    return Fraction(
+        x.numerator * y.denominator + y.numerator * x.denominator,
+        x.denominator * y.denominator,
+        True,
+    )
+
+
+def cross_mul(
+    x: Fraction,
+    y: Fraction,
+) -> Fraction:
+    """
+    The previous ``__mul__``: full products, then one large gcd.
+    """
+    return Fraction(
+        x.numerator * y.numerator,
+        x.denominator * y.denominator,
+        True,
+    )
+
+
+def operands(
+    bits: int,
+    count: int,
+    seed: int = 1147,
+) -> List[Tuple[Fraction, Fraction]]:
+    """
+    Builds ``count`` pairs of reduced fractions with ``bits``-bit parts.
+
+    The denominators share a small common factor, as they do for prices
+    quoted on a common tick size.
+    """
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        x = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) * 12 + 1, True)
+        y = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) * 18 + 1, True)
+        pairs.append((x, y))
+    return pairs
+
+
+def best_time(
+    func: Callable[[Fraction, Fraction], Fraction],
+    pairs: List[Tuple[Fraction, Fraction]],
+    repeat: int = 5,
+) -> float:
+    """
+    Returns the best time, in seconds, to apply ``func`` to every pair.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for x, y in pairs:
+            func(x, y)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Prints per-operation times and the speedup for each operand size.
+    """
+    cases = (
+        ("add", cross_add, Fraction.__add__),
+        ("mul", cross_mul, Fraction.__mul__),
+    )
+    print(f"{'op':<6}{'bits':>8}{'cross us/op':>14}{'henrici us/op':>16}{'speedup':>10}")
+    for bits in SIZES:
+        count = max(3, 20_000 * 64 // bits)
+        pairs = operands(bits, count)
+        for name, baseline, current in cases:
+            old = best_time(baseline, pairs) / count * 1e6
+            new = best_time(current, pairs) / count * 1e6
+            print(f"{name:<6}{bits:>8}{old:>14.2f}{new:>16.2f}{old / new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
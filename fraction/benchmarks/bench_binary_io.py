@@ -0,0 +1,65 @@
+"""
+Binary I/O benchmark: ``fraction_io`` binary encoding versus the text path
+(``write_fractions`` and ``read_parts``) on in-memory buffers.
+
+Usage::
+
+    python -m benchmarks.bench_binary_io [count]
+"""
+
+import io
+import sys
+import time
+from typing import Callable
+
+import fraction_io
+from benchmarks.bench_text_io import values
+
+
+def timed(
+    func: Callable[[], object],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def encode_text(
+    data: list,
+) -> bytes:
+    """
+    Encodes ``data`` with the bulk text writer.
+    """
+    stream = io.BytesIO()
+    fraction_io.write_fractions(data, stream)
+    return stream.getvalue()
+
+
+def main(
+    count: int = 1_000_000,
+) -> None:
+    """
+    Prints text and binary throughput in values per second, and the encoded
+    sizes, for small and arbitrary-precision values.
+    """
+    small = values(count)
+    big = [value * 10**20 for value in small[: count // 10]]
+    print(f"{'workload':<10}{'operation':<10}{'text /s':>14}{'binary /s':>14}{'speedup':>10}")
+    for name, data in (("int64", small), ("big", big)):
+        text_time, text = timed(lambda: encode_text(data))
+        binary_time, binary = timed(lambda: fraction_io.encode_fractions(data))
+        print(f"{name:<10}{'encode':<10}{len(data) / text_time:>14,.0f}"
+              f"{len(data) / binary_time:>14,.0f}{text_time / binary_time:>9.1f}x")
+        text_time, expected = timed(lambda: fraction_io.read_parts(io.BytesIO(text)))
+        binary_time, result = timed(lambda: fraction_io.decode_parts(binary))
+        assert result == expected
+        print(f"{name:<10}{'decode':<10}{len(data) / text_time:>14,.0f}"
+              f"{len(data) / binary_time:>14,.0f}{text_time / binary_time:>9.1f}x")
+        print(f"{name:<10}{'bytes':<10}{len(text) / len(data):>14.1f}{len(binary) / len(data):>14.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,103 @@
+"""
+Comparison benchmark: merging sorted runs of large fractions with the
+early-exit comparisons versus plain cross-multiplication.
+
+Usage::
+
+    python -m benchmarks.bench_comparisons [count]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List
+
+from fraction import Fraction
+
+SIZES = (64, 1_000, 10_000)
+
+
+def cross_lt(
+    x: Fraction,
+    y: Fraction,
+) -> bool:
+    """
+    The previous ``__lt__``: always two full cross products.
+    """
+    return x.numerator * y.denominator < x.denominator * y.numerator
+
+
+def sorted_run(
+    bits: int,
+    count: int,
+    rng: random.Random,
+) -> List[Fraction]:
+    """
+    Builds a sorted run of ``count`` reduced fractions with ``bits``-bit parts
+    spread over a wide range of magnitudes and signs.
+    """
+    values = []
+    for _ in range(count):
+        denominator = rng.getrandbits(bits) | 1
+        numerator = rng.getrandbits(bits + rng.randint(-8, 8)) * rng.choice((1, -1))
+        values.append(Fraction(numerator, denominator, True))
+    values.sort(key=lambda value: value.numerator / value.denominator)
+    return values
+
+
+def merge(
+    left: List[Fraction],
+    right: List[Fraction],
+    less: Callable[[Fraction, Fraction], bool],
+) -> List[Fraction]:
+    """
+    Merges two runs with the given less-than function.
+    """
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if less(right[j], left[i]):
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
+
+
+def best_time(
+    func: Callable[[], object],
+    repeat: int = 3,
+) -> float:
+    """
+    Returns the best of ``repeat`` timings of ``func``, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(
+    count: int = 20_000,
+) -> None:
+    """
+    Prints the merge time with each comparison and checks they agree.
+    """
+    rng = random.Random(1147)
+    print(f"{'bits':>8}{'cross ms':>12}{'filtered ms':>14}{'speedup':>10}")
+    for bits in SIZES:
+        left = sorted_run(bits, count, rng)
+        right = sorted_run(bits, count, rng)
+        assert merge(left, right, cross_lt) == merge(left, right, Fraction.__lt__)
+        old = best_time(lambda: merge(left, right, cross_lt)) * 1e3
+        new = best_time(lambda: merge(left, right, Fraction.__lt__)) * 1e3
+        print(f"{bits:>8}{old:>12.1f}{new:>14.1f}{old / new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,86 @@
+"""
+Interning benchmark: allocations and throughput of a small-fraction workload
+with and without an ``InternPool``.
+
+Usage::
+
+    python -m benchmarks.bench_interning [rounds]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from fraction import Fraction, interning
+
+#: Small operands typical of share ratios and probabilities.
+SMALL = [Fraction(n, d, True) for d in range(1, 9) for n in range(0, d + 1)]
+
+
+def workload(
+    rounds: int,
+) -> List[Fraction]:
+    """
+    Multiplies and adds every pair of small operands ``rounds`` times and
+    keeps the last round of results alive.
+    """
+    kept = []
+    for _ in range(rounds):
+        kept = []
+        for x in SMALL:
+            for y in SMALL:
+                kept.append(x * y)
+                kept.append(x - y)
+    return kept
+
+
+def allocations(
+    rounds: int,
+) -> tuple:
+    """
+    Returns ``(blocks, bytes)`` still allocated by the kept results.
+    """
+    gc.collect()
+    tracemalloc.start()
+    kept = workload(rounds)
+    current, _ = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del kept
+    return blocks, current
+
+
+def throughput(
+    rounds: int,
+) -> float:
+    """
+    Returns the number of operations per second for the workload.
+    """
+    start = time.perf_counter()
+    workload(rounds)
+    elapsed = time.perf_counter() - start
+    return rounds * len(SMALL) ** 2 * 2 / elapsed
+
+
+def main(
+    rounds: int = 50,
+) -> None:
+    """
+    Prints allocation counts and throughput with and without interning.
+    """
+    print(f"{'mode':<10}{'live blocks':>14}{'live bytes':>14}{'ops/s':>14}")
+    blocks, size = allocations(1)
+    rate = throughput(rounds)
+    print(f"{'plain':<10}{blocks:>14,}{size:>14,}{rate:>14,.0f}")
+    with interning() as pool:
+        blocks, size = allocations(1)
+        rate = throughput(rounds)
+        stats = pool.stats()
+    print(f"{'interned':<10}{blocks:>14,}{size:>14,}{rate:>14,.0f}")
+    print(f"pool: {stats}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,113 @@
+"""
+Exact linear solve benchmark: ``FractionMatrix`` (fraction-free Bareiss on
+integer-scaled rows) against Gaussian elimination written with the
+``Fraction`` dunders, which reduces every intermediate entry with a gcd.
+
+Each system is a random ``n x n`` matrix of small fractions. The table
+reports the determinant, one solve including the factorization, and each
+further solve that reuses the cached factorization.
+
+Usage::
+
+    python -m benchmarks.bench_matrix [size ...]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Sequence, Tuple
+
+from fraction import Fraction
+from fraction_matrix import FractionMatrix
+
+SIZES = (50, 100, 200, 300)
+#: Sizes above this are too slow to run through the dunders.
+DUNDER_LIMIT = 200
+
+
+def system(
+    size: int,
+    seed: int = 1147,
+) -> Tuple[List[List[Fraction]], List[Fraction]]:
+    """
+    Returns a random matrix and right-hand side with entries ``a/b`` for
+    ``|a| <= 9`` and ``1 <= b <= 9``.
+    """
+    rng = random.Random(seed)
+
+    def entry() -> Fraction:
+        return Fraction(rng.randint(-9, 9), rng.randint(1, 9), True)
+
+    return [[entry() for _ in range(size)] for _ in range(size)], [entry() for _ in range(size)]
+
+
+def dunder_solve(
+    rows: Sequence[Sequence[Fraction]],
+    rhs: Sequence[Fraction],
+) -> Tuple[Fraction, List[Fraction]]:
+    """
+    Solves by Gaussian elimination on Fraction objects; returns the
+    determinant and the solution.
+    """
+    size = len(rows)
+    matrix = [list(row) + [value] for row, value in zip(rows, rhs)]
+    determinant = Fraction(1, 1)
+    for k in range(size):
+        pivot_row = next(i for i in range(k, size) if matrix[i][k] != 0)
+        if pivot_row != k:
+            matrix[k], matrix[pivot_row] = matrix[pivot_row], matrix[k]
+            determinant = -1 * determinant
+        pivot = matrix[k][k]
+        determinant *= pivot
+        for i in range(k + 1, size):
+            factor = matrix[i][k] / pivot
+            if factor != 0:
+                row, pivot_line = matrix[i], matrix[k]
+                for j in range(k + 1, size + 1):
+                    row[j] -= factor * pivot_line[j]
+    solution = [Fraction(0, 1)] * size
+    for i in reversed(range(size)):
+        total = matrix[i][size]
+        for j in range(i + 1, size):
+            total -= matrix[i][j] * solution[j]
+        solution[i] = total / matrix[i][i]
+    return determinant, solution
+
+
+def timed(
+    func: Callable[[], object],
+) -> Tuple[float, object]:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(
+    sizes: Sequence[int] = SIZES,
+) -> None:
+    """
+    Prints the timings for each system size.
+    """
+    print(f"{'size':>6}{'dunders s':>12}{'det s':>10}{'solve s':>10}{'resolve s':>11}{'speedup':>10}")
+    for size in sizes:
+        rows, rhs = system(size)
+        det_seconds, determinant = timed(FractionMatrix(rows).determinant)
+        # The first solve on a fresh matrix includes the factorization.
+        matrix = FractionMatrix(rows)
+        solve_seconds, solution = timed(lambda: matrix.solve(rhs))
+        resolve_seconds, _ = timed(lambda: matrix.solve(rhs[::-1]))
+        if size <= DUNDER_LIMIT:
+            dunder_seconds, (expected_det, expected) = timed(lambda: dunder_solve(rows, rhs))
+            assert expected_det == determinant and expected == solution
+            speedup = f"{dunder_seconds / solve_seconds:>9.1f}x"
+            dunders = f"{dunder_seconds:>12.2f}"
+        else:
+            dunders, speedup = f"{'-':>12}", f"{'-':>10}"
+        print(f"{size:>6}{dunders}{det_seconds:>10.2f}{solve_seconds:>10.2f}{resolve_seconds:>11.3f}{speedup}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,107 @@
+"""
+Memory and construction benchmark for the slotted Fraction layout.
+
+Compares ``fraction.Fraction`` against a copy of the previous ``__dict__``
+based layout and reports bytes per instance and constructions per second.
+
+Usage::
+
+    python -m benchmarks.bench_memory [count]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from fraction import Fraction
+
+
+class DictFraction:
+    """
+    The pre-``__slots__`` Fraction layout: two attributes in a ``__dict__``.
+    """
+
+    def __init__(
+        self,
+        a: int,
+        b: int,
+        simplify: bool = False,
+    ) -> None:
+        if b == 0:
+            raise ValueError("Denominator cannot be zero")
+        self.numerator = a
+        self.denominator = b
+
+
+def bytes_per_instance(
+    cls: type,
+    count: int,
+) -> float:
+    """
+    Measures the traced allocation size of ``count`` live instances of ``cls``.
+
+    Parameters
+    ----------
+    cls : type
+        The class to instantiate.
+    count : int
+        The number of instances to keep alive while measuring.
+
+    Returns
+    -------
+    float
+        The average number of bytes allocated per instance.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls(i, i + 1) for i in range(1 << 20, (1 << 20) + count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    # The list holding the instances is not part of the instance cost.
+    total -= sys.getsizeof(instances)
+    del instances
+    return total / count
+
+
+def constructions_per_second(
+    cls: type,
+    number: int = 200_000,
+) -> float:
+    """
+    Measures how many ``cls(3, 7)`` constructions run per second.
+
+    Parameters
+    ----------
+    cls : type
+        The class to instantiate.
+    number : int, optional
+        The number of constructions per timing run (default is 200000).
+
+    Returns
+    -------
+    float
+        The best observed constructions per second over five runs.
+    """
+    timer = timeit.Timer("cls(3, 7)", globals={"cls": cls})
+    best = min(timer.repeat(repeat=5, number=number))
+    return number / best
+
+
+def main(
+    count: int = 100_000,
+) -> None:
+    """
+    Prints a comparison table of the dict-based and slotted layouts.
+    """
+    print(f"{'layout':<12}{'bytes/inst':>12}{'getsizeof':>12}{'ctor/s':>14}")
+    for name, cls in (("dict", DictFraction), ("slots", Fraction)):
+        size = bytes_per_instance(cls, count)
+        shallow = sys.getsizeof(cls(1, 2))
+        rate = constructions_per_second(cls)
+        print(f"{name:<12}{size:>12.1f}{shallow:>12}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
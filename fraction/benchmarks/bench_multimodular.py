@@ -0,0 +1,58 @@
+"""
+Multi-modular benchmark: ``multimodular.determinant`` and
+``multimodular.solve`` against ``FractionMatrix``'s fraction-free Bareiss
+elimination on the same random systems of small fractions.
+
+The multi-modular runs are timed in this process (one worker) and on a
+process pool with ``os.cpu_count()`` workers.
+
+Usage::
+
+    python -m benchmarks.bench_multimodular [size ...]
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+import multimodular
+from benchmarks.bench_matrix import system, timed
+from fraction_matrix import FractionMatrix
+
+SIZES = (50, 100, 200, 300)
+
+
+def main(
+    sizes: Sequence[int] = SIZES,
+) -> None:
+    """
+    Prints the timings for each system size.
+    """
+    workers = os.cpu_count() or 1
+    print(f"{workers} worker(s)")
+    print(
+        f"{'size':>6}{'bareiss det s':>15}{'det s':>8}{'pool det s':>12}"
+        f"{'bareiss solve s':>17}{'solve s':>9}{'pool solve s':>14}"
+    )
+    with ProcessPoolExecutor(workers) as executor:
+        # Start the workers before timing.
+        list(executor.map(abs, range(workers)))
+        for size in sizes:
+            rows, rhs = system(size)
+            bareiss_det, expected_det = timed(FractionMatrix(rows).determinant)
+            bareiss_solve, expected = timed(lambda: FractionMatrix(rows).solve(rhs))
+            det_seconds, determinant = timed(lambda: multimodular.determinant(rows, workers=1))
+            pool_det, pool_determinant = timed(lambda: multimodular.determinant(rows, executor=executor))
+            solve_seconds, solution = timed(lambda: multimodular.solve(rows, rhs, workers=1))
+            pool_solve, pool_solution = timed(lambda: multimodular.solve(rows, rhs, executor=executor))
+            assert determinant == pool_determinant == expected_det
+            assert solution == pool_solution == expected
+            print(
+                f"{size:>6}{bareiss_det:>15.2f}{det_seconds:>8.2f}{pool_det:>12.2f}"
+                f"{bareiss_solve:>17.2f}{solve_seconds:>9.2f}{pool_solve:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
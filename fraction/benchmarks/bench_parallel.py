@@ -0,0 +1,91 @@
+"""
+Parallel reduction scaling benchmark: ``parallel.parallel_sum`` and
+``parallel.parallel_prod`` from one worker up to ``os.cpu_count()``, against
+the single-process ``Fraction.sum``/``Fraction.prod``.
+
+The pool is started before timing, so the figures exclude process start-up.
+
+Usage::
+
+    python -m benchmarks.bench_parallel [count]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+
+import parallel
+from benchmarks.bench_reductions import factors
+from fraction import Fraction
+
+
+def terms(
+    count: int,
+    seed: int = 1147,
+) -> List[Fraction]:
+    """
+    Builds ``count`` reduced terms with unrelated denominators, the case
+    where the lcm merges dominate and a sum is worth spreading over cores.
+    Sums of terms on a few shared denominators are cheaper to add in
+    process than to ship to workers.
+    """
+    rng = random.Random(seed)
+    return [
+        Fraction(rng.randint(-10**6, 10**6), rng.randint(1, 10**6), True)
+        for _ in range(count)
+    ]
+
+
+def timed(
+    func: Callable[[], object],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def worker_counts(
+    limit: int,
+) -> List[int]:
+    """
+    Returns 1, 2, 4, ... up to ``limit``, always ending with ``limit``.
+    """
+    counts = []
+    workers = 1
+    while workers < limit:
+        counts.append(workers)
+        workers *= 2
+    return counts + [limit]
+
+
+def main(
+    count: int = 1_000_000,
+) -> None:
+    """
+    Prints the time and speedup of each reduction for each worker count.
+    """
+    cases = (
+        ("sum", terms(count), parallel.parallel_sum),
+        ("prod", factors(count // 10), parallel.parallel_prod),
+    )
+    print(f"{'operation':<10}{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    for name, data, reduce in cases:
+        local = Fraction.sum if name == "sum" else Fraction.prod
+        baseline, expected = timed(lambda: local(data))
+        print(f"{name:<10}{'local':>8}{baseline:>10.3f}{1:>9.1f}x")
+        for workers in worker_counts(os.cpu_count() or 1):
+            with ProcessPoolExecutor(workers) as executor:
+                executor.submit(int).result()
+                seconds, result = timed(lambda: reduce(data, workers, executor=executor))
+            assert result == expected
+            print(f"{name:<10}{workers:>8}{seconds:>10.3f}{baseline / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,102 @@
+"""
+Polynomial benchmark: ``FractionPolynomial`` (integer coefficients over one
+shared denominator) against the same algorithms written with the
+``Fraction`` dunders on a list of coefficients, which reduce every
+intermediate coefficient with a gcd.
+
+The table reports Horner evaluation at ``POINTS`` rational points and one
+multiplication of two random polynomials of each degree.
+
+Usage::
+
+    python -m benchmarks.bench_polynomial [degree ...]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Sequence, Tuple
+
+from fraction import Fraction
+from fraction_polynomial import FractionPolynomial
+
+DEGREES = (16, 64, 256, 1024)
+#: Number of evaluation points per degree.
+POINTS = 200
+
+
+def coefficients(
+    degree: int,
+    rng: random.Random,
+) -> List[Fraction]:
+    """
+    Returns ``degree + 1`` random coefficients ``a/b`` with ``|a| <= 99``
+    and ``1 <= b <= 99``.
+    """
+    return [Fraction(rng.randint(-99, 99), rng.randint(1, 99), True) for _ in range(degree + 1)]
+
+
+def dunder_evaluate(
+    coefficients: Sequence[Fraction],
+    points: Sequence[Fraction],
+) -> List[Fraction]:
+    """
+    Horner's rule on Fraction objects at each point.
+    """
+    values = []
+    for x in points:
+        total = coefficients[-1]
+        for c in reversed(coefficients[:-1]):
+            total = total * x + c
+        values.append(total)
+    return values
+
+
+def dunder_multiply(
+    a: Sequence[Fraction],
+    b: Sequence[Fraction],
+) -> List[Fraction]:
+    """
+    Schoolbook multiplication on Fraction objects.
+    """
+    result = [Fraction(0, 1)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+
+def timed(
+    func: Callable[[], object],
+) -> Tuple[float, object]:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(
+    degrees: Sequence[int] = DEGREES,
+) -> None:
+    """
+    Prints the timings for each degree.
+    """
+    print(f"{'degree':>7}{'eval dunders s':>16}{'eval s':>9}{'mul dunders s':>15}{'mul s':>9}")
+    rng = random.Random(1147)
+    for degree in degrees:
+        a, b = coefficients(degree, rng), coefficients(degree, rng)
+        points = [Fraction(rng.randint(-9, 9), rng.randint(1, 9), True) for _ in range(POINTS)]
+        p, q = FractionPolynomial(a), FractionPolynomial(b)
+        eval_seconds, values = timed(lambda: p.evaluate_many(points))
+        eval_dunders, expected = timed(lambda: dunder_evaluate(a, points))
+        assert values == expected
+        mul_seconds, product = timed(lambda: p * q)
+        mul_dunders, expected = timed(lambda: dunder_multiply(a, b))
+        assert product == FractionPolynomial(expected)
+        print(f"{degree:>7}{eval_dunders:>16.3f}{eval_seconds:>9.3f}{mul_dunders:>15.3f}{mul_seconds:>9.4f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEGREES)
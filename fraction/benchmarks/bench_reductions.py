@@ -0,0 +1,82 @@
+"""
+Bulk reduction benchmark: ``Fraction.sum``/``Fraction.prod`` versus folding
+with the ``+``/``*`` dunders.
+
+Usage::
+
+    python -m benchmarks.bench_reductions [count]
+"""
+
+import functools
+import operator
+import random
+import sys
+import time
+from typing import Callable, List
+
+from fraction import Fraction
+
+#: Denominators of the price grid used for the sum workload.
+TICKS = (2, 4, 8, 10, 16, 32, 64, 100, 128, 256, 1000, 10_000)
+
+
+def prices(
+    count: int,
+    seed: int = 1147,
+) -> List[Fraction]:
+    """
+    Builds ``count`` reduced prices quoted on a handful of tick sizes.
+    """
+    rng = random.Random(seed)
+    return [
+        Fraction(rng.randint(-10**6, 10**6), rng.choice(TICKS), True)
+        for _ in range(count)
+    ]
+
+
+def factors(
+    count: int,
+    seed: int = 1147,
+) -> List[Fraction]:
+    """
+    Builds ``count`` growth factors close to one.
+    """
+    rng = random.Random(seed)
+    return [
+        Fraction(1000 + rng.randint(-50, 50), 1000, True) for _ in range(count)
+    ]
+
+
+def timed(
+    func: Callable[[], Fraction],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(
+    count: int = 1_000_000,
+) -> None:
+    """
+    Prints the time of each strategy and checks that the results agree.
+    """
+    terms = prices(count)
+    fold, expected = timed(lambda: sum(terms, Fraction(0, 1)))
+    bulk, result = timed(lambda: Fraction.sum(terms))
+    assert result == expected
+    print(f"sum  of {count:>9,} terms: dunders {fold:8.3f}s  bulk {bulk:8.3f}s  {fold / bulk:6.1f}x")
+
+    count = min(count, 20_000)
+    terms = factors(count)
+    fold, expected = timed(lambda: functools.reduce(operator.mul, terms, Fraction(1, 1)))
+    bulk, result = timed(lambda: Fraction.prod(terms))
+    assert result == expected
+    print(f"prod of {count:>9,} terms: dunders {fold:8.3f}s  bulk {bulk:8.3f}s  {fold / bulk:6.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
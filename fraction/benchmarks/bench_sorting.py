@@ -0,0 +1,76 @@
+"""
+Sorting benchmark: ``sorting.sort`` and friends versus the builtins driven
+by the comparison dunders.
+
+Usage::
+
+    python -m benchmarks.bench_sorting [count]
+"""
+
+import heapq
+import random
+import sys
+import time
+from typing import Callable, List
+
+import sorting
+from fraction import Fraction
+
+SIZES = (64, 1_000)
+
+
+def values(
+    bits: int,
+    count: int,
+    seed: int = 1147,
+) -> List[Fraction]:
+    """
+    Builds ``count`` reduced fractions with ``bits``-bit parts, including a
+    share of exact duplicates.
+    """
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        if result and rng.random() < 0.05:
+            result.append(rng.choice(result))
+        else:
+            numerator = rng.getrandbits(bits) - 2 ** (bits - 1)
+            result.append(Fraction(numerator, rng.getrandbits(bits) | 1, True))
+    return result
+
+
+def timed(
+    func: Callable[[], object],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(
+    count: int = 200_000,
+) -> None:
+    """
+    Prints builtin and keyed timings for each operation and operand size.
+    """
+    print(f"{'bits':>6} {'operation':<12}{'builtin s':>12}{'keyed s':>12}{'speedup':>10}")
+    for bits in SIZES:
+        data = values(bits, count)
+        cases = (
+            ("sort", lambda: sorted(data), lambda: sorting.sort(data)),
+            ("nlargest", lambda: heapq.nlargest(100, data), lambda: sorting.nlargest(100, data)),
+            ("min", lambda: min(data), lambda: sorting.min(data)),
+            ("median", lambda: sorted(data)[len(data) // 2], lambda: sorting.select(data, len(data) // 2)),
+        )
+        for name, builtin, keyed in cases:
+            old, expected = timed(builtin)
+            new, result = timed(keyed)
+            assert result == expected
+            print(f"{bits:>6} {name:<12}{old:>12.3f}{new:>12.3f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
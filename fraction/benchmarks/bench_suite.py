@@ -0,0 +1,267 @@
+"""
+Benchmark suite for every ``Fraction`` dunder and conversion, next to the
+standard library's ``fractions.Fraction``.
+
+Each case is timed with ``timeit`` (best of several repeats of about
+``TARGET`` seconds each) over a fixed set of operands at several operand
+sizes, and reported in nanoseconds per operation. Results can be saved as a JSON baseline and
+compared against a previous one; cases slower than the baseline by more
+than the tolerance are flagged, and the run exits with status 1.
+
+Usage::
+
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --save baseline.json
+    python -m benchmarks.bench_suite --compare baseline.json --tolerance 0.15
+    python -m benchmarks.bench_suite --only add,iadd --sizes 64
+"""
+
+import argparse
+import fractions
+import json
+import operator
+import platform
+import random
+import sys
+import timeit
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from fraction import Fraction
+
+#: Bit lengths of the numerators and denominators.
+SIZES = (32, 256, 4096)
+#: Number of operands per timing loop.
+COUNT = 200
+#: Approximate duration of one timing repeat, in seconds.
+TARGET = 0.02
+#: Allowed slowdown against the baseline before a case is flagged.
+TOLERANCE = 0.10
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: an operation on this project's Fraction and its
+    standard-library counterpart.
+
+    ``kind`` selects the operands: ``"parts"`` passes numerator and
+    denominator ints, ``"fractions"`` passes two fractions and ``"floats"``
+    passes a float (the second argument is then unused). Float cases do not
+    depend on the operand size and run once.
+    """
+
+    name: str
+    kind: str
+    ours: Callable
+    stdlib: Callable
+
+
+def _ipow(x, _):
+    x **= 3
+    return x
+
+
+CASES = (
+    Case("construct", "parts", lambda a, b: Fraction(a, b), lambda a, b: fractions.Fraction(a, b)),
+    Case("simplify", "parts", lambda a, b: Fraction(a, b, True), lambda a, b: fractions.Fraction(a, b)),
+    Case("add", "fractions", operator.add, operator.add),
+    Case("sub", "fractions", operator.sub, operator.sub),
+    Case("mul", "fractions", operator.mul, operator.mul),
+    Case("truediv", "fractions", operator.truediv, operator.truediv),
+    Case("radd", "fractions", lambda x, y: 1 + x, lambda x, y: 1 + x),
+    Case("iadd", "fractions", operator.iadd, operator.iadd),
+    Case("isub", "fractions", operator.isub, operator.isub),
+    Case("imul", "fractions", operator.imul, operator.imul),
+    Case("itruediv", "fractions", operator.itruediv, operator.itruediv),
+    Case("pow", "fractions", lambda x, y: x**3, lambda x, y: x**3),
+    Case("ipow", "fractions", _ipow, _ipow),
+    Case("eq", "fractions", operator.eq, operator.eq),
+    Case("lt", "fractions", operator.lt, operator.lt),
+    Case("le", "fractions", operator.le, operator.le),
+    Case("gt", "fractions", operator.gt, operator.gt),
+    Case("ge", "fractions", operator.ge, operator.ge),
+    Case("hash", "fractions", lambda x, y: hash(x), lambda x, y: hash(x)),
+    Case("abs", "fractions", lambda x, y: abs(x), lambda x, y: abs(x)),
+    Case("floor", "fractions", lambda x, y: x.__floor__(), lambda x, y: x.__floor__()),
+    Case("round", "fractions", lambda x, y: round(x), lambda x, y: round(x)),
+    Case("str", "fractions", lambda x, y: str(x), lambda x, y: str(x)),
+    Case("to_decimal", "fractions", lambda x, y: x.to_decimal(), lambda x, y: float(x)),
+    Case("from_decimal", "floats", lambda f, _: Fraction.from_decimal(f), lambda f, _: fractions.Fraction(f)),
+    Case("from_float", "floats", lambda f, _: Fraction.from_float(f), lambda f, _: fractions.Fraction.from_float(f)),
+)
+
+
+def operands(
+    kind: str,
+    bits: int,
+    seed: int = 1147,
+) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Returns matching operand pairs for this project's Fraction and for
+    ``fractions.Fraction``.
+    """
+    rng = random.Random(seed)
+    if kind == "floats":
+        floats = [(rng.uniform(-1000, 1000), None) for _ in range(COUNT)]
+        return floats, floats
+    parts = [
+        (rng.getrandbits(bits) - 2 ** (bits - 1) or 1, rng.getrandbits(bits) | 1)
+        for _ in range(2 * COUNT)
+    ]
+    if kind == "parts":
+        # A common factor gives the reduction real work to do.
+        scaled = [(a * 6, b * 6) for a, b in parts[:COUNT]]
+        return scaled, scaled
+    ours = [Fraction(a, b, True) for a, b in parts]
+    theirs = [fractions.Fraction(a, b) for a, b in parts]
+    return list(zip(ours[0::2], ours[1::2])), list(zip(theirs[0::2], theirs[1::2]))
+
+
+def best_time(
+    func: Callable,
+    pairs: Sequence[tuple],
+    repeat: int,
+) -> float:
+    """
+    Returns the best time per operation, in nanoseconds.
+    """
+
+    def run() -> None:
+        for x, y in pairs:
+            func(x, y)
+
+    timer = timeit.Timer(run)
+    number = max(1, int(TARGET / max(timer.timeit(1), 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / (number * len(pairs)) * 1e9
+
+
+def run_suite(
+    cases: Sequence[Case] = CASES,
+    sizes: Sequence[int] = SIZES,
+    repeat: int = 5,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Times every case at every size.
+
+    Returns
+    -------
+    dict
+        Maps ``"name/bits"`` to ``{"fraction": ns, "stdlib": ns}``.
+    """
+    results = {}
+    for case in cases:
+        for bits in sizes if case.kind != "floats" else (53,):
+            ours, theirs = operands(case.kind, bits)
+            results[f"{case.name}/{bits}"] = {
+                "fraction": best_time(case.ours, ours, repeat),
+                "stdlib": best_time(case.stdlib, theirs, repeat),
+            }
+    return results
+
+
+def load_baseline(
+    path: str,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Reads the results stored by ``save_baseline``.
+    """
+    with open(path) as stream:
+        return json.load(stream)["results"]
+
+
+def save_baseline(
+    path: str,
+    results: Dict[str, Dict[str, float]],
+) -> None:
+    """
+    Writes the results, with the interpreter and platform they came from.
+    """
+    document = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as stream:
+        json.dump(document, stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = TOLERANCE,
+) -> List[str]:
+    """
+    Returns the keys whose Fraction time exceeds the baseline by more than
+    ``tolerance`` (a fraction of the baseline time).
+    """
+    return [
+        key
+        for key, timing in results.items()
+        if key in baseline and timing["fraction"] > baseline[key]["fraction"] * (1 + tolerance)
+    ]
+
+
+def report(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+    tolerance: float = TOLERANCE,
+) -> List[str]:
+    """
+    Prints one row per case and returns the flagged regressions.
+    """
+    flagged = set(regressions(results, baseline, tolerance)) if baseline else set()
+    header = f"{'case':<20}{'fraction ns':>14}{'stdlib ns':>12}{'vs stdlib':>11}"
+    if baseline:
+        header += f"{'baseline ns':>14}{'change':>9}"
+    print(header)
+    for key, timing in results.items():
+        ours = timing["fraction"]
+        row = f"{key:<20}{ours:>14.0f}{timing['stdlib']:>12.0f}{timing['stdlib'] / ours:>10.2f}x"
+        if baseline and key in baseline:
+            old = baseline[key]["fraction"]
+            row += f"{old:>14.0f}{(ours - old) / old:>+9.0%}"
+            if key in flagged:
+                row += "  REGRESSION"
+        print(row)
+    return sorted(flagged)
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Runs the suite from the command line; returns the exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown, e.g. 0.10")
+    parser.add_argument("--only", help="comma-separated case names to run")
+    parser.add_argument("--sizes", help="comma-separated operand bit lengths")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case")
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.only:
+        names = set(args.only.split(","))
+        unknown = names - {case.name for case in CASES}
+        if unknown:
+            parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+        cases = [case for case in CASES if case.name in names]
+    sizes = [int(size) for size in args.sizes.split(",")] if args.sizes else SIZES
+
+    results = run_suite(cases, sizes, args.repeat)
+    baseline = load_baseline(args.compare) if args.compare else None
+    flagged = report(results, baseline, args.tolerance)
+    if args.save:
+        save_baseline(args.save, results)
+    if flagged:
+        print(f"\n{len(flagged)} regression(s) beyond {args.tolerance:.0%}: {', '.join(flagged)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
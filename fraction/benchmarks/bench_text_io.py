@@ -0,0 +1,98 @@
+"""
+Text I/O benchmark: ``fraction_io`` bulk parsing and formatting versus a
+per-line loop over ``str.split``/``Fraction`` and ``str()``.
+
+Usage::
+
+    python -m benchmarks.bench_text_io [count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+import fraction_io
+from fraction import Fraction
+
+
+def values(
+    count: int,
+    seed: int = 1147,
+) -> List[Fraction]:
+    """
+    Builds ``count`` reduced fractions and integers of market-data size.
+    """
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        denominator = rng.choice((1, 2, 4, 8, 100, 10_000, rng.randint(1, 10**9)))
+        result.append(Fraction(rng.randint(-10**9, 10**9), denominator, True))
+    return result
+
+
+def timed(
+    func: Callable[[], object],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def parse_lines(
+    path: str,
+) -> List[Fraction]:
+    """
+    The hand-written baseline: split each line and call the constructor.
+    """
+    result = []
+    with open(path) as stream:
+        for line in stream:
+            numerator, _, denominator = line.strip().partition("/")
+            result.append(Fraction(int(numerator), int(denominator or 1), True))
+    return result
+
+
+def format_lines(
+    data: List[Fraction],
+    path: str,
+) -> int:
+    """
+    The per-object baseline: one ``str()`` and one write per value.
+    """
+    with open(path, "w") as stream:
+        for value in data:
+            stream.write(str(value) + "\n")
+    return len(data)
+
+
+def main(
+    count: int = 1_000_000,
+) -> None:
+    """
+    Prints baseline and bulk throughput in lines per second.
+    """
+    data = values(count)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.txt")
+        target = os.path.join(directory, "target.txt")
+        fraction_io.write_fractions(data, source)
+        cases = (
+            ("parse", lambda: parse_lines(source), lambda: list(fraction_io.iter_fractions(source))),
+            ("parse parts", lambda: parse_lines(source), lambda: fraction_io.read_parts(source)[0]),
+            ("format", lambda: format_lines(data, target), lambda: fraction_io.write_fractions(data, target)),
+        )
+        print(f"{'operation':<14}{'baseline lines/s':>18}{'bulk lines/s':>16}{'speedup':>10}")
+        for name, baseline, bulk in cases:
+            old, _ = timed(baseline)
+            new, _ = timed(bulk)
+            print(f"{name:<14}{count / old:>18,.0f}{count / new:>16,.0f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
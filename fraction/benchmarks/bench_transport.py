@@ -0,0 +1,79 @@
+"""
+Transport benchmark: sending a batch of fractions to worker processes as a
+pickled list versus as a ``SharedFractions`` block.
+
+Usage::
+
+    python -m benchmarks.bench_transport [count]
+"""
+
+import multiprocessing
+import pickle
+import sys
+import time
+from typing import Callable, List
+
+from benchmarks.bench_text_io import values
+from fraction import Fraction
+from shared import SharedFractions
+
+WORKERS = 4
+
+
+def timed(
+    func: Callable[[], object],
+) -> tuple:
+    """
+    Returns ``(seconds, result)`` for a single call of ``func``.
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def count_list(
+    batch: List[Fraction],
+) -> int:
+    """
+    Worker task receiving a pickled list.
+    """
+    return len(batch)
+
+
+def count_shared(
+    batch: SharedFractions,
+) -> int:
+    """
+    Worker task receiving a shared block; it decodes the whole batch.
+    """
+    result = len(batch.to_fractions())
+    batch.close()
+    return result
+
+
+def main(
+    count: int = 1_000_000,
+) -> None:
+    """
+    Prints payload sizes and the time to hand the batch to every worker,
+    including encoding the shared block.
+    """
+    data = values(count)
+
+    def send_shared() -> List[int]:
+        with SharedFractions(data) as batch:
+            return pool.map(count_shared, [batch] * WORKERS)
+
+    with multiprocessing.Pool(WORKERS) as pool:
+        pool.map(count_list, [[]] * WORKERS)
+        listed, _ = timed(lambda: pool.map(count_list, [data] * WORKERS))
+        shared, _ = timed(send_shared)
+        with SharedFractions(data) as batch:
+            payload = len(pickle.dumps(batch))
+    print(f"{'transport':<16}{'payload bytes':>16}{'seconds':>10}")
+    print(f"{'pickled list':<16}{len(pickle.dumps(data)):>16,}{listed:>10.3f}")
+    print(f"{'SharedFractions':<16}{payload:>16,}{shared:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,80 @@
+"""
+Vector benchmark: ``FractionVector`` (integer numerators over one shared
+denominator) against the same operations written with the ``Fraction``
+dunders on lists of components, for ``COUNT`` pairs of vectors of each
+length.
+
+Usage::
+
+    python -m benchmarks.bench_vector [length ...]
+"""
+
+import random
+import sys
+from typing import List, Sequence
+
+from benchmarks.bench_matrix import timed
+from fraction import Fraction
+from fraction_vector import FractionVector
+
+LENGTHS = (10, 100, 1000)
+#: Number of vector pairs per length.
+COUNT = 200
+
+
+def components(
+    length: int,
+    rng: random.Random,
+) -> List[Fraction]:
+    """
+    Returns random components ``a/b`` with ``|a| <= 99`` and ``1 <= b <= 99``.
+    """
+    return [Fraction(rng.randint(-99, 99), rng.randint(1, 99), True) for _ in range(length)]
+
+
+def dunder_dot(
+    a: Sequence[Fraction],
+    b: Sequence[Fraction],
+) -> Fraction:
+    """
+    Dot product with Fraction dunders.
+    """
+    total = Fraction(0, 1)
+    for x, y in zip(a, b):
+        total += x * y
+    return total
+
+
+def main(
+    lengths: Sequence[int] = LENGTHS,
+) -> None:
+    """
+    Prints the timings for each vector length.
+    """
+    rng = random.Random(1147)
+    alpha = Fraction(-3, 7)
+    print(
+        f"{'length':>7}{'dot dunders s':>15}{'dot_many s':>12}"
+        f"{'axpy dunders s':>16}{'axpy_many s':>13}{'norm_many s':>13}"
+    )
+    for length in lengths:
+        lefts = [components(length, rng) for _ in range(COUNT)]
+        rights = [components(length, rng) for _ in range(COUNT)]
+        xs, ys = [FractionVector(v) for v in lefts], [FractionVector(v) for v in rights]
+        dot_dunders, expected = timed(lambda: [dunder_dot(a, b) for a, b in zip(lefts, rights)])
+        dot_seconds, dots = timed(lambda: FractionVector.dot_many(xs, ys))
+        assert dots == expected
+        axpy_dunders, expected = timed(
+            lambda: [[alpha * x + y for x, y in zip(a, b)] for a, b in zip(lefts, rights)]
+        )
+        axpy_seconds, results = timed(lambda: FractionVector.axpy_many(alpha, xs, ys))
+        assert [v.to_list() for v in results] == expected
+        norm_seconds, _ = timed(lambda: FractionVector.norm_squared_many(xs))
+        print(
+            f"{length:>7}{dot_dunders:>15.3f}{dot_seconds:>12.4f}"
+            f"{axpy_dunders:>16.3f}{axpy_seconds:>13.4f}{norm_seconds:>13.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or LENGTHS)
@@ -0,0 +1,608 @@
+"""
+Lazy continued fractions with Gosper's arithmetic.
+
+A ``ContinuedFraction`` is the sequence of terms ``[a0; a1, a2, ...]`` of
+``a0 + 1/(a1 + 1/(a2 + ...))``, produced only as consumers pull them and
+remembered once computed. Rationals have finite expansions; any iterable of
+terms, including an endless generator, can be wrapped as well.
+
+Arithmetic follows Gosper's bihomographic algorithm: the result of
+``x + y``, ``x - y``, ``x * y`` or ``x / y`` is the state
+``(a*x*y + b*x + c*y + d) / (e*x*y + f*x + g*y + h)``, which consumes terms
+of ``x`` and ``y`` only until the floor of the result is known, then emits
+that floor as its next term. The first terms of a huge expression therefore
+cost a handful of small-integer steps rather than the full big-int products
+of ``Fraction`` arithmetic, and comparisons and approximations stop as soon
+as the answer is decided.
+
+Expressions on endless inputs whose result is rational, such as ``x - x``
+for an irrational ``x``, can never decide their next term. A result that
+has consumed ``MAX_PENDING_TERMS`` input terms without emitting one raises
+ValueError instead of looping forever. Likewise, comparing two equal
+endless expansions needs ``compare(..., max_terms=...)``.
+
+Example
+-------
+>>> from continued_fraction import ContinuedFraction
+>>> x = ContinuedFraction.from_fraction(Fraction(415, 93))
+>>> x
+ContinuedFraction([4; 2, 6, 7])
+>>> (x * x + 1).approximate(Fraction(1, 1000))
+481/23
+"""
+
+import itertools
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from fraction import Fraction
+
+#: Number of terms shown by ``repr``.
+REPR_TERMS = 8
+#: Input terms an arithmetic result may consume before its next term is
+#: decided.
+MAX_PENDING_TERMS = 10_000
+
+_Coefficients = Tuple[int, int, int, int, int, int, int, int]
+
+#: Gosper states ``(a, b, c, d, e, f, g, h)`` of the binary operators.
+_ADD = (0, 1, 1, 0, 0, 0, 0, 1)
+_SUB = (0, 1, -1, 0, 0, 0, 0, 1)
+_MUL = (1, 0, 0, 0, 0, 0, 0, 1)
+_DIV = (0, 1, 0, 0, 0, 0, 1, 0)
+
+
+def _euclid(
+    numerator: int,
+    denominator: int,
+) -> Iterator[int]:
+    """
+    Yields the canonical continued fraction terms of numerator/denominator.
+    """
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    while denominator:
+        quotient, remainder = divmod(numerator, denominator)
+        yield quotient
+        numerator, denominator = denominator, remainder
+
+
+def _canonical(
+    terms: Iterable[int],
+) -> Iterator[int]:
+    """
+    Validates user-supplied terms and rewrites a final ``[..., a, 1]`` as
+    ``[..., a + 1]``, so that every expansion is canonical; this looks two
+    terms ahead.
+
+    Raises
+    ------
+    ValueError
+        If there are no terms, or a term after the first is below 1.
+    """
+    held = []
+    for term in terms:
+        if held and term < 1:
+            raise ValueError(f"Continued fraction terms after the first must be positive, not {term}")
+        held.append(term)
+        if len(held) > 2:
+            yield held.pop(0)
+    if not held:
+        raise ValueError("A continued fraction needs at least one term")
+    if len(held) == 2 and held[1] == 1:
+        held = [held[0] + 1]
+    yield from held
+
+
+def _gosper(
+    coefficients: _Coefficients,
+    xs: Iterable[int],
+    ys: Iterable[int],
+) -> Iterator[int]:
+    """
+    Yields the terms of ``(a*x*y + b*x + c*y + d) / (e*x*y + f*x + g*y + h)``
+    for the continued fractions ``xs`` and ``ys``.
+
+    After its first term, each input lies between 1 and infinity, so the
+    result lies between the four corner ratios a/e, b/f, c/g and d/h
+    whenever the denominators share a sign; once their floors agree, that
+    floor is the next term.
+
+    Raises
+    ------
+    ValueError
+        If the result is infinite, as for a division by zero, or if
+        ``MAX_PENDING_TERMS`` input terms do not decide the next term.
+    """
+    a, b, c, d, e, f, g, h = coefficients
+    xs, ys = iter(xs), iter(ys)
+    # The first terms can be negative, so both are taken before any output.
+    x_open = y_open = True
+    use_x = True
+    ingest = 2
+    emitted = False
+    pending = 0
+    while True:
+        if ingest == 0:
+            if not (e or f or g or h):
+                if not emitted:
+                    raise ValueError("Denominator cannot be zero")
+                return
+            if not (x_open or y_open):
+                # Every corner is now the same ratio a/e.
+                yield from _euclid(a, e)
+                return
+            if (e > 0 and f > 0 and g > 0 and h > 0) or (e < 0 and f < 0 and g < 0 and h < 0):
+                q = a // e
+                if b // f == q and c // g == q and d // h == q:
+                    yield q
+                    emitted = True
+                    pending = 0
+                    a, b, c, d, e, f, g, h = e, f, g, h, a - q * e, b - q * f, c - q * g, d - q * h
+                    continue
+            if not y_open:
+                use_x = True
+            elif not x_open:
+                use_x = False
+            elif e and f and g:
+                # Take a term from the input that spreads the corners most.
+                use_x = abs(a * g - c * e) * abs(f) > abs(a * f - b * e) * abs(g)
+            else:
+                use_x = not use_x
+            pending += 1
+            if pending > MAX_PENDING_TERMS:
+                raise ValueError(
+                    f"Next term undecided after {MAX_PENDING_TERMS} input terms; "
+                    "the exact result is likely rational with endless inputs"
+                )
+        else:
+            ingest -= 1
+            use_x = ingest == 1
+        if use_x:
+            p = next(xs, None)
+            if p is None:
+                x_open = False
+                c, d, g, h = a, b, e, f
+            else:
+                a, b, c, d, e, f, g, h = a * p + c, b * p + d, a, b, e * p + g, f * p + h, e, f
+        else:
+            q = next(ys, None)
+            if q is None:
+                y_open = False
+                b, d, f, h = a, c, e, g
+            else:
+                a, b, c, d, e, f, g, h = a * q + b, a, c * q + d, c, e * q + f, e, g * q + h, g
+
+
+class ContinuedFraction:
+    """
+    A lazily evaluated simple continued fraction.
+
+    Methods
+    -------
+    from_fraction(cls, value: 'Fraction') -> 'ContinuedFraction':
+        Class method to expand a Fraction or int.
+
+    term(self, index: int) -> int:
+        Returns a term, computing it if needed; None past the end.
+
+    convergents(self) -> Iterator[Fraction]:
+        Yields the successive convergents.
+
+    convergent(self, index: int) -> 'Fraction':
+        Returns the convergent built from the first index + 1 terms.
+
+    approximate(self, tolerance: 'Fraction') -> 'Fraction':
+        Returns the first convergent within the tolerance.
+
+    to_fraction(self) -> 'Fraction':
+        Returns the exact value of a finite continued fraction.
+
+    compare(self, other, max_terms: int = None) -> int:
+        Compares lazily, term by term.
+
+    __add__, __sub__, __mul__, __truediv__ and their reflected forms:
+        Lazy arithmetic with ContinuedFractions, Fractions and ints.
+    """
+
+    __slots__ = ("_terms", "_source", "_error")
+
+    def __init__(
+        self,
+        terms: Iterable[int],
+    ) -> None:
+        """
+        Wraps a finite or endless iterable of terms.
+
+        Parameters
+        ----------
+        terms : iterable of int
+            The terms ``a0, a1, ...``; every term after the first must be
+            positive. The iterable is consumed lazily.
+        """
+        self._terms = []
+        self._source = _canonical(terms)
+        self._error = None
+
+    @classmethod
+    def _lazy(
+        cls,
+        terms: Iterator[int],
+    ) -> "ContinuedFraction":
+        """
+        Wraps terms that are already canonical, such as Gosper's output.
+        """
+        result = object.__new__(cls)
+        result._terms = []
+        result._source = terms
+        result._error = None
+        return result
+
+    @classmethod
+    def from_fraction(
+        cls,
+        value: Union[Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the continued fraction of a Fraction or int; its terms are
+        computed by the Euclidean algorithm as they are pulled.
+
+        Raises
+        ------
+        TypeError
+            If the value is neither a Fraction nor an int.
+        """
+        if isinstance(value, Fraction):
+            return cls._lazy(_euclid(value._numerator, value._denominator))
+        if isinstance(value, int):
+            return cls._lazy(iter((value,)))
+        raise TypeError(f"Expected a Fraction or int, not {type(value).__name__!r}")
+
+    def term(
+        self,
+        index: int,
+    ) -> Optional[int]:
+        """
+        Returns the term at ``index``, or None past the end of a finite
+        expansion.
+
+        Raises
+        ------
+        Exception
+            Whatever the source of the terms raised. The error is kept and
+            raised again for every later term past the ones already
+            computed, so a failed expansion never reads as a finite one.
+        """
+        terms = self._terms
+        while len(terms) <= index and self._source is not None:
+            try:
+                term = next(self._source, None)
+            except Exception as error:
+                self._source = None
+                self._error = error
+                break
+            if term is None:
+                self._source = None
+            else:
+                terms.append(term)
+        if index < len(terms):
+            return terms[index]
+        if self._error is not None:
+            raise self._error
+        return None
+
+    def __iter__(
+        self,
+    ) -> Iterator[int]:
+        """
+        Iterates over the terms, computing them on demand.
+        """
+        for index in itertools.count():
+            term = self.term(index)
+            if term is None:
+                return
+            yield term
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns the first ``REPR_TERMS`` terms, computing them if needed.
+        """
+        terms = list(itertools.islice(self, REPR_TERMS + 1))
+        text = str(terms[0])
+        if len(terms) > 1:
+            text += "; " + ", ".join(map(str, terms[1:REPR_TERMS]))
+        if len(terms) > REPR_TERMS:
+            text += ", ..."
+        return f"ContinuedFraction([{text}])"
+
+    def convergents(
+        self,
+    ) -> Iterator[Fraction]:
+        """
+        Yields the convergents ``p_k/q_k`` of the expansion, each in lowest
+        terms, alternately below and above the value.
+        """
+        p, p_prev, q, q_prev = 1, 0, 0, 1
+        for term in self:
+            p, p_prev = term * p + p_prev, p
+            q, q_prev = term * q + q_prev, q
+            yield Fraction._from_reduced(p, q)
+
+    def convergent(
+        self,
+        index: int,
+    ) -> Fraction:
+        """
+        Returns the convergent built from the first ``index + 1`` terms, or
+        the exact value if the expansion is shorter.
+        """
+        result = None
+        for result in itertools.islice(self.convergents(), index + 1):
+            pass
+        return result
+
+    def approximate(
+        self,
+        tolerance: Union[Fraction, int],
+    ) -> Fraction:
+        """
+        Returns the first convergent within ``tolerance`` of the value,
+        pulling only the terms needed to prove it.
+
+        A convergent ``p_k/q_k`` is within ``1/(q_k * q_{k+1})`` of the
+        value, so the search stops one term after the bound is met.
+
+        Parameters
+        ----------
+        tolerance : Fraction or int
+            The largest acceptable error; must be positive.
+
+        Returns
+        -------
+        Fraction
+            A convergent, or the exact value of a finite expansion.
+
+        Raises
+        ------
+        ValueError
+            If the tolerance is not positive.
+        """
+        if isinstance(tolerance, Fraction):
+            t_num, t_den = tolerance._numerator, tolerance._denominator
+            if t_den < 0:
+                t_num, t_den = -t_num, -t_den
+        else:
+            t_num, t_den = tolerance, 1
+        if t_num <= 0:
+            raise ValueError("tolerance should be positive")
+        p, p_prev, q, q_prev = 1, 0, 0, 1
+        for index in itertools.count():
+            term = self.term(index)
+            if term is None:
+                break
+            if q and q * (term * q + q_prev) * t_num >= t_den:
+                break
+            p, p_prev = term * p + p_prev, p
+            q, q_prev = term * q + q_prev, q
+        return Fraction._from_reduced(p, q)
+
+    def to_fraction(
+        self,
+    ) -> Fraction:
+        """
+        Returns the exact value. Never returns for an endless expansion.
+        """
+        result = None
+        for result in self.convergents():
+            pass
+        return result
+
+    def compare(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+        max_terms: Optional[int] = None,
+    ) -> int:
+        """
+        Compares with another value term by term, stopping at the first
+        difference.
+
+        Parameters
+        ----------
+        other : ContinuedFraction, Fraction or int
+            The value to compare with.
+        max_terms : int, optional
+            The number of terms after which equal prefixes count as equal
+            (default is unbounded, which never returns for two equal
+            endless expansions).
+
+        Returns
+        -------
+        int
+            -1, 0 or 1 as self is below, equal to or above other.
+        """
+        other = _coerce(other, "compare")
+        for index in itertools.count():
+            if max_terms is not None and index >= max_terms:
+                return 0
+            mine, theirs = self.term(index), other.term(index)
+            if mine == theirs:
+                if mine is None:
+                    return 0
+                continue
+            # A finished expansion behaves as an infinite next term; larger
+            # terms at odd positions make the value smaller.
+            if mine is None:
+                larger = True
+            elif theirs is None:
+                larger = False
+            else:
+                larger = mine > theirs
+            if index % 2:
+                larger = not larger
+            return 1 if larger else -1
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks if two values are equal.
+        """
+        if not isinstance(other, (ContinuedFraction, Fraction, int)):
+            return NotImplemented
+        return self.compare(other) == 0
+
+    def __lt__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> bool:
+        """
+        Checks if the value is less than another.
+        """
+        return self.compare(other) < 0
+
+    def __le__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> bool:
+        """
+        Checks if the value is less than or equal to another.
+        """
+        return self.compare(other) <= 0
+
+    def __gt__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> bool:
+        """
+        Checks if the value is greater than another.
+        """
+        return self.compare(other) > 0
+
+    def __ge__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> bool:
+        """
+        Checks if the value is greater than or equal to another.
+        """
+        return self.compare(other) >= 0
+
+    __hash__ = None
+
+    def _combine(
+        self,
+        coefficients: _Coefficients,
+        other: Union["ContinuedFraction", Fraction, int],
+        symbol: str,
+        reflected: bool = False,
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy result of a binary operator.
+        """
+        other = _coerce(other, symbol)
+        x, y = (other, self) if reflected else (self, other)
+        return ContinuedFraction._lazy(_gosper(coefficients, iter(x), iter(y)))
+
+    def __add__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy sum (self + other).
+        """
+        return self._combine(_ADD, other, "+")
+
+    def __radd__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy sum (other + self).
+        """
+        return self._combine(_ADD, other, "+", True)
+
+    def __sub__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy difference (self - other).
+        """
+        return self._combine(_SUB, other, "-")
+
+    def __rsub__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy difference (other - self).
+        """
+        return self._combine(_SUB, other, "-", True)
+
+    def __mul__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy product (self * other).
+        """
+        return self._combine(_MUL, other, "*")
+
+    def __rmul__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy product (other * self).
+        """
+        return self._combine(_MUL, other, "*", True)
+
+    def __truediv__(
+        self,
+        other: Union["ContinuedFraction", Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy quotient (self / other). Dividing by zero raises
+        ValueError when the first term is pulled.
+        """
+        return self._combine(_DIV, other, "/")
+
+    def __rtruediv__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy quotient (other / self).
+        """
+        return self._combine(_DIV, other, "/", True)
+
+    def __neg__(
+        self,
+    ) -> "ContinuedFraction":
+        """
+        Returns the lazy negation.
+        """
+        return self._combine(_SUB, 0, "-", True)
+
+
+def _coerce(
+    value: Union[ContinuedFraction, Fraction, int],
+    symbol: str,
+) -> ContinuedFraction:
+    """
+    Returns ``value`` as a ContinuedFraction.
+
+    Raises
+    ------
+    TypeError
+        If the value is not a ContinuedFraction, Fraction or int.
+    """
+    if isinstance(value, ContinuedFraction):
+        return value
+    if isinstance(value, (Fraction, int)):
+        return ContinuedFraction.from_fraction(value)
+    raise TypeError(
+        f"Unsupported operand types for {symbol}: 'ContinuedFraction' and '{type(value).__name__}'"
+    )
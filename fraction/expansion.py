@@ -0,0 +1,361 @@
+"""
+Exact decimal expansions of fractions.
+
+``Fraction.to_decimal`` returns a float, which keeps about 17 significant
+digits. The functions in this module work on the integer parts instead, so
+every digit they produce is exact, however large the operands:
+
+- ``iter_digits`` yields the digits after the decimal point lazily, by long
+  division in blocks of ``BLOCK_DIGITS`` digits.
+- ``expand`` splits the expansion into its non-repeating and repeating
+  digits. A reduced ``n/d`` with ``d = 2**a * 5**b * m`` and ``m`` coprime
+  to 10 has exactly ``max(a, b)`` non-repeating digits, and its repetend is
+  as long as the multiplicative order of 10 modulo ``m``. The order is
+  found by stepping a single remainder until it returns to 1, so no
+  remainders are stored, and both digit strings then come from one integer
+  division each.
+- ``to_fixed`` and ``to_fixed_many`` format to a fixed number of places
+  with any of the ``decimal`` module's rounding modes, without building a
+  ``Decimal`` context.
+
+Example
+-------
+>>> import expansion
+>>> expansion.to_repeating_string(Fraction(-7, 6))
+'-1.1(6)'
+>>> expansion.to_fixed(Fraction(2, 3), 5)
+'0.66667'
+"""
+
+import math
+from decimal import (
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+)
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from fraction import Fraction, _parts
+
+#: Number of digits produced per long-division step by ``iter_digits``.
+BLOCK_DIGITS = 64
+
+ROUNDING_MODES = (
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+)
+
+Number = Union[Fraction, int]
+
+
+class Expansion(NamedTuple):
+    """
+    The decimal expansion of a fraction: its sign, the integer part, the
+    non-repeating digits after the point and the repeating digits.
+
+    ``repetend`` is empty when the expansion terminates. ``str()`` gives the
+    ``Fraction.from_string`` notation, such as ``-1.1(6)``.
+    """
+
+    negative: bool
+    integer: int
+    prefix: str
+    repetend: str
+
+    def __str__(
+        self,
+    ) -> str:
+        """
+        Returns the expansion with the repetend in parentheses.
+        """
+        text = "-" if self.negative else ""
+        text += str(self.integer)
+        if self.prefix or self.repetend:
+            text += "." + self.prefix
+        if self.repetend:
+            text += f"({self.repetend})"
+        return text
+
+
+def _reduced_parts(
+    value: Number,
+) -> Tuple[int, int]:
+    """
+    Returns the parts of ``value`` in lowest terms with a positive
+    denominator.
+    """
+    numerator, denominator = _parts(value)
+    if isinstance(value, Fraction) and value._normalized:
+        return numerator, denominator
+    divisor = math.gcd(numerator, denominator)
+    return numerator // divisor, denominator // divisor
+
+
+def iter_digits(
+    value: Number,
+) -> Iterator[int]:
+    """
+    Yields the digits after the decimal point of ``abs(value)``, exactly
+    and lazily.
+
+    The generator stops after the last non-zero digit of a terminating
+    expansion and runs forever for a repeating one; use
+    ``itertools.islice`` to take a bounded number of digits.
+
+    Parameters
+    ----------
+    value : Fraction or int
+        The value to expand.
+
+    Yields
+    ------
+    int
+        The next digit, from 0 to 9.
+    """
+    numerator, denominator = _parts(value)
+    remainder = abs(numerator) % denominator
+    scale = 10**BLOCK_DIGITS
+    while remainder:
+        block, remainder = divmod(remainder * scale, denominator)
+        text = str(block).zfill(BLOCK_DIGITS)
+        if not remainder:
+            text = text.rstrip("0")
+        yield from map(int, text)
+
+
+def _period(
+    modulus: int,
+    max_digits: Optional[int],
+) -> int:
+    """
+    Returns the multiplicative order of 10 modulo ``modulus``, which is
+    coprime to 10.
+
+    Raises
+    ------
+    ValueError
+        If the order exceeds ``max_digits``.
+    """
+    if modulus == 1:
+        return 0
+    period = 1
+    power = 10 % modulus
+    while power != 1:
+        period += 1
+        if max_digits is not None and period > max_digits:
+            raise ValueError(f"Repetend is longer than {max_digits} digits")
+        power = power * 10 % modulus
+    return period
+
+
+def expand(
+    value: Number,
+    max_digits: Optional[int] = None,
+) -> Expansion:
+    """
+    Returns the exact decimal expansion of ``value`` with its repeating
+    cycle.
+
+    Parameters
+    ----------
+    value : Fraction or int
+        The value to expand.
+    max_digits : int, optional
+        The longest repetend to search for (default is unbounded). The
+        repetend of ``n/d`` can have up to ``d - 1`` digits.
+
+    Returns
+    -------
+    Expansion
+        The sign, integer part, non-repeating and repeating digits.
+
+    Raises
+    ------
+    ValueError
+        If the repetend is longer than ``max_digits``.
+    """
+    numerator, denominator = _reduced_parts(value)
+    integer, remainder = divmod(abs(numerator), denominator)
+    twos = (denominator & -denominator).bit_length() - 1
+    modulus = denominator >> twos
+    fives = 0
+    while modulus % 5 == 0:
+        modulus //= 5
+        fives += 1
+    length = max(twos, fives)
+    prefix, remainder = divmod(remainder * 10**length, denominator)
+    prefix = str(prefix).zfill(length) if length else ""
+    repetend = ""
+    if remainder:
+        period = _period(modulus, max_digits)
+        repetend = str(remainder * (10**period - 1) // denominator).zfill(period)
+    return Expansion(numerator < 0, integer, prefix, repetend)
+
+
+def to_repeating_string(
+    value: Number,
+    max_digits: Optional[int] = None,
+) -> str:
+    """
+    Returns the exact decimal expansion of ``value`` with the repetend in
+    parentheses, as accepted by ``Fraction.from_string``.
+
+    Raises
+    ------
+    ValueError
+        If the repetend is longer than ``max_digits``.
+    """
+    return str(expand(value, max_digits))
+
+
+def _round_scaled(
+    quotient: int,
+    remainder: int,
+    denominator: int,
+    negative: bool,
+    rounding: str,
+) -> int:
+    """
+    Rounds the magnitude ``quotient + remainder / denominator`` to an
+    integer under the given rounding mode.
+    """
+    if not remainder or rounding == ROUND_DOWN:
+        return quotient
+    if rounding == ROUND_HALF_EVEN:
+        twice = 2 * remainder
+        if twice > denominator or (twice == denominator and quotient & 1):
+            return quotient + 1
+        return quotient
+    if rounding == ROUND_HALF_UP:
+        return quotient + (2 * remainder >= denominator)
+    if rounding == ROUND_HALF_DOWN:
+        return quotient + (2 * remainder > denominator)
+    if rounding == ROUND_UP:
+        return quotient + 1
+    if rounding == ROUND_CEILING:
+        return quotient + (not negative)
+    if rounding == ROUND_FLOOR:
+        return quotient + negative
+    return quotient + (quotient % 5 == 0)
+
+
+def _check_format(
+    places: int,
+    rounding: str,
+) -> None:
+    """
+    Validates the arguments shared by the fixed-point formatters.
+    """
+    if places < 0:
+        raise ValueError("places should be at least 0")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {rounding!r}")
+
+
+def _format_scaled(
+    magnitude: int,
+    negative: bool,
+    places: int,
+) -> str:
+    """
+    Formats ``magnitude / 10**places`` with exactly ``places`` decimals.
+    """
+    text = str(magnitude)
+    if places:
+        text = text.zfill(places + 1)
+        text = f"{text[:-places]}.{text[-places:]}"
+    return "-" + text if negative and magnitude else text
+
+
+def to_fixed(
+    value: Number,
+    places: int,
+    rounding: str = ROUND_HALF_EVEN,
+) -> str:
+    """
+    Formats ``value`` exactly with ``places`` digits after the decimal point.
+
+    Parameters
+    ----------
+    value : Fraction or int
+        The value to format.
+    places : int
+        The number of digits after the point.
+    rounding : str, optional
+        A rounding mode of the ``decimal`` module (default is
+        ``ROUND_HALF_EVEN``).
+
+    Returns
+    -------
+    str
+        The rounded value. A result that rounds to zero carries no sign.
+
+    Raises
+    ------
+    ValueError
+        If places is negative or the rounding mode is unknown.
+    """
+    _check_format(places, rounding)
+    numerator, denominator = _parts(value)
+    negative = numerator < 0
+    quotient, remainder = divmod(abs(numerator) * 10**places, denominator)
+    magnitude = _round_scaled(quotient, remainder, denominator, negative, rounding)
+    return _format_scaled(magnitude, negative, places)
+
+
+def to_fixed_many(
+    values: Iterable[Number],
+    places: int,
+    rounding: str = ROUND_HALF_EVEN,
+) -> List[str]:
+    """
+    Formats many values exactly with ``places`` digits after the decimal
+    point, equal to ``[to_fixed(v, places, rounding) for v in values]``.
+
+    The scale factor and rounding mode are resolved once for the whole
+    batch, and values whose scaled remainder is zero skip rounding.
+
+    Parameters
+    ----------
+    values : iterable of Fraction or int
+        The values to format.
+    places : int
+        The number of digits after the point.
+    rounding : str, optional
+        A rounding mode of the ``decimal`` module (default is
+        ``ROUND_HALF_EVEN``).
+
+    Returns
+    -------
+    list of str
+        The rounded values, in order.
+
+    Raises
+    ------
+    ValueError
+        If places is negative or the rounding mode is unknown.
+    """
+    _check_format(places, rounding)
+    scale = 10**places
+    texts = []
+    append = texts.append
+    for value in values:
+        numerator, denominator = _parts(value)
+        negative = numerator < 0
+        quotient, remainder = divmod(abs(numerator) * scale, denominator)
+        if remainder:
+            quotient = _round_scaled(quotient, remainder, denominator, negative, rounding)
+        append(_format_scaled(quotient, negative, places))
+    return texts
+
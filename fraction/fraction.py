@@ -1,4 +1,40 @@
+import collections
+import contextlib
+import functools
+import inspect
 import math
+import numbers
+import operator
+import re
+import sys
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+#: Normalization policy that reduces every arithmetic result immediately.
+EAGER = "eager"
+#: Normalization policy that defers the gcd until the result is observed or
+#: its parts outgrow ``Fraction.normalization_threshold`` bits.
+LAZY = "lazy"
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+_new = object.__new__
+_gcd = math.gcd
+
+_NUMBER_FORMAT = re.compile(
+    r"""
+    \s*(?P<sign>[-+]?)
+    (?:
+        (?P<numerator>\d+)/(?P<denominator>\d+)
+    |
+        (?=\d|\.\d)(?P<integer>\d*)
+        (?:\.(?P<decimals>\d*)(?:\((?P<repetend>\d+)\))?)?
+        (?:[eE](?P<exponent>[-+]?\d+))?
+    )
+    \s*\Z
+    """,
+    re.VERBOSE,
+)
 
 
 class Fraction:
@@ -14,7 +50,7 @@ class Fraction:
 
     Methods
     -------
-    __init__(self, a: int, b: int) -> None:
+    __new__(cls, a: int, b: int, simplify: bool = False) -> 'Fraction':
         Constructs a Fraction object with the given numerator and denominator.
 
     __str__(self) -> str:
@@ -32,12 +68,36 @@ class Fraction:
     __sub__(self, other: 'Fraction') -> 'Fraction':
         Subtracts one fraction from another and returns the result as a new Fraction object.
 
+    __rsub__(self, other: int) -> 'Fraction':
+        Subtracts the fraction from an integer (other - self) and returns the result as a new Fraction object.
+
     __mul__(self, other: 'Fraction') -> 'Fraction':
         Multiplies two fractions and returns the result as a new Fraction object.
 
+    __rmul__(self, other: int) -> 'Fraction':
+        Multiplies an integer by the fraction (other * self) and returns the result as a new Fraction object.
+
     __truediv__(self, other: 'Fraction') -> 'Fraction':
         Divides one fraction by another and returns the result as a new Fraction object.
 
+    __rtruediv__(self, other: int) -> 'Fraction':
+        Divides an integer by the fraction (other / self) and returns the result as a new Fraction object.
+
+    __pow__(self, other: int, modulo: int = None) -> 'Fraction':
+        Raises the fraction to an integer power, or returns the power modulo an integer.
+
+    __floordiv__(self, other: 'Fraction') -> 'Fraction':
+        Returns the floor of the quotient, computed with integer division.
+
+    __mod__(self, other: 'Fraction') -> 'Fraction':
+        Returns the remainder of the floored division.
+
+    __divmod__(self, other: 'Fraction') -> tuple:
+        Returns the floored quotient and the remainder together.
+
+    __round__(self, ndigits: int = None) -> 'Fraction':
+        Rounds exactly to an integer or to ndigits decimal places, ties to even.
+
     __eq__(self, other: 'Fraction') -> bool:
         Checks if two fractions are equal.
 
@@ -47,6 +107,12 @@ class Fraction:
     __le__(self, other: 'Fraction') -> bool:
         Checks if one fraction is less than or equal to another.
 
+    __gt__(self, other: 'Fraction') -> bool:
+        Checks if one fraction is greater than another.
+
+    __ge__(self, other: 'Fraction') -> bool:
+        Checks if one fraction is greater than or equal to another.
+
     simplify(self) -> 'Fraction':
         Simplifies the fraction to its lowest terms.
 
@@ -56,14 +122,94 @@ class Fraction:
     from_decimal(cls, decimal: float) -> 'Fraction':
         Class method to create a Fraction object from a decimal.
 
+    from_float(cls, value: float) -> 'Fraction':
+        Class method to create a Fraction equal to the exact value of a float.
+
+    from_floats(cls, values: Iterable, max_denominator: int = None) -> list:
+        Class method to convert a sequence of floats.
+
+    limit_denominator(self, max_denominator: int) -> 'Fraction':
+        Returns the closest fraction with a bounded denominator.
+
+    from_string(cls, text: str) -> 'Fraction':
+        Class method to parse a fraction, integer or decimal literal.
+
+    as_integer_ratio(self) -> tuple:
+        Returns the reduced (numerator, denominator) pair.
+
+    floor_many(cls, values: Iterable) -> list:
+        Class method to floor many values into ints.
+
+    ceil_many(cls, values: Iterable) -> list:
+        Class method to take the ceiling of many values as ints.
+
+    round_many(cls, values: Iterable, ndigits: int = None) -> list:
+        Class method to round many values, ties to even.
+
+    floordiv_many(cls, values: Iterable, divisor: 'Fraction') -> list:
+        Class method to bucket many values into integer bins of a given width.
+
+    set_intern_pool(cls, pool: 'InternPool') -> 'InternPool':
+        Class method to enable or disable interning of small fractions.
+
+    set_operation_cache(cls, cache: 'OperationCache') -> 'OperationCache':
+        Class method to enable or disable memoization of arithmetic results.
+
+    set_normalization(cls, policy: str, threshold: int = None) -> tuple:
+        Class method to choose when arithmetic results are reduced.
+
+    set_instrumentation(cls, instrumentation: 'Instrumentation') -> 'Instrumentation':
+        Class method to enable or disable call and operand-size counters.
+
+    sum(cls, values: Iterable) -> 'Fraction':
+        Class method to add many fractions with a single final reduction.
+
+    prod(cls, values: Iterable) -> 'Fraction':
+        Class method to multiply many fractions with a single final reduction.
+
+    sum_parts(cls, numerators: Iterable, denominators: Iterable, simplify: bool = True) -> 'Fraction':
+        Class method for ``sum`` over parallel lists of numerators and denominators.
+
+    prod_parts(cls, numerators: Iterable, denominators: Iterable, simplify: bool = True) -> 'Fraction':
+        Class method for ``prod`` over parallel lists of numerators and denominators.
+
+    Notes
+    -----
+    Instances use ``__slots__`` instead of a per-object ``__dict__`` and are
+    immutable in value: ``numerator`` and ``denominator`` are read-only, and
+    the in-place operators return a new Fraction rather than mutating the
+    left operand. ``simplify()`` only rewrites the representation of the same
+    value, so it is safe to call on shared instances.
+
+    Arithmetic results are reduced according to ``Fraction.normalization``.
+    Under ``EAGER`` (the default) every result is in lowest terms. Under
+    ``LAZY`` the gcd is skipped until the numerator or denominator grows past
+    ``Fraction.normalization_threshold`` bits, or until the value is compared,
+    hashed, printed or exported, which includes reading ``numerator`` or
+    ``denominator``.
+
+    When ``Fraction.intern_pool`` holds an ``InternPool``, construction and
+    arithmetic return shared instances for small fractions in lowest terms.
+    When ``Fraction.operation_cache`` holds an ``OperationCache``, results of
+    ``+``, ``-``, ``*``, ``/`` and ``**`` on reduced operands are memoized.
+    When ``Fraction.instrumentation`` holds an ``Instrumentation``, dunder
+    calls, gcd calls and operand sizes are counted.
     """
 
-    def __init__(
-        self,
+    __slots__ = ("_numerator", "_denominator", "_normalized")
+
+    normalization = EAGER
+    normalization_threshold = 512
+    intern_pool = None
+    operation_cache = None
+    instrumentation = None
+
+    def __new__(
+        cls,
         a: int,
         b: int,
         simplify: bool = False,
-    ) -> None:
+    ) -> "Fraction":
         """
         Constructs a Fraction object with the given numerator and denominator.
 
@@ -73,6 +219,8 @@ class Fraction:
             The numerator of the fraction.
         b : int
             The denominator of the fraction.
+        simplify : bool, optional
+            Whether to reduce the fraction to lowest terms (default is False).
 
         Raises
         ------
@@ -81,10 +229,236 @@ class Fraction:
         """
         if b == 0:
             raise ValueError("Denominator cannot be zero")
-        self.numerator = a
-        self.denominator = b
+        pool = Fraction.intern_pool
+        if pool is not None and not simplify and a.__class__ is int and b.__class__ is int:
+            # A miss is counted by intern() below, not here.
+            cached = pool._lookup(a, b)
+            if cached is not None:
+                return cached
+        self = _new(cls)
+        self._numerator = a
+        self._denominator = b
+        self._normalized = b == 1
         if simplify:
             self.simplify()
+        if pool is not None:
+            return pool.intern(self)
+        return self
+
+    def __reduce__(
+        self,
+    ) -> Tuple[type, tuple]:
+        """
+        Returns the compact pickle form: the class and the constructor
+        arguments, without the per-slot state.
+
+        A fraction known to be in lowest terms is rebuilt with ``simplify``
+        so that it keeps its reduced flag.
+        """
+        if self._normalized and self._denominator != 1:
+            return self.__class__, (self._numerator, self._denominator, True)
+        return self.__class__, (self._numerator, self._denominator)
+
+    @classmethod
+    def _from_reduced(
+        cls,
+        numerator: int,
+        denominator: int,
+    ) -> "Fraction":
+        """
+        Trusted internal constructor for parts already in lowest terms.
+
+        Skips the zero check and the sign and gcd fix-up done by
+        ``__new__`` and ``simplify()``; the caller guarantees that the
+        denominator is positive and coprime to the numerator.
+        """
+        pool = Fraction.intern_pool
+        if pool is not None:
+            cached = pool.get(numerator, denominator)
+            if cached is not None:
+                return cached
+        result = _new(cls)
+        result._numerator = numerator
+        result._denominator = denominator
+        result._normalized = True
+        if pool is not None:
+            pool.add(result)
+        return result
+
+    @classmethod
+    def _from_arithmetic(
+        cls,
+        numerator: int,
+        denominator: int,
+    ) -> "Fraction":
+        """
+        Builds the result of an arithmetic operation under the active
+        normalization policy.
+        """
+        if cls.normalization == EAGER:
+            return Fraction(numerator, denominator, True)
+        if denominator == 0:
+            raise ValueError("Denominator cannot be zero")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        result = _new(Fraction)
+        result._numerator = numerator
+        result._denominator = denominator
+        result._normalized = denominator == 1
+        if (
+            max(numerator.bit_length(), denominator.bit_length())
+            > cls.normalization_threshold
+        ):
+            result.simplify()
+        return result
+
+    def _settle(
+        self,
+    ) -> None:
+        """
+        Reduces a fraction whose normalization was deferred by the lazy policy.
+        """
+        if not self._normalized and Fraction.normalization == LAZY:
+            self.simplify()
+
+    @classmethod
+    def set_intern_pool(
+        cls,
+        pool: Optional["InternPool"],
+    ) -> Optional["InternPool"]:
+        """
+        Installs the pool used to share small fractions, or None to disable.
+
+        Parameters
+        ----------
+        pool : InternPool or None
+            The pool to install.
+
+        Returns
+        -------
+        InternPool or None
+            The previously installed pool, for restoring later.
+        """
+        previous = Fraction.intern_pool
+        Fraction.intern_pool = pool
+        return previous
+
+    @classmethod
+    def set_operation_cache(
+        cls,
+        cache: Optional["OperationCache"],
+    ) -> Optional["OperationCache"]:
+        """
+        Installs the cache used to memoize arithmetic results, or None to
+        disable memoization.
+
+        Parameters
+        ----------
+        cache : OperationCache or None
+            The cache to install.
+
+        Returns
+        -------
+        OperationCache or None
+            The previously installed cache, for restoring later.
+        """
+        previous = Fraction.operation_cache
+        Fraction.operation_cache = cache
+        return previous
+
+    @classmethod
+    def set_instrumentation(
+        cls,
+        instrumentation: Optional["Instrumentation"],
+    ) -> Optional["Instrumentation"]:
+        """
+        Installs the recorder that counts dunder calls, gcd calls and operand
+        sizes, or None to disable instrumentation.
+
+        Installing the first recorder swaps the dunders for counting wrappers
+        and removing the last one restores the originals, so a disabled
+        recorder costs nothing on the hot paths.
+
+        Parameters
+        ----------
+        instrumentation : Instrumentation or None
+            The recorder to install.
+
+        Returns
+        -------
+        Instrumentation or None
+            The previously installed recorder, for restoring later.
+        """
+        previous = Fraction.instrumentation
+        Fraction.instrumentation = instrumentation
+        if instrumentation is not None and previous is None:
+            _instrument_methods()
+        elif instrumentation is None and previous is not None:
+            _restore_methods()
+        return previous
+
+    @classmethod
+    def set_normalization(
+        cls,
+        policy: str,
+        threshold: Optional[int] = None,
+    ) -> Tuple[str, int]:
+        """
+        Chooses when arithmetic results are reduced to lowest terms.
+
+        Parameters
+        ----------
+        policy : str
+            Either ``EAGER`` or ``LAZY``.
+        threshold : int, optional
+            Under ``LAZY``, the bit length above which a result is reduced
+            immediately. Keeps the current threshold when omitted.
+
+        Returns
+        -------
+        tuple
+            The previous ``(policy, threshold)`` pair, for restoring later.
+
+        Raises
+        ------
+        ValueError
+            If the policy is unknown or the threshold is negative.
+        """
+        if policy not in (EAGER, LAZY):
+            raise ValueError(f"Unknown normalization policy: {policy!r}")
+        if threshold is not None and threshold < 0:
+            raise ValueError("Normalization threshold cannot be negative")
+        previous = (Fraction.normalization, Fraction.normalization_threshold)
+        Fraction.normalization = policy
+        if threshold is not None:
+            Fraction.normalization_threshold = threshold
+        return previous
+
+    @property
+    def numerator(
+        self,
+    ) -> int:
+        """
+        The numerator of the fraction (read-only).
+
+        Under ``LAZY`` a deferred reduction is done first, so the parts
+        match ``str()``.
+        """
+        self._settle()
+        return self._numerator
+
+    @property
+    def denominator(
+        self,
+    ) -> int:
+        """
+        The denominator of the fraction (read-only).
+
+        Under ``LAZY`` a deferred reduction is done first, so the parts
+        match ``str()``.
+        """
+        self._settle()
+        return self._denominator
 
     def __str__(
         self,
@@ -111,11 +485,12 @@ class Fraction:
         str
             A string representation for debugging.
         """
-        if self.numerator == 0:
+        self._settle()
+        if self._numerator == 0:
             return "0"
-        elif self.denominator == 1:
-            return f"{self.numerator}"
-        return f"{self.numerator}/{self.denominator}"
+        elif self._denominator == 1:
+            return f"{self._numerator}"
+        return f"{self._numerator}/{self._denominator}"
 
     def __add__(
         self,
@@ -134,27 +509,26 @@ class Fraction:
         Fraction
             The result of the addition.
         """
-        if isinstance(other, Fraction):
-            if self.denominator != other.denominator:
-                new_numerator = (
-                    self.numerator * other.denominator
-                    + other.numerator * self.denominator
-                )
-                new_denominator = self.denominator * other.denominator
-            else:
-                new_numerator = self.numerator + other.numerator
-                new_denominator = self.denominator
-            return Fraction(new_numerator, new_denominator, True)
-        elif isinstance(other, int):
-            new_numerator = self.numerator + other * self.denominator
-            new_denominator = self.denominator
-            return Fraction(new_numerator, new_denominator, True)
+        c, d, reduced = _operand_parts(other, "+", "__radd__")
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if Fraction.normalization == EAGER and (self._normalized or _mark_reduced(self)):
+            if d == 1:
+                # a/b + c is already in lowest terms: no gcd needed.
+                return Fraction._from_reduced(a + c * b, b)
+            if reduced or _mark_reduced(other):
+                cache = Fraction.operation_cache
+                if cache is not None:
+                    return cache.apply("+", a, b, c, d, _add_reduced)
+                return _add_reduced(a, b, c, d)
+        if b != d:
+            new_numerator = a * d + c * b
+            new_denominator = b * d
         else:
-            raise TypeError(
-                "Unsupported operand types for +: 'Fraction' and '{}'".format(
-                    type(other).__name__
-                )
-            )
+            new_numerator = a + c
+            new_denominator = b
+        return Fraction._from_arithmetic(new_numerator, new_denominator)
 
     def __iadd__(
         self,
@@ -163,17 +537,15 @@ class Fraction:
         """
         In-place add method to add another Fraction to the current Fraction object.
 
+        Fractions are immutable, so the name is rebound to a new Fraction.
+
         Parameters:
             other (Fraction): The Fraction object to add to the current Fraction.
 
         Returns:
-            Fraction: The updated current Fraction object after addition.
+            Fraction: A new Fraction object holding the sum.
         """
-        _temp = self.__add__(other)
-        self.numerator = _temp.numerator
-        self.denominator = _temp.denominator
-        self.simplify()
-        return self
+        return self.__add__(other)
 
     def __radd__(
         self,
@@ -192,6 +564,8 @@ class Fraction:
         Fraction
             The result of the addition.
         """
+        if _reflected_parts(other) is _DEFERRED:
+            return NotImplemented
         return self.__add__(other)
 
     def __sub__(
@@ -211,34 +585,70 @@ class Fraction:
         Fraction
             The result of the subtraction.
         """
-
-        new_numerator = (
-            self.numerator * other.denominator
-            - self.denominator * other.numerator
-        )
-        if new_numerator == 0:
-            new_denominator = self.denominator
+        c, d, reduced = _operand_parts(other, "-", "__rsub__")
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if Fraction.normalization == EAGER and (self._normalized or _mark_reduced(self)):
+            if d == 1:
+                return Fraction._from_reduced(a - c * b, b)
+            if reduced or _mark_reduced(other):
+                cache = Fraction.operation_cache
+                if cache is not None:
+                    return cache.apply("-", a, b, c, d, _sub_reduced)
+                return _sub_reduced(a, b, c, d)
+        if b != d:
+            new_numerator = a * d - c * b
+            new_denominator = b * d
         else:
-            new_denominator = self.denominator * other.denominator
-        return Fraction(new_numerator, new_denominator, True)
+            new_numerator = a - c
+            new_denominator = b
+        return Fraction._from_arithmetic(new_numerator, new_denominator)
 
     def __isub__(
         self,
         other: "Fraction",
     ) -> "Fraction":
         """
-        Subtracts another fraction from the current fraction and updates the numerator and denominator attributes of the current fraction.
+        Subtracts another fraction from the current fraction; the name is rebound to the result.
 
         Parameters:
             other (Fraction): The fraction to subtract.
 
         Returns:
-            Fraction: The updated current fraction after subtraction.
+            Fraction: A new fraction holding the difference.
         """
-        _temp = self.__sub__(other)
-        self.numerator = _temp.numerator
-        self.denominator = _temp.denominator
-        return self
+        return self.__sub__(other)
+
+    def __rsub__(
+        self,
+        other: int,
+    ) -> "Fraction":
+        """
+        Subtracts the fraction from an integer (other - self) and returns the
+        result as a new Fraction object.
+
+        Parameters
+        ----------
+        other : int
+            The integer to subtract from.
+
+        Returns
+        -------
+        Fraction
+            The result of the subtraction.
+        """
+        c, d, _ = _reflected_parts(other)
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if (
+            d == 1
+            and Fraction.normalization == EAGER
+            and (self._normalized or _mark_reduced(self))
+        ):
+            return Fraction._from_reduced(c * b - a, b)
+        return Fraction._from_arithmetic(c * b - a * d, d * b)
 
     def __mul__(
         self,
@@ -257,9 +667,19 @@ class Fraction:
         Fraction
             The result of the multiplication.
         """
-        new_numerator = self.numerator * other.numerator
-        new_denominator = self.denominator * other.denominator
-        return Fraction(new_numerator, new_denominator, True)
+        c, d, reduced = _operand_parts(other, "*", "__rmul__")
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if Fraction.normalization == EAGER and (self._normalized or _mark_reduced(self)):
+            if d == 1:
+                return _mul_int(a, b, c)
+            if reduced or _mark_reduced(other):
+                cache = Fraction.operation_cache
+                if cache is not None:
+                    return cache.apply("*", a, b, c, d, _mul_reduced)
+                return _mul_reduced(a, b, c, d)
+        return Fraction._from_arithmetic(a * c, b * d)
 
     def __imul__(
         self,
@@ -268,11 +688,13 @@ class Fraction:
         """
         Multiply the current Fraction object by another Fraction object in-place.
 
+        The left operand is not mutated; the name is rebound to a new Fraction.
+
         Args:
             other (Fraction): The Fraction object to multiply with.
 
         Returns:
-            Fraction: The updated current Fraction object after the multiplication.
+            Fraction: A new Fraction object holding the product.
 
         Example:
             >>> fraction1 = Fraction(2, 3)
@@ -281,10 +703,29 @@ class Fraction:
             >>> print(fraction1)
             Fraction(8, 15)
         """
-        _temp = self.__mul__(other)
-        self.numerator = _temp.numerator
-        self.denominator = _temp.denominator
-        return self
+        return self.__mul__(other)
+
+    def __rmul__(
+        self,
+        other: int,
+    ) -> "Fraction":
+        """
+        Multiplies an integer by the fraction (other * self) and returns the
+        result as a new Fraction object.
+
+        Parameters
+        ----------
+        other : int
+            The integer to multiply.
+
+        Returns
+        -------
+        Fraction
+            The result of the multiplication.
+        """
+        if _reflected_parts(other) is _DEFERRED:
+            return NotImplemented
+        return self.__mul__(other)
 
     def __truediv__(
         self,
@@ -303,16 +744,26 @@ class Fraction:
         Fraction
             The result of the division.
         """
-        new_numerator = self.numerator * other.denominator
-        new_denominator = self.denominator * other.numerator
-        return Fraction(new_numerator, new_denominator, True)
+        c, d, reduced = _operand_parts(other, "/", "__rtruediv__")
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if Fraction.normalization == EAGER and (self._normalized or _mark_reduced(self)):
+            if d == 1:
+                return _div_int(a, b, c)
+            if reduced or _mark_reduced(other):
+                cache = Fraction.operation_cache
+                if cache is not None:
+                    return cache.apply("/", a, b, c, d, _div_reduced)
+                return _div_reduced(a, b, c, d)
+        return Fraction._from_arithmetic(a * d, b * c)
 
     def __itruediv__(
         self,
         other: "Fraction",
     ) -> "Fraction":
         """
-        Divides one fraction by another in-place and updates the current fraction with the result.
+        Divides one fraction by another in-place; the name is rebound to the result.
 
         Parameters
         ----------
@@ -322,49 +773,189 @@ class Fraction:
         Returns
         -------
         Fraction
-            The current fraction after division.
+            A new fraction holding the quotient.
         """
-        _temp = self.__truediv__(other)
-        self.numerator = _temp.numerator
-        self.denominator = _temp.denominator
-        return self
+        return self.__truediv__(other)
 
-    def __pow__(
+    def __rtruediv__(
         self,
         other: int,
     ) -> "Fraction":
+        """
+        Divides an integer by the fraction (other / self) and returns the
+        result as a new Fraction object.
+
+        Parameters
+        ----------
+        other : int
+            The integer to divide.
+
+        Returns
+        -------
+        Fraction
+            The result of the division.
+
+        Raises
+        ------
+        ValueError
+            If the fraction is zero.
+        """
+        c, d, _ = _reflected_parts(other)
+        if c is NotImplemented:
+            return NotImplemented
+        a, b = self._numerator, self._denominator
+        if (
+            d == 1
+            and Fraction.normalization == EAGER
+            and (self._normalized or _mark_reduced(self))
+        ):
+            return _div_int(c, 1, a, b)
+        return Fraction._from_arithmetic(c * b, d * a)
+
+    def __pow__(
+        self,
+        other: int,
+        modulo: Optional[int] = None,
+    ) -> Union["Fraction", int]:
         """
         Raises the current fraction to the power of the given integer.
 
+        The powers of a fraction in lowest terms are in lowest terms, so no
+        gcd is computed for a reduced base. Negative exponents raise the
+        reciprocal, and any fraction to the power 0 is 1.
+
         Parameters
         ----------
         other : int
             The exponent to raise the fraction to.
+        modulo : int, optional
+            With a modulus, ``pow(x, k, m)`` returns the integer
+            ``n**k * d**-k`` modulo m for ``x = n/d``, the image of the
+            power in the integers modulo m.
 
         Returns
         -------
-        Fraction
-            A new Fraction object representing the result of the exponentiation.
+        Fraction or int
+            A new Fraction object representing the result of the
+            exponentiation, or an int with a modulus.
+
+        Raises
+        ------
+        TypeError
+            If the exponent or the modulus is not an integer.
+        ValueError
+            If the fraction is zero and the exponent negative, or if the
+            modular power needs an inverse that does not exist.
         """
-        return Fraction(self.numerator**other, self.denominator**other)
+        a, b = self._numerator, self._denominator
+        if (
+            modulo is None
+            and isinstance(other, int)
+            and Fraction.normalization == EAGER
+            and (self._normalized or _mark_reduced(self))
+        ):
+            cache = Fraction.operation_cache
+            if other >= 0 and cache is None:
+                return Fraction._from_reduced(a**other, b**other)
+            if other < 0 and a == 0:
+                raise ValueError("Denominator cannot be zero")
+            if cache is not None:
+                return cache.power(a, b, other)
+            return _pow_reduced(a, b, other)
+        if not isinstance(other, numbers.Integral):
+            raise TypeError(
+                f"Unsupported operand types for **: 'Fraction' and '{type(other).__name__}'"
+            )
+        other = operator.index(other)
+        if modulo is not None:
+            modulo = operator.index(modulo)
+            try:
+                return pow(a, other, modulo) * pow(b, -other, modulo) % modulo
+            except ValueError:
+                raise ValueError(
+                    f"{self} has no power {other} modulo {modulo}"
+                ) from None
+        if Fraction.normalization == EAGER:
+            # A NumPy integer exponent, or a base that is not reduced.
+            if other < 0 and a == 0:
+                raise ValueError("Denominator cannot be zero")
+            if self._normalized or _mark_reduced(self):
+                return _pow_reduced(a, b, other)
+        if other < 0:
+            a, b, other = b, a, -other
+        return Fraction._from_arithmetic(a**other, b**other)
 
     def __ipow__(
         self,
         other: int,
     ) -> "Fraction":
         """
-        Raises the current fraction to the power of the input integer and updates the current fraction with the result.
+        Raises the current fraction to the power of the input integer; the name is rebound to the result.
 
         Parameters:
             other (int): The power to raise the current fraction to.
 
         Returns:
-            Fraction: The updated current fraction after exponentiation.
+            Fraction: A new fraction holding the power.
         """
-        _temp = self**other
-        self.numerator = _temp.numerator
-        self.denominator = _temp.denominator
-        return self
+        return self**other
+
+    def _richcmp(
+        self,
+        other: Union["Fraction", int, float],
+        op: Callable[[object, object], bool],
+    ) -> bool:
+        """
+        Compares this fraction with a Fraction, int, float or other rational.
+
+        Floats are first compared through the correctly rounded float value
+        of this fraction; only when the two floats tie is the float converted
+        to its exact binary ratio for an exact comparison.
+
+        Parameters
+        ----------
+        other : Fraction, int or float
+            The value to compare with.
+        op : callable
+            The comparison operator from the ``operator`` module.
+
+        Returns
+        -------
+        bool
+            The result of the comparison, or NotImplemented for other types.
+        """
+        self._settle()
+        a, b = self._numerator, self._denominator
+        if b < 0:
+            a, b = -a, -b
+        if isinstance(other, Fraction):
+            other._settle()
+            c, d = other._numerator, other._denominator
+            if d < 0:
+                c, d = -c, -d
+        elif isinstance(other, int):
+            c, d = other, 1
+        elif isinstance(other, float):
+            if math.isnan(other) or math.isinf(other):
+                # Every finite value compares with nan or inf like 0.0 does.
+                return op(0.0, other)
+            try:
+                approximation = a / b
+            except OverflowError:
+                pass
+            else:
+                if approximation != other:
+                    return op(approximation, other)
+            c, d = other.as_integer_ratio()
+        elif isinstance(other, numbers.Integral):
+            # NumPy integer scalars and other Integral types, as in
+            # _operand_parts.
+            c, d = operator.index(other), 1
+        elif isinstance(other, numbers.Rational):
+            c, d = other.numerator, other.denominator
+        else:
+            return NotImplemented
+        return op(_compare_parts(a, b, c, d), 0)
 
     def __eq__(
         self,
@@ -373,20 +964,30 @@ class Fraction:
         """
         Checks if two fractions are equal.
 
+        Reduced operands are compared component-wise; other operands go
+        through the early-exit filters of ``_compare_parts``.
+
         Parameters
         ----------
-        other : Fraction
-            The fraction to compare.
+        other : Fraction, int or float
+            The value to compare.
 
         Returns
         -------
         bool
             True if the fractions are equal, False otherwise.
         """
-        return (
-            self.numerator * other.denominator
-            == self.denominator * other.numerator
-        )
+        if isinstance(other, Fraction):
+            self._settle()
+            other._settle()
+            if self._normalized and other._normalized:
+                return (
+                    self._numerator == other._numerator
+                    and self._denominator == other._denominator
+                )
+        elif isinstance(other, int) and self._normalized:
+            return self._denominator == 1 and self._numerator == other
+        return self._richcmp(other, operator.eq)
 
     def __lt__(
         self,
@@ -397,18 +998,19 @@ class Fraction:
 
         Parameters
         ----------
-        other : Fraction
-            The fraction to compare.
+        other : Fraction, int or float
+            The value to compare.
 
         Returns
         -------
         bool
             True if this fraction is less than the other fraction, False otherwise.
         """
-        return (
-            self.numerator * other.denominator
-            < self.denominator * other.numerator
-        )
+        if isinstance(other, Fraction) and self._normalized and other._normalized:
+            return _compare_parts(
+                self._numerator, self._denominator, other._numerator, other._denominator
+            ) < 0
+        return self._richcmp(other, operator.lt)
 
     def __le__(
         self,
@@ -419,65 +1021,311 @@ class Fraction:
 
         Parameters
         ----------
-        other : Fraction
-            The fraction to compare.
+        other : Fraction, int or float
+            The value to compare.
 
         Returns
         -------
         bool
             True if this fraction is less than or equal to the other fraction, False otherwise.
         """
-        return (
-            self.numerator * other.denominator
-            <= self.denominator * other.numerator
-        )
+        if isinstance(other, Fraction) and self._normalized and other._normalized:
+            return _compare_parts(
+                self._numerator, self._denominator, other._numerator, other._denominator
+            ) <= 0
+        return self._richcmp(other, operator.le)
 
-    def __abs__(
+    def __gt__(
         self,
-    ) -> "Fraction":
+        other: "Fraction",
+    ) -> bool:
         """
-        Returns a new Fraction object with the absolute values of the numerator and denominator of the current Fraction object.
+        Checks if one fraction is greater than another.
 
-        :return: A new Fraction object with the absolute values of the numerator and denominator of the current Fraction object.
-        :rtype: Fraction
+        Parameters
+        ----------
+        other : Fraction, int or float
+            The value to compare.
+
+        Returns
+        -------
+        bool
+            True if this fraction is greater than the other fraction, False otherwise.
         """
-        return Fraction(abs(self.numerator), abs(self.denominator))
+        if isinstance(other, Fraction) and self._normalized and other._normalized:
+            return _compare_parts(
+                self._numerator, self._denominator, other._numerator, other._denominator
+            ) > 0
+        return self._richcmp(other, operator.gt)
 
-    def __floor__(
+    def __ge__(
         self,
-    ) -> "Fraction":
+        other: "Fraction",
+    ) -> bool:
         """
-        Returns a new Fraction object representing the floor of the decimal value of this Fraction.
+        Checks if one fraction is greater than or equal to another.
 
-        :return: A new Fraction object.
-        :rtype: Fraction
+        Parameters
+        ----------
+        other : Fraction, int or float
+            The value to compare.
+
+        Returns
+        -------
+        bool
+            True if this fraction is greater than or equal to the other fraction, False otherwise.
         """
-        return Fraction(math.floor(self.to_decimal()), 1)
+        if isinstance(other, Fraction) and self._normalized and other._normalized:
+            return _compare_parts(
+                self._numerator, self._denominator, other._numerator, other._denominator
+            ) >= 0
+        return self._richcmp(other, operator.ge)
 
-    def __ceil__(
+    def __hash__(
         self,
-    ) -> "Fraction":
+    ) -> int:
         """
-        Returns a new Fraction object that represents the ceiling of the current Fraction object.
+        Returns a hash consistent with equality, including equality with ints.
 
-        This method calculates the ceiling of the decimal representation of the current Fraction object using the `math.ceil` function and creates a new Fraction object with the rounded-up numerator and a denominator of 1.
+        Equal fractions hash alike regardless of representation, and a
+        fraction equal to an integer hashes like that integer.
 
-        Returns:
-            Fraction: A new Fraction object representing the ceiling of the current Fraction object.
+        Returns
+        -------
+        int
+            The hash of the reduced value.
         """
-        return Fraction(math.ceil(self.to_decimal()), 1)
+        self._settle()
+        numerator, denominator = self._numerator, self._denominator
+        if not self._normalized:
+            divisor = _gcd(numerator, denominator)
+            if denominator < 0:
+                divisor = -divisor
+            numerator //= divisor
+            denominator //= divisor
+        try:
+            inverse = pow(denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            result = _HASH_INF
+        else:
+            result = hash(hash(abs(numerator)) * inverse)
+        result = result if numerator >= 0 else -result
+        return -2 if result == -1 else result
 
-    def __round__(
+    def __abs__(
         self,
     ) -> "Fraction":
         """
-        Returns a new Fraction object that represents the rounded value of the current Fraction object.
-        This method rounds the decimal representation of the current Fraction object using the `round` function and creates a new Fraction object with the rounded numerator and a denominator of 1.
+        Returns a new Fraction object with the absolute values of the numerator and denominator of the current Fraction object.
 
-        Returns:
-            Fraction: A new Fraction object representing the rounded value of the current Fraction object.
+        :return: A new Fraction object with the absolute values of the numerator and denominator of the current Fraction object.
+        :rtype: Fraction
         """
-        return Fraction(round(self.to_decimal()), 1)
+        return Fraction(abs(self._numerator), abs(self._denominator))
+
+    def __floor__(
+        self,
+    ) -> "Fraction":
+        """
+        Returns the largest integer not greater than the fraction, computed
+        exactly with integer floor division.
+
+        Returns
+        -------
+        Fraction
+            The floor, with a denominator of 1.
+        """
+        return Fraction._from_reduced(self._numerator // self._denominator, 1)
+
+    def __ceil__(
+        self,
+    ) -> "Fraction":
+        """
+        Returns the smallest integer not less than the fraction, computed
+        exactly with integer floor division.
+
+        Returns
+        -------
+        Fraction
+            The ceiling, with a denominator of 1.
+        """
+        return Fraction._from_reduced(-(-self._numerator // self._denominator), 1)
+
+    def __round__(
+        self,
+        ndigits: Optional[int] = None,
+    ) -> "Fraction":
+        """
+        Rounds the fraction exactly, with ties going to the even neighbour as
+        for the built-in ``round``.
+
+        Parameters
+        ----------
+        ndigits : int, optional
+            The number of decimal places to keep; negative values round to
+            tens, hundreds and so on (default rounds to an integer).
+
+        Returns
+        -------
+        Fraction
+            The rounded value.
+
+        Example
+        -------
+        >>> round(Fraction(5, 2))
+        2
+        >>> round(Fraction(1, 3), 2)
+        33/100
+        """
+        if ndigits is None:
+            return Fraction._from_reduced(_round_half_even(self._numerator, self._denominator), 1)
+        return _round_parts(self._numerator, self._denominator, ndigits)
+
+    def __floordiv__(
+        self,
+        other: Union["Fraction", int],
+    ) -> "Fraction":
+        """
+        Returns the floor of the quotient of two fractions, computed exactly
+        with integer floor division.
+
+        Parameters
+        ----------
+        other : Fraction or int
+            The divisor.
+
+        Returns
+        -------
+        Fraction
+            The floored quotient, with a denominator of 1.
+
+        Raises
+        ------
+        ValueError
+            If the divisor is zero.
+        """
+        c, d, _ = _operand_parts(other, "//", "__rfloordiv__")
+        if c is NotImplemented:
+            return NotImplemented
+        if c == 0:
+            raise ValueError("Denominator cannot be zero")
+        return Fraction._from_reduced(self._numerator * d // (self._denominator * c), 1)
+
+    def __rfloordiv__(
+        self,
+        other: int,
+    ) -> "Fraction":
+        """
+        Returns the floor of an integer divided by the fraction
+        (other // self).
+
+        Raises
+        ------
+        ValueError
+            If the fraction is zero.
+        """
+        c, d, _ = _reflected_parts(other)
+        if c is NotImplemented:
+            return NotImplemented
+        if self._numerator == 0:
+            raise ValueError("Denominator cannot be zero")
+        return Fraction._from_reduced(c * self._denominator // (d * self._numerator), 1)
+
+    def __mod__(
+        self,
+        other: Union["Fraction", int],
+    ) -> "Fraction":
+        """
+        Returns the remainder of the floored division, which has the sign of
+        the divisor, as for ints.
+
+        Parameters
+        ----------
+        other : Fraction or int
+            The divisor.
+
+        Returns
+        -------
+        Fraction
+            ``self - other * (self // other)``.
+
+        Raises
+        ------
+        ValueError
+            If the divisor is zero.
+        """
+        c, d, _ = _operand_parts(other, "%", "__rmod__")
+        if c is NotImplemented:
+            return NotImplemented
+        return _divmod_parts(self._numerator, self._denominator, c, d, self._normalized)[1]
+
+    def __rmod__(
+        self,
+        other: int,
+    ) -> "Fraction":
+        """
+        Returns the remainder of an integer divided by the fraction
+        (other % self).
+
+        Raises
+        ------
+        ValueError
+            If the fraction is zero.
+        """
+        c, d, reduced = _reflected_parts(other)
+        if c is NotImplemented:
+            return NotImplemented
+        return _divmod_parts(c, d, self._numerator, self._denominator, reduced)[1]
+
+    def __divmod__(
+        self,
+        other: Union["Fraction", int],
+    ) -> Tuple["Fraction", "Fraction"]:
+        """
+        Returns the floored quotient and the remainder together, with a
+        single integer division.
+
+        For a/b and c/d, ``divmod(a * d, b * c)`` gives the quotient and the
+        remainder's numerator over ``b * d``. With an int divisor and a
+        reduced fraction the remainder is already in lowest terms.
+
+        Parameters
+        ----------
+        other : Fraction or int
+            The divisor.
+
+        Returns
+        -------
+        tuple of Fraction
+            ``(self // other, self % other)``.
+
+        Raises
+        ------
+        ValueError
+            If the divisor is zero.
+        """
+        c, d, _ = _operand_parts(other, "divmod", "__rdivmod__")
+        if c is NotImplemented:
+            return NotImplemented
+        return _divmod_parts(self._numerator, self._denominator, c, d, self._normalized)
+
+    def __rdivmod__(
+        self,
+        other: int,
+    ) -> Tuple["Fraction", "Fraction"]:
+        """
+        Returns the floored quotient and the remainder of an integer divided
+        by the fraction (divmod(other, self)).
+
+        Raises
+        ------
+        ValueError
+            If the fraction is zero.
+        """
+        c, d, reduced = _reflected_parts(other)
+        if c is NotImplemented:
+            return NotImplemented
+        return _divmod_parts(c, d, self._numerator, self._denominator, reduced)
 
     def simplify(
         self,
@@ -490,22 +1338,24 @@ class Fraction:
         4/8 becomes 1/2
         """
 
-        if self.numerator < 0 and self.denominator < 0:
-            self.numerator = abs(self.numerator)
-            self.denominator = abs(self.denominator)
+        if self._numerator < 0 and self._denominator < 0:
+            self._numerator = abs(self._numerator)
+            self._denominator = abs(self._denominator)
 
-        if self.numerator > 0 and self.denominator < 0:
-            self.denominator = abs(self.denominator)
-            self.numerator = -1 * self.numerator
+        if self._numerator > 0 and self._denominator < 0:
+            self._denominator = abs(self._denominator)
+            self._numerator = -1 * self._numerator
 
-        if self.numerator == 0:
-            self.denominator = 1
+        if self._numerator == 0:
+            self._denominator = 1
+            self._normalized = True
             return
 
-        divisor = math.gcd(self.numerator, self.denominator)
+        divisor = _gcd(self._numerator, self._denominator)
 
-        self.numerator = self.numerator // divisor
-        self.denominator = self.denominator // divisor
+        self._numerator = self._numerator // divisor
+        self._denominator = self._denominator // divisor
+        self._normalized = True
 
     def reciprocal(
         self,
@@ -516,7 +1366,7 @@ class Fraction:
         Returns:
             Fraction: The reciprocal of the current Fraction object.
         """
-        return Fraction(self.denominator, self.numerator, simplify=False)
+        return Fraction(self._denominator, self._numerator, simplify=False)
 
     def to_decimal(
         self,
@@ -533,7 +1383,28 @@ class Fraction:
         --------
         1/2 returns 0.5
         """
-        return self.numerator / self.denominator
+        self._settle()
+        return self._numerator / self._denominator
+
+    def as_integer_ratio(
+        self,
+    ) -> Tuple[int, int]:
+        """
+        Returns the fraction as a reduced ``(numerator, denominator)`` pair.
+
+        The denominator of the returned pair is always positive. The fraction
+        itself is not modified unless a lazy normalization is pending.
+
+        Returns
+        -------
+        tuple
+            The numerator and denominator in lowest terms.
+        """
+        self._settle()
+        if self._normalized:
+            return self._numerator, self._denominator
+        reduced = Fraction(self._numerator, self._denominator, True)
+        return reduced._numerator, reduced._denominator
 
     @classmethod
     def from_decimal(
@@ -561,7 +1432,1808 @@ class Fraction:
         The `precision` parameter determines the number of decimal places to consider
         during conversion. Increasing precision may lead to a more accurate Fraction
         representation, but may not eliminate floating-point approximation completely.
+        Use ``from_float`` for an exact conversion, optionally followed by
+        ``limit_denominator``.
         """
         numerator = int(decimal * (10**precision))
         denominator = 10**precision
         return cls(numerator, denominator, simplify=True)
+
+    @classmethod
+    def from_float(
+        cls,
+        value: float,
+    ) -> "Fraction":
+        """
+        Creates a Fraction equal to the exact binary value of a float.
+
+        Parameters
+        ----------
+        value : float
+            The float to convert. Ints are accepted as well.
+
+        Returns
+        -------
+        Fraction
+            The reduced fraction; its denominator is a power of two.
+
+        Raises
+        ------
+        ValueError
+            If the value is nan or infinite.
+        TypeError
+            If the value is not a float or an int.
+
+        Example
+        -------
+        >>> Fraction.from_float(0.29)
+        5224175567749775/18014398509481984
+        >>> Fraction.from_float(0.29).limit_denominator(100)
+        29/100
+        """
+        if isinstance(value, float):
+            try:
+                numerator, denominator = value.as_integer_ratio()
+            except (ValueError, OverflowError):
+                raise ValueError(f"Cannot convert {value!r} to Fraction") from None
+            return Fraction._from_reduced(numerator, denominator)
+        if isinstance(value, int):
+            return Fraction._from_reduced(value, 1)
+        raise TypeError(
+            f"Fraction.from_float() only accepts floats, not {type(value).__name__}"
+        )
+
+    @classmethod
+    def from_floats(
+        cls,
+        values: Iterable[float],
+        max_denominator: Optional[int] = None,
+    ) -> List["Fraction"]:
+        """
+        Converts a sequence of floats, optionally limiting each denominator.
+
+        Repeated values are converted once per call, which pays off for
+        market data where the same quotes recur many times.
+
+        Parameters
+        ----------
+        values : iterable of float
+            The floats to convert.
+        max_denominator : int, optional
+            When given, each result is replaced by its best approximation
+            with a denominator of at most this value.
+
+        Returns
+        -------
+        list of Fraction
+            The converted values, in order.
+
+        Raises
+        ------
+        ValueError
+            If a value is nan or infinite, or max_denominator is below 1.
+        """
+        if max_denominator is not None and max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1")
+        from_float = Fraction.from_float
+        converted = {}
+        results = []
+        append = results.append
+        for value in values:
+            result = converted.get(value)
+            if result is None:
+                result = from_float(value)
+                if max_denominator is not None:
+                    result = result.limit_denominator(max_denominator)
+                converted[value] = result
+            append(result)
+        return results
+
+    def limit_denominator(
+        self,
+        max_denominator: int = 1_000_000,
+    ) -> "Fraction":
+        """
+        Returns the closest fraction with a denominator of at most
+        ``max_denominator``.
+
+        The candidates are the convergents and semiconvergents of the
+        continued fraction expansion; of the two best candidates the closer
+        one is returned, preferring the smaller denominator on a tie.
+
+        Parameters
+        ----------
+        max_denominator : int, optional
+            The largest allowed denominator (default is 1000000).
+
+        Returns
+        -------
+        Fraction
+            The best rational approximation, in lowest terms.
+
+        Raises
+        ------
+        ValueError
+            If max_denominator is below 1.
+
+        Example
+        -------
+        >>> Fraction.from_float(math.pi).limit_denominator(1000)
+        355/113
+        """
+        if max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1")
+        numerator, denominator = self.as_integer_ratio()
+        if denominator <= max_denominator:
+            return Fraction._from_reduced(numerator, denominator)
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        n, d = numerator, denominator
+        while True:
+            a = n // d
+            q2 = q0 + a * q1
+            if q2 > max_denominator:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+            n, d = d, n - a * d
+        k = (max_denominator - q0) // q1
+        # The candidates (p0 + k*p1)/(q0 + k*q1) and p1/q1 are
+        # 1/(q1*(q0 + k*q1)) apart, and p1/q1 is d/(q1*denominator) away
+        # from this fraction, so comparing 2*d*(q0 + k*q1) with the
+        # denominator picks the closer one.
+        if 2 * d * (q0 + k * q1) <= denominator:
+            return Fraction._from_reduced(p1, q1)
+        return Fraction._from_reduced(p0 + k * p1, q0 + k * q1)
+
+    @classmethod
+    def from_string(
+        cls,
+        text: str,
+    ) -> "Fraction":
+        """
+        Parses a Fraction from its text form.
+
+        Accepted forms are ``a/b``, integers, decimals, scientific notation
+        and repeating decimals with the repetend in parentheses, each with an
+        optional sign and surrounding whitespace.
+
+        Parameters
+        ----------
+        text : str
+            The text to parse.
+
+        Returns
+        -------
+        Fraction
+            The parsed value, in lowest terms.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a valid literal or the denominator is zero.
+        TypeError
+            If the text is not a str.
+
+        Example
+        -------
+        >>> Fraction.from_string("6/8")
+        3/4
+        >>> Fraction.from_string("-1.5e-3")
+        -3/2000
+        >>> Fraction.from_string("0.1(6)")
+        1/6
+        """
+        if not isinstance(text, str):
+            raise TypeError(
+                f"Fraction.from_string() only accepts str, not {type(text).__name__}"
+            )
+        return Fraction._from_reduced(*_parse_fraction(text))
+
+    @classmethod
+    def sum(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+    ) -> "Fraction":
+        """
+        Returns the exact sum of many fractions and ints.
+
+        Terms sharing a denominator are combined by adding numerators only.
+        The per-denominator subtotals are then merged in a balanced tree over
+        the least common multiple of their denominators, and the result is
+        reduced once at the end. This avoids the full multiply and gcd that
+        ``sum()`` pays per element through ``__add__``.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The terms to add.
+
+        Returns
+        -------
+        Fraction
+            The reduced sum; ``0`` for an empty iterable.
+
+        Example
+        -------
+        >>> Fraction.sum([Fraction(1, 4), Fraction(1, 4), Fraction(1, 6)])
+        2/3
+        """
+        groups = {}
+        get = groups.get
+        for value in values:
+            if value.__class__ is Fraction:
+                denominator = value._denominator
+                groups[denominator] = get(denominator, 0) + value._numerator
+            else:
+                numerator, denominator, _ = _operand_parts(value, "+")
+                groups[denominator] = get(denominator, 0) + numerator
+        return _sum_groups(groups)
+
+    @classmethod
+    def prod(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+    ) -> "Fraction":
+        """
+        Returns the exact product of many fractions and ints.
+
+        Numerators and denominators are multiplied separately in a balanced
+        tree, which keeps the big-int operands similar in size, and the
+        product is reduced once at the end.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The factors to multiply.
+
+        Returns
+        -------
+        Fraction
+            The reduced product; ``1`` for an empty iterable.
+        """
+        numerators = []
+        denominators = []
+        for value in values:
+            numerator, denominator, _ = _operand_parts(value, "*")
+            if numerator == 0:
+                return Fraction._from_reduced(0, 1)
+            numerators.append(numerator)
+            denominators.append(denominator)
+        return _prod_lists(numerators, denominators)
+
+    @classmethod
+    def sum_parts(
+        cls,
+        numerators: Iterable[int],
+        denominators: Iterable[int],
+        simplify: bool = True,
+    ) -> "Fraction":
+        """
+        Returns the exact sum of fractions given as parallel lists of parts,
+        as ``Fraction.sum`` does, without creating a Fraction per term.
+
+        Meant for bulk data that is already decoded into integers, such as
+        ``SharedFractions.to_parts()``.
+
+        Parameters
+        ----------
+        numerators : iterable of int
+            The numerators of the terms.
+        denominators : iterable of int
+            The matching nonzero denominators.
+        simplify : bool, optional
+            Whether to reduce the sum to lowest terms (default is True).
+            Partial sums that are only added together again can skip the
+            reduction.
+
+        Returns
+        -------
+        Fraction
+            The sum, with a positive denominator; ``0`` for empty lists.
+        """
+        groups = {}
+        get = groups.get
+        for numerator, denominator in zip(numerators, denominators):
+            groups[denominator] = get(denominator, 0) + numerator
+        return _sum_groups(groups, simplify)
+
+    @classmethod
+    def prod_parts(
+        cls,
+        numerators: Iterable[int],
+        denominators: Iterable[int],
+        simplify: bool = True,
+    ) -> "Fraction":
+        """
+        Returns the exact product of fractions given as parallel lists of
+        parts, as ``Fraction.prod`` does, without creating a Fraction per
+        factor.
+
+        Parameters
+        ----------
+        numerators : iterable of int
+            The numerators of the factors.
+        denominators : iterable of int
+            The matching nonzero denominators.
+        simplify : bool, optional
+            Whether to reduce the product to lowest terms (default is True).
+
+        Returns
+        -------
+        Fraction
+            The product; ``1`` for empty lists.
+        """
+        numerators = list(numerators)
+        if 0 in numerators:
+            return Fraction._from_reduced(0, 1)
+        return _prod_lists(numerators, list(denominators), simplify)
+
+    @classmethod
+    def floor_many(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+    ) -> List[int]:
+        """
+        Returns the floor of every value as a plain int, computed exactly
+        with integer floor division.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The values to floor.
+
+        Returns
+        -------
+        list of int
+            The floors, in order.
+        """
+        floors = []
+        append = floors.append
+        for value in values:
+            if value.__class__ is Fraction:
+                append(value._numerator // value._denominator)
+            else:
+                numerator, denominator, _ = _operand_parts(value, "floor")
+                append(numerator // denominator)
+        return floors
+
+    @classmethod
+    def ceil_many(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+    ) -> List[int]:
+        """
+        Returns the ceiling of every value as a plain int, computed exactly
+        with integer floor division.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The values to round up.
+
+        Returns
+        -------
+        list of int
+            The ceilings, in order.
+        """
+        ceilings = []
+        append = ceilings.append
+        for value in values:
+            if value.__class__ is Fraction:
+                append(-(-value._numerator // value._denominator))
+            else:
+                numerator, denominator, _ = _operand_parts(value, "ceil")
+                append(-(-numerator // denominator))
+        return ceilings
+
+    @classmethod
+    def round_many(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+        ndigits: Optional[int] = None,
+    ) -> Union[List[int], List["Fraction"]]:
+        """
+        Rounds every value exactly, with ties going to the even neighbour.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The values to round.
+        ndigits : int, optional
+            The number of decimal places to keep (default rounds to an
+            integer).
+
+        Returns
+        -------
+        list of int or list of Fraction
+            Plain ints without ``ndigits``, otherwise the Fractions returned
+            by ``round(value, ndigits)``.
+        """
+        rounded = []
+        append = rounded.append
+        for value in values:
+            if value.__class__ is Fraction:
+                numerator, denominator = value._numerator, value._denominator
+            else:
+                numerator, denominator, _ = _operand_parts(value, "round")
+            if ndigits is None:
+                append(_round_half_even(numerator, denominator))
+            else:
+                append(_round_parts(numerator, denominator, ndigits))
+        return rounded
+
+    @classmethod
+    def floordiv_many(
+        cls,
+        values: Iterable[Union["Fraction", int]],
+        divisor: Union["Fraction", int],
+    ) -> List[int]:
+        """
+        Returns ``value // divisor`` for every value as a plain int: the
+        index of the bin of width ``divisor`` holding each value.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The values to bucket.
+        divisor : Fraction or int
+            The bin width.
+
+        Returns
+        -------
+        list of int
+            The floored quotients, in order.
+
+        Raises
+        ------
+        ValueError
+            If the divisor is zero.
+
+        Example
+        -------
+        >>> Fraction.floordiv_many([Fraction(1, 3), Fraction(7, 4), -1], Fraction(1, 2))
+        [0, 3, -2]
+        """
+        c, d, _ = _operand_parts(divisor, "//")
+        if c == 0:
+            raise ValueError("Denominator cannot be zero")
+        bins = []
+        append = bins.append
+        for value in values:
+            if value.__class__ is Fraction:
+                append(value._numerator * d // (value._denominator * c))
+            else:
+                numerator, denominator, _ = _operand_parts(value, "//")
+                append(numerator * d // (denominator * c))
+        return bins
+
+
+class InternPool:
+    """
+    A bounded pool of shared Fraction instances for small values in lowest
+    terms.
+
+    Lookups are keyed on the ``(numerator, denominator)`` pair. When the pool
+    is full, the oldest entry is evicted; first-in-first-out keeps a hit down
+    to a single dict lookup. Because fractions are immutable in value, handing
+    the same instance to many callers is safe.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of pooled fractions.
+    max_part : int
+        The largest absolute numerator and denominator eligible for pooling.
+    hits : int
+        Lookups answered from the pool.
+    misses : int
+        Lookups that had to allocate a new instance.
+    evictions : int
+        Entries dropped to respect ``capacity``.
+
+    Example
+    -------
+    >>> with interning(capacity=1024, max_part=64) as pool:
+    ...     half = Fraction(1, 2)
+    ...     assert Fraction(2, 4, True) is half
+    """
+
+    __slots__ = ("capacity", "max_part", "_entries", "hits", "misses", "evictions")
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        max_part: int = 1024,
+    ) -> None:
+        """
+        Constructs an empty pool.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The maximum number of pooled fractions (default is 4096).
+        max_part : int, optional
+            The largest absolute numerator and denominator to pool
+            (default is 1024).
+
+        Raises
+        ------
+        ValueError
+            If the capacity is not positive or max_part is negative.
+        """
+        if capacity <= 0:
+            raise ValueError("Intern pool capacity must be positive")
+        if max_part < 0:
+            raise ValueError("Intern pool max_part cannot be negative")
+        self.capacity = capacity
+        self.max_part = max_part
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of pooled fractions.
+        """
+        return len(self._entries)
+
+    def get(
+        self,
+        numerator: int,
+        denominator: int,
+    ) -> Optional[Fraction]:
+        """
+        Returns the pooled fraction for a reduced pair, or None.
+
+        Only pairs in lowest terms are ever pooled, so an unreduced pair such
+        as ``(2, 4)`` always misses.
+        """
+        cached = self._entries.get((numerator, denominator))
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def _lookup(
+        self,
+        numerator: int,
+        denominator: int,
+    ) -> Optional[Fraction]:
+        """
+        Returns the pooled fraction for a pair, or None, counting only a
+        hit. The constructor uses it before ``intern``, which counts the
+        miss, so that each construction is counted once.
+        """
+        cached = self._entries.get((numerator, denominator))
+        if cached is not None:
+            self.hits += 1
+        return cached
+
+    def add(
+        self,
+        fraction: Fraction,
+    ) -> None:
+        """
+        Pools a fraction that is known to be in lowest terms, if eligible.
+        """
+        numerator, denominator = fraction._numerator, fraction._denominator
+        limit = self.max_part
+        if not (-limit <= numerator <= limit and 0 < denominator <= limit):
+            return
+        entries = self._entries
+        entries[(numerator, denominator)] = fraction
+        if len(entries) > self.capacity:
+            del entries[next(iter(entries))]
+            self.evictions += 1
+
+    def intern(
+        self,
+        fraction: Fraction,
+    ) -> Fraction:
+        """
+        Returns the pooled instance equal to ``fraction``, pooling it if new.
+
+        Fractions that are not in lowest terms are returned unchanged, so
+        ``Fraction(2, 4)`` keeps its representation.
+        """
+        numerator, denominator = fraction._numerator, fraction._denominator
+        limit = self.max_part
+        if (
+            numerator.__class__ is not int
+            or denominator.__class__ is not int
+            or not (-limit <= numerator <= limit and 0 < denominator <= limit)
+        ):
+            return fraction
+        if not fraction._normalized:
+            if _gcd(numerator, denominator) != 1:
+                return fraction
+            fraction._normalized = True
+        key = (numerator, denominator)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        self.add(fraction)
+        return fraction
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Drops every pooled fraction and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(
+        self,
+    ) -> dict:
+        """
+        Returns the pool size and its hit, miss and eviction counters.
+        """
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class OperationCache:
+    """
+    A least-recently-used memo of arithmetic results on reduced operands.
+
+    Entries are keyed on the operator and the canonical ``(numerator,
+    denominator)`` pairs of both operands; the operands of ``+`` and ``*``
+    are ordered first so that ``x + y`` and ``y + x`` share an entry.
+
+    Powers are keyed on the base and the exponent. A missing power whose
+    neighbour towards zero is cached, such as ``x ** 12`` after
+    ``x ** 11``, is built from it with one multiplication, so raising one
+    base to a run of exponents costs no more than the run itself.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of memoized results.
+    operators : set of str
+        The operators currently memoized, a subset of ``OPERATORS``.
+    hits : int
+        Results served from the cache.
+    misses : int
+        Results that had to be computed.
+    evictions : int
+        Entries dropped to respect ``capacity``.
+
+    Example
+    -------
+    >>> with memoizing(capacity=10_000, operators=("*", "/")) as cache:
+    ...     rate = Fraction(3, 7) * Fraction(7, 9)
+    ...     print(cache.stats()["misses"])
+    1
+    """
+
+    OPERATORS = ("+", "-", "*", "/", "**")
+
+    __slots__ = (
+        "capacity",
+        "operators",
+        "_entries",
+        "hits",
+        "misses",
+        "evictions",
+        "_operator_hits",
+        "_operator_misses",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 65536,
+        operators: Iterable[str] = OPERATORS,
+    ) -> None:
+        """
+        Constructs an empty cache.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The maximum number of memoized results (default is 65536).
+        operators : iterable of str, optional
+            The operators to memoize (default is all of ``OPERATORS``).
+
+        Raises
+        ------
+        ValueError
+            If the capacity is not positive or an operator is unknown.
+        """
+        if capacity <= 0:
+            raise ValueError("Operation cache capacity must be positive")
+        self.capacity = capacity
+        self.operators = set()
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._operator_hits = dict.fromkeys(self.OPERATORS, 0)
+        self._operator_misses = dict.fromkeys(self.OPERATORS, 0)
+        for operator in operators:
+            self.enable(operator)
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of memoized results.
+        """
+        return len(self._entries)
+
+    def enable(
+        self,
+        operator: str,
+    ) -> None:
+        """
+        Starts memoizing ``operator``.
+
+        Raises
+        ------
+        ValueError
+            If the operator is not one of ``OPERATORS``.
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Unknown operator: {operator!r}")
+        self.operators.add(operator)
+
+    def disable(
+        self,
+        operator: str,
+    ) -> None:
+        """
+        Stops memoizing ``operator``; its existing entries are dropped.
+
+        Raises
+        ------
+        ValueError
+            If the operator is not one of ``OPERATORS``.
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Unknown operator: {operator!r}")
+        self.operators.discard(operator)
+        for key in [key for key in self._entries if key[0] == operator]:
+            del self._entries[key]
+
+    def apply(
+        self,
+        operator: str,
+        a: int,
+        b: int,
+        c: int,
+        d: int,
+        compute: Callable[[int, int, int, int], Fraction],
+    ) -> Fraction:
+        """
+        Returns the memoized ``compute(a, b, c, d)`` for ``operator``.
+
+        Parameters
+        ----------
+        operator : str
+            The operator symbol, used as part of the key.
+        a, b, c, d : int
+            The reduced parts of the operands a/b and c/d.
+        compute : callable
+            Computes the result on a miss.
+
+        Returns
+        -------
+        Fraction
+            The cached or freshly computed result.
+        """
+        if operator not in self.operators:
+            return compute(a, b, c, d)
+        if operator in "+*" and (c, d) < (a, b):
+            key = (operator, c, d, a, b)
+        else:
+            key = (operator, a, b, c, d)
+        entries = self._entries
+        cached = entries.get(key)
+        if cached is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            self._operator_hits[operator] += 1
+            return cached
+        result = compute(a, b, c, d)
+        self.misses += 1
+        self._operator_misses[operator] += 1
+        entries[key] = result
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def power(
+        self,
+        a: int,
+        b: int,
+        k: int,
+    ) -> Fraction:
+        """
+        Returns the memoized ``(a/b) ** k`` for a reduced base.
+
+        On a miss, the power one step closer to zero is reused when it is
+        cached.
+
+        Parameters
+        ----------
+        a, b : int
+            The reduced parts of the base.
+        k : int
+            The exponent.
+
+        Returns
+        -------
+        Fraction
+            The cached or freshly computed power.
+        """
+        entries = self._entries
+
+        def compute(a: int, b: int, k: int, _: int) -> Fraction:
+            if k > 1:
+                previous = entries.get(("**", a, b, k - 1, 1))
+                if previous is not None:
+                    return Fraction._from_reduced(
+                        previous._numerator * a, previous._denominator * b
+                    )
+            elif k < -1:
+                previous = entries.get(("**", a, b, k + 1, 1))
+                if previous is not None:
+                    numerator = previous._numerator * b
+                    denominator = previous._denominator * a
+                    if denominator < 0:
+                        numerator, denominator = -numerator, -denominator
+                    return Fraction._from_reduced(numerator, denominator)
+            return _pow_reduced(a, b, k)
+
+        return self.apply("**", a, b, k, 1, compute)
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Drops every memoized result and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._operator_hits = dict.fromkeys(self.OPERATORS, 0)
+        self._operator_misses = dict.fromkeys(self.OPERATORS, 0)
+
+    def stats(
+        self,
+    ) -> dict:
+        """
+        Returns the cache size, its counters and the per-operator hit and
+        miss counts.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "operators": {
+                operator: {
+                    "hits": self._operator_hits[operator],
+                    "misses": self._operator_misses[operator],
+                }
+                for operator in self.OPERATORS
+            },
+        }
+
+
+class Instrumentation:
+    """
+    Counters for diagnosing slow Fraction workloads: how many operations ran,
+    how many gcds they needed, and how large their operands and results were.
+
+    Sizes are bit lengths, the larger of the numerator's and the
+    denominator's for fractions, and are collected into power-of-two
+    histograms keyed by the smallest power of two above the size: key 8
+    counts sizes 4 to 7 bits, and key 1 counts zero.
+
+    Attributes
+    ----------
+    calls : Counter
+        Calls per dunder, ``simplify`` and explicit construction through
+        ``__new__``. A dunder implemented through another one, such as
+        ``__iadd__`` through ``__add__``, counts both.
+    gcd_calls : int
+        Calls to ``math.gcd`` made by the Fraction module.
+    gcd_bits : Counter
+        Histogram of the size of the larger gcd argument.
+    operand_bits : Counter
+        Histogram of the size of every Fraction or int operand.
+    result_bits : Counter
+        Histogram of the size of every Fraction result.
+
+    Example
+    -------
+    >>> with profiling() as stats:
+    ...     total = Fraction(1, 3) + Fraction(1, 6)
+    >>> stats.calls["__add__"]
+    1
+    """
+
+    __slots__ = (
+        "calls",
+        "gcd_calls",
+        "gcd_bits",
+        "operand_bits",
+        "result_bits",
+        "_callbacks",
+    )
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Constructs a recorder with every counter at zero and no callbacks.
+        """
+        self._callbacks = []
+        self.clear()
+
+    def add_callback(
+        self,
+        callback: Callable[[str, tuple, object], None],
+    ) -> None:
+        """
+        Registers ``callback(name, args, result)`` to run after every
+        instrumented call.
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(
+        self,
+        callback: Callable[[str, tuple, object], None],
+    ) -> None:
+        """
+        Unregisters a callback added with ``add_callback``.
+
+        Raises
+        ------
+        ValueError
+            If the callback is not registered.
+        """
+        self._callbacks.remove(callback)
+
+    def record(
+        self,
+        name: str,
+        args: tuple,
+        result: object,
+    ) -> None:
+        """
+        Counts one call of the dunder ``name``.
+        """
+        self.calls[name] += 1
+        operand_bits = self.operand_bits
+        for value in args:
+            bits = _bit_size(value)
+            if bits is not None:
+                operand_bits[1 << bits.bit_length()] += 1
+        if isinstance(result, Fraction):
+            self.result_bits[1 << _bit_size(result).bit_length()] += 1
+        for callback in self._callbacks:
+            callback(name, args, result)
+
+    def record_gcd(
+        self,
+        integers: tuple,
+    ) -> None:
+        """
+        Counts one gcd call.
+        """
+        self.gcd_calls += 1
+        bits = max([abs(value).bit_length() for value in integers], default=0)
+        self.gcd_bits[1 << bits.bit_length()] += 1
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Resets every counter; callbacks stay registered.
+        """
+        self.calls = collections.Counter()
+        self.gcd_calls = 0
+        self.gcd_bits = collections.Counter()
+        self.operand_bits = collections.Counter()
+        self.result_bits = collections.Counter()
+
+    def stats(
+        self,
+    ) -> dict:
+        """
+        Returns a snapshot of the counters as plain, JSON-serializable data;
+        histogram keys are strings in ascending order of size.
+        """
+
+        def histogram(counter: collections.Counter) -> dict:
+            return {str(key): counter[key] for key in sorted(counter)}
+
+        return {
+            "calls": dict(sorted(self.calls.items())),
+            "gcd_calls": self.gcd_calls,
+            "gcd_bits": histogram(self.gcd_bits),
+            "operand_bits": histogram(self.operand_bits),
+            "result_bits": histogram(self.result_bits),
+        }
+
+
+#: Original Fraction methods replaced while instrumentation is installed.
+_uninstrumented = {}
+
+
+def _bit_size(
+    value: object,
+) -> Optional[int]:
+    """
+    Returns the size in bits of a Fraction or int, or None for other values.
+    """
+    if isinstance(value, Fraction):
+        return max(abs(value._numerator).bit_length(), abs(value._denominator).bit_length())
+    if isinstance(value, int) and not isinstance(value, bool):
+        return abs(value).bit_length()
+    return None
+
+
+def _counting_gcd(
+    *integers: int,
+) -> int:
+    """
+    ``math.gcd`` that reports each call to the installed Instrumentation.
+    """
+    instrumentation = Fraction.instrumentation
+    if instrumentation is not None:
+        instrumentation.record_gcd(integers)
+    return math.gcd(*integers)
+
+
+def _instrumented(
+    name: str,
+    method: Callable,
+) -> Callable:
+    """
+    Wraps a Fraction method so that each call is recorded.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        result = method(*args, **kwargs)
+        instrumentation = Fraction.instrumentation
+        if instrumentation is not None:
+            instrumentation.record(name, args, result)
+        return result
+
+    return wrapper
+
+
+def _instrument_methods() -> None:
+    """
+    Replaces the dunders, ``simplify`` and the module's gcd with counting
+    wrappers.
+    """
+    global _gcd
+    names = [
+        name
+        for name, attribute in vars(Fraction).items()
+        if inspect.isfunction(attribute)
+        and (name == "simplify" or (name.startswith("__") and name.endswith("__")))
+        and name != "__reduce__"
+    ]
+    for name in names:
+        method = vars(Fraction)[name]
+        _uninstrumented[name] = method
+        setattr(Fraction, name, _instrumented(name, method))
+    constructor = vars(Fraction)["__new__"]
+    _uninstrumented["__new__"] = constructor
+    Fraction.__new__ = staticmethod(_instrumented("__new__", constructor.__func__))
+    _gcd = _counting_gcd
+
+
+def _restore_methods() -> None:
+    """
+    Puts back the methods replaced by ``_instrument_methods``.
+    """
+    global _gcd
+    for name, method in _uninstrumented.items():
+        setattr(Fraction, name, method)
+    _uninstrumented.clear()
+    _gcd = math.gcd
+
+
+#: Returned by ``_operand_parts`` in place of the parts when the operation
+#: should be left to the other operand's reflected method.
+_DEFERRED = (NotImplemented, 0, False)
+
+
+def _operand_parts(
+    other: object,
+    symbol: str,
+    reflected: Optional[str] = None,
+) -> Tuple[int, int, bool]:
+    """
+    Returns ``(numerator, denominator, reduced)`` for an arithmetic operand.
+
+    Integers other than ``int``, such as NumPy integer scalars, are
+    accepted through ``numbers.Integral`` and converted to ``int``.
+
+    When ``reflected`` names a method that the operand's type defines, such
+    as ``"__radd__"``, ``_DEFERRED`` is returned instead, so the calling
+    dunder can return ``NotImplemented`` and let the other type handle the
+    operation. Other numbers, such as floats, do not know this Fraction
+    and still raise.
+
+    Raises
+    ------
+    TypeError
+        If the operand is neither a Fraction nor an integer, and is a
+        number or does not define the reflected method.
+    """
+    if isinstance(other, Fraction):
+        return other._numerator, other._denominator, other._normalized
+    if isinstance(other, int):
+        return other, 1, True
+    if isinstance(other, numbers.Integral):
+        return operator.index(other), 1, True
+    if (
+        reflected is not None
+        and not isinstance(other, numbers.Number)
+        and getattr(type(other), reflected, None) is not None
+    ):
+        return _DEFERRED
+    raise TypeError(
+        "Unsupported operand types for {}: 'Fraction' and '{}'".format(
+            symbol, type(other).__name__
+        )
+    )
+
+
+def _reflected_parts(
+    other: object,
+) -> Tuple[int, int, bool]:
+    """
+    Returns ``(numerator, denominator, reduced)`` for the left operand of a
+    reflected dunder, or ``_DEFERRED`` if it is not a Fraction or an
+    integer.
+
+    Reflected dunders return ``NotImplemented`` for those operands, so that
+    Python raises its own TypeError with the operands in the right order.
+    """
+    if isinstance(other, Fraction):
+        return other._numerator, other._denominator, other._normalized
+    if isinstance(other, int):
+        return other, 1, True
+    if isinstance(other, numbers.Integral):
+        return operator.index(other), 1, True
+    return _DEFERRED
+
+
+def _parts(
+    value: Union[Fraction, int],
+    kind: str = "Values",
+) -> Tuple[int, int]:
+    """
+    Returns the numerator and a positive denominator of a Fraction or an
+    int, not necessarily reduced.
+
+    Shared by the containers built on Fraction, which pass ``kind`` to name
+    what they hold in the error, such as ``"Matrix entries"``.
+
+    Raises
+    ------
+    TypeError
+        If the value is neither a Fraction nor an int.
+    """
+    if isinstance(value, Fraction):
+        numerator, denominator = value._numerator, value._denominator
+        if denominator < 0:
+            return -numerator, -denominator
+        return numerator, denominator
+    if isinstance(value, int):
+        return value, 1
+    raise TypeError(f"{kind} must be Fractions or ints, not {type(value).__name__!r}")
+
+
+def _scale_row(
+    values: Iterable[Union[Fraction, int]],
+    kind: str = "Values",
+) -> Tuple[List[int], int]:
+    """
+    Returns the integer numerators of a row of Fractions and ints over the
+    lcm of their denominators, and that lcm.
+
+    Raises
+    ------
+    TypeError
+        If a value is neither a Fraction nor an int.
+    """
+    parts = [_parts(value, kind) for value in values]
+    scale = math.lcm(*(denominator for _, denominator in parts)) if parts else 1
+    return [numerator * (scale // denominator) for numerator, denominator in parts], scale
+
+
+def _parse_fraction(
+    text: str,
+) -> Tuple[int, int]:
+    """
+    Returns the reduced ``(numerator, denominator)`` pair of a literal.
+
+    Plain integers and ``a/b`` pairs are recognized without the regular
+    expression, which keeps the common cases fast for bulk parsing.
+
+    Raises
+    ------
+    ValueError
+        If the text is not a valid literal or the denominator is zero.
+    """
+    if text.isdecimal():
+        return int(text), 1
+    numerator, slash, denominator = text.partition("/")
+    if slash and denominator.isdecimal() and (
+        numerator.isdecimal()
+        or (numerator[:1] in "-+" and numerator[1:].isdecimal())
+    ):
+        numerator = int(numerator)
+        denominator = int(denominator)
+    else:
+        match = _NUMBER_FORMAT.match(text)
+        if match is None:
+            raise ValueError(f"Invalid literal for Fraction: {text!r}")
+        if match["denominator"] is not None:
+            numerator = int(match["numerator"])
+            denominator = int(match["denominator"])
+        else:
+            decimals = match["decimals"] or ""
+            numerator = int(match["integer"] + decimals)
+            denominator = 10 ** len(decimals)
+            repetend = match["repetend"]
+            if repetend is not None:
+                scale = 10 ** len(repetend) - 1
+                numerator = numerator * scale + int(repetend)
+                denominator *= scale
+            exponent = match["exponent"]
+            if exponent is not None:
+                exponent = int(exponent)
+                if exponent >= 0:
+                    numerator *= 10**exponent
+                else:
+                    denominator *= 10**-exponent
+        if match["sign"] == "-":
+            numerator = -numerator
+    if denominator == 0:
+        raise ValueError("Denominator cannot be zero")
+    divisor = _gcd(numerator, denominator)
+    if divisor != 1:
+        numerator //= divisor
+        denominator //= divisor
+    return numerator, denominator
+
+
+def _compare_parts(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+) -> int:
+    """
+    Returns -1, 0 or 1 as a/b is less than, equal to or greater than c/d.
+
+    Both denominators must be positive. Word-sized operands are compared
+    through the cross products directly; for larger ones, cheap filters
+    decide most cases before the two big-int cross products are formed:
+
+    1. the signs of the numerators;
+    2. the magnitudes implied by the bit lengths of the parts;
+    3. the integer parts, when both values are at least one in magnitude;
+    4. the correctly rounded float values, when they fit in a float.
+    """
+    try:
+        # Each part is checked on its own: OR-ing them together would hide a
+        # big positive part behind a small negative one, as in -1 | 2**100.
+        if (
+            a.bit_length() <= 64
+            and b.bit_length() <= 64
+            and c.bit_length() <= 64
+            and d.bit_length() <= 64
+        ):
+            left = a * d
+            right = c * b
+            return (left > right) - (left < right)
+    except AttributeError:
+        # Non-integer parts (such as floats) only support the cross products.
+        left = a * d
+        right = c * b
+        return (left > right) - (left < right)
+    if a < 0:
+        if c >= 0:
+            return -1
+        sign = -1
+    elif a > 0:
+        if c <= 0:
+            return 1
+        sign = 1
+    else:
+        return (c < 0) - (c > 0)
+
+    # |a/b| lies in [2**(x - 1), 2**(x + 1)) for x = bits(a) - bits(b).
+    x = a.bit_length() - b.bit_length()
+    y = c.bit_length() - d.bit_length()
+    if x - y >= 2:
+        return sign
+    if y - x >= 2:
+        return -sign
+
+    if x > 1 and y > 1:
+        whole_x = a // b
+        whole_y = c // d
+        if whole_x != whole_y:
+            return 1 if whole_x > whole_y else -1
+
+    if -1000 < x < 1000:
+        float_x = a / b
+        float_y = c / d
+        if float_x != float_y:
+            return 1 if float_x > float_y else -1
+
+    left = a * d
+    right = c * b
+    return (left > right) - (left < right)
+
+
+def _mark_reduced(
+    value: Fraction,
+) -> bool:
+    """
+    Checks whether a fraction not yet known to be reduced is in lowest terms
+    with a positive denominator, and records the answer if it is.
+
+    Fractions built by ``Fraction(a, b)`` without ``simplify`` start out
+    unmarked; this lets them use the reduced-operand fast paths after a
+    single gcd, without rewriting their representation.
+    """
+    numerator, denominator = value._numerator, value._denominator
+    if (
+        numerator.__class__ is int
+        and denominator.__class__ is int
+        and denominator > 0
+        and _gcd(numerator, denominator) == 1
+    ):
+        value._normalized = True
+        return True
+    return False
+
+
+def _add_reduced(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+) -> Fraction:
+    """
+    Adds a/b and c/d, both in lowest terms with positive denominators.
+
+    Henrici's method: with g = gcd(b, d), the only common factors the sum
+    can have with its denominator divide g, so the result is reduced with a
+    gcd against g instead of against the full cross product.
+    """
+    g = _gcd(b, d)
+    if g == 1:
+        return Fraction._from_reduced(a * d + b * c, b * d)
+    s = b // g
+    t = a * (d // g) + c * s
+    g2 = _gcd(t, g)
+    if g2 == 1:
+        return Fraction._from_reduced(t, s * d)
+    return Fraction._from_reduced(t // g2, s * (d // g2))
+
+
+def _mul_reduced(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+) -> Fraction:
+    """
+    Multiplies a/b by c/d, both in lowest terms with positive denominators.
+
+    Cancelling gcd(a, d) and gcd(c, b) before multiplying leaves a product
+    that is already in lowest terms, and each gcd runs on the small operands.
+    """
+    g1 = _gcd(a, d)
+    if g1 > 1:
+        a //= g1
+        d //= g1
+    g2 = _gcd(c, b)
+    if g2 > 1:
+        c //= g2
+        b //= g2
+    return Fraction._from_reduced(a * c, b * d)
+
+
+def _mul_int(
+    a: int,
+    b: int,
+    n: int,
+) -> Fraction:
+    """
+    Multiplies a/b, in lowest terms with a positive denominator, by the
+    integer n.
+
+    Only gcd(n, b) can cancel, so a single gcd leaves the product reduced.
+    """
+    g = _gcd(n, b)
+    if g > 1:
+        n //= g
+        b //= g
+    return Fraction._from_reduced(a * n, b)
+
+
+def _div_int(
+    a: int,
+    b: int,
+    n: int,
+    m: int = 1,
+) -> Fraction:
+    """
+    Divides a/b by n/m, where ``b == 1`` or ``m == 1`` and both fractions
+    are in lowest terms with positive denominators.
+
+    With one side an integer, only gcd(a, n) can cancel, so a single gcd
+    leaves the quotient reduced.
+
+    Raises
+    ------
+    ValueError
+        If n is zero.
+    """
+    if n == 0:
+        raise ValueError("Denominator cannot be zero")
+    g = _gcd(a, n)
+    if g > 1:
+        a //= g
+        n //= g
+    if n < 0:
+        a, n = -a, -n
+    return Fraction._from_reduced(a * m, b * n)
+
+
+def _pow_reduced(
+    a: int,
+    b: int,
+    k: int,
+    _: int = 1,
+) -> Fraction:
+    """
+    Raises a/b, in lowest terms with a positive denominator, to the
+    integer power k; the caller checks that a is not zero when k < 0.
+
+    The parts of a power stay coprime, so no gcd is needed.
+    """
+    if k >= 0:
+        return Fraction._from_reduced(a**k, b**k)
+    k = -k
+    if a < 0:
+        return Fraction._from_reduced((-b) ** k, (-a) ** k)
+    return Fraction._from_reduced(b**k, a**k)
+
+
+def _round_half_even(
+    numerator: int,
+    denominator: int,
+) -> int:
+    """
+    Rounds numerator/denominator to the nearest integer, ties to even.
+    """
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _round_parts(
+    numerator: int,
+    denominator: int,
+    ndigits: int,
+) -> Fraction:
+    """
+    Rounds numerator/denominator to ndigits decimal places, ties to even.
+    """
+    shift = 10 ** abs(ndigits)
+    if ndigits > 0:
+        return Fraction(_round_half_even(numerator * shift, denominator), shift, True)
+    return Fraction._from_reduced(_round_half_even(numerator, denominator * shift) * shift, 1)
+
+
+def _divmod_parts(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+    reduced: bool,
+) -> Tuple[Fraction, Fraction]:
+    """
+    Returns the floored quotient and the remainder of a/b divided by c/d.
+
+    ``reduced`` tells whether a/b is known to be in lowest terms; with an
+    integer divisor the remainder then needs no gcd.
+
+    Raises
+    ------
+    ValueError
+        If c is zero.
+    """
+    if c == 0:
+        raise ValueError("Denominator cannot be zero")
+    if b < 0:
+        a, b = -a, -b
+    if d < 0:
+        c, d = -c, -d
+    quotient, remainder = divmod(a * d, b * c)
+    if d == 1 and reduced and Fraction.normalization == EAGER:
+        # gcd(a mod b*c, b) == gcd(a, b) == 1
+        return Fraction._from_reduced(quotient, 1), Fraction._from_reduced(remainder, b)
+    return Fraction._from_reduced(quotient, 1), Fraction._from_arithmetic(remainder, b * d)
+
+
+def _sub_reduced(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+) -> Fraction:
+    """
+    Subtracts c/d from a/b, both in lowest terms with positive denominators.
+    """
+    return _add_reduced(a, b, -c, d)
+
+
+def _div_reduced(
+    a: int,
+    b: int,
+    c: int,
+    d: int,
+) -> Fraction:
+    """
+    Divides a/b by c/d, both in lowest terms with positive denominators.
+
+    Raises
+    ------
+    ValueError
+        If c/d is zero.
+    """
+    if c == 0:
+        raise ValueError("Denominator cannot be zero")
+    if c < 0:
+        c, d = -c, -d
+    return _mul_reduced(a, b, d, c)
+
+
+def _sum_groups(
+    groups: dict,
+    simplify: bool = True,
+) -> Fraction:
+    """
+    Returns the sum of per-denominator numerator subtotals, merged in a
+    balanced tree over the lcm of their denominators and reduced once if
+    ``simplify`` is set.
+    """
+    get = groups.get
+    for denominator in [key for key in groups if key < 0]:
+        numerator = groups.pop(denominator)
+        groups[-denominator] = get(-denominator, 0) - numerator
+    if not groups:
+        return Fraction._from_reduced(0, 1)
+    numerator, denominator = _balanced_reduce(
+        [(numerator, denominator) for denominator, numerator in groups.items()],
+        _add_over_lcm,
+    )
+    return Fraction(numerator, denominator, simplify)
+
+
+def _prod_lists(
+    numerators: List[int],
+    denominators: List[int],
+    simplify: bool = True,
+) -> Fraction:
+    """
+    Returns the product of nonzero factors given as parallel lists of parts,
+    multiplied in balanced trees and reduced once if ``simplify`` is set.
+    """
+    if not numerators:
+        return Fraction._from_reduced(1, 1)
+    return Fraction(
+        _balanced_reduce(numerators, _multiply),
+        _balanced_reduce(denominators, _multiply),
+        simplify,
+    )
+
+
+def _multiply(
+    x: int,
+    y: int,
+) -> int:
+    """
+    Multiplies two ints; the combine step for balanced products.
+    """
+    return x * y
+
+
+def _add_over_lcm(
+    x: Tuple[int, int],
+    y: Tuple[int, int],
+) -> Tuple[int, int]:
+    """
+    Adds two ``(numerator, denominator)`` pairs over the lcm of their
+    denominators, without reducing the result.
+    """
+    a, b = x
+    c, d = y
+    g = _gcd(b, d)
+    if g == 1:
+        return a * d + c * b, b * d
+    return a * (d // g) + c * (b // g), b // g * d
+
+
+def _balanced_reduce(
+    items: List,
+    combine: Callable,
+):
+    """
+    Folds ``items`` with ``combine`` in a balanced binary tree.
+
+    Combining neighbours level by level keeps both operands of each step
+    about the same size, which is much cheaper for big ints than a left fold.
+    """
+    while len(items) > 1:
+        paired = [combine(items[i], items[i + 1]) for i in range(0, len(items) - 1, 2)]
+        if len(items) % 2:
+            paired.append(items[-1])
+        items = paired
+    return items[0]
+
+
+def __getattr__(
+    name: str,
+) -> object:
+    """
+    Lazily exposes ``FractionArray`` so that importing this module does not
+    import NumPy.
+    """
+    if name == "FractionArray":
+        from fraction_array import FractionArray
+
+        return FractionArray
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@contextlib.contextmanager
+def normalization(
+    policy: str,
+    threshold: Optional[int] = None,
+) -> Iterator[None]:
+    """
+    Context manager that applies a normalization policy to a block of code.
+
+    Parameters
+    ----------
+    policy : str
+        Either ``EAGER`` or ``LAZY``.
+    threshold : int, optional
+        The lazy reduction threshold in bits.
+
+    Example
+    -------
+    >>> with normalization(LAZY, threshold=256):
+    ...     total = sum(terms, Fraction(0, 1))
+    """
+    previous = Fraction.set_normalization(policy, threshold)
+    try:
+        yield
+    finally:
+        Fraction.set_normalization(*previous)
+
+
+@contextlib.contextmanager
+def interning(
+    capacity: int = 4096,
+    max_part: int = 1024,
+) -> Iterator[InternPool]:
+    """
+    Context manager that shares small fractions through a fresh InternPool.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The maximum number of pooled fractions (default is 4096).
+    max_part : int, optional
+        The largest absolute numerator and denominator to pool
+        (default is 1024).
+
+    Yields
+    ------
+    InternPool
+        The installed pool, whose counters can be inspected afterwards.
+    """
+    pool = InternPool(capacity, max_part)
+    previous = Fraction.set_intern_pool(pool)
+    try:
+        yield pool
+    finally:
+        Fraction.set_intern_pool(previous)
+
+
+@contextlib.contextmanager
+def profiling() -> Iterator[Instrumentation]:
+    """
+    Context manager that records Fraction activity in a fresh
+    Instrumentation.
+
+    Yields
+    ------
+    Instrumentation
+        The installed recorder, whose counters can be inspected afterwards.
+
+    Example
+    -------
+    >>> with profiling() as stats:
+    ...     run_job()
+    >>> stats.stats()["result_bits"]
+    {'64': 1200, '128': 40}
+    """
+    instrumentation = Instrumentation()
+    previous = Fraction.set_instrumentation(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        Fraction.set_instrumentation(previous)
+
+
+@contextlib.contextmanager
+def memoizing(
+    capacity: int = 65536,
+    operators: Iterable[str] = OperationCache.OPERATORS,
+) -> Iterator[OperationCache]:
+    """
+    Context manager that memoizes arithmetic results in a fresh
+    OperationCache.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The maximum number of memoized results (default is 65536).
+    operators : iterable of str, optional
+        The operators to memoize (default is all of
+        ``OperationCache.OPERATORS``).
+
+    Yields
+    ------
+    OperationCache
+        The installed cache, whose counters can be inspected afterwards.
+    """
+    cache = OperationCache(capacity, operators)
+    previous = Fraction.set_operation_cache(cache)
+    try:
+        yield cache
+    finally:
+        Fraction.set_operation_cache(previous)
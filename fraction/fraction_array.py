@@ -0,0 +1,690 @@
+"""
+A NumPy-backed array of fractions.
+
+``FractionArray`` stores numerators and denominators as parallel ``int64``
+arrays so that arithmetic, comparisons and reductions run as vectorized
+NumPy operations instead of a Python loop over ``Fraction`` objects. Every
+result is reduced with ``np.gcd`` and keeps a positive denominator.
+
+When an intermediate value could overflow ``int64``, only the affected
+elements are recomputed with exact Python ints, and the array switches to
+``object`` dtype. It switches back to ``int64`` as soon as every reduced
+value fits again, so exactness never depends on the input sizes.
+
+NumPy is imported by this module only; ``import fraction`` does not pull it
+in until ``fraction.FractionArray`` is first used.
+"""
+
+from typing import Callable, Iterable, Iterator, Tuple, Union
+
+import numpy as np
+
+from fraction import Fraction
+
+#: Magnitude bound under which an int64 intermediate is trusted. The bound is
+#: estimated in float64, so it is kept well below 2**63 to absorb rounding.
+_SAFE_BOUND = float(2**62)
+_INT64_MAX = 2**63 - 1
+
+_Parts = Tuple[np.ndarray, np.ndarray]
+
+
+def _pack(
+    values: np.ndarray,
+) -> np.ndarray:
+    """
+    Converts an ``object`` array back to ``int64`` when every value fits.
+    """
+    if values.dtype != object:
+        return values
+    if all(-_INT64_MAX <= value <= _INT64_MAX for value in values.flat):
+        return values.astype(np.int64)
+    return values
+
+
+def _as_parts(
+    values: Union[Iterable[int], np.ndarray],
+) -> np.ndarray:
+    """
+    Converts a sequence of integers to an ``int64`` or ``object`` array.
+    """
+    array = np.asarray(values)
+    if array.size == 0:
+        return array.astype(np.int64)
+    if array.dtype == object:
+        if not all(isinstance(value, (int, np.integer)) for value in array.flat):
+            raise TypeError("FractionArray parts must be integers")
+        exact = np.array([int(value) for value in array.flat], dtype=object)
+        return _pack(exact.reshape(array.shape))
+    if array.dtype.kind == "u":
+        if array.size and array.max() > _INT64_MAX:
+            return array.astype(object)
+        return array.astype(np.int64)
+    if array.dtype.kind not in "ib":
+        raise TypeError("FractionArray parts must be integers")
+    array = array.astype(np.int64)
+    # -2**63 has no int64 negation, so it is kept out of the fast path.
+    if (array == -_INT64_MAX - 1).any():
+        return array.astype(object)
+    return array
+
+
+def _reduce(
+    numerators: np.ndarray,
+    denominators: np.ndarray,
+) -> _Parts:
+    """
+    Reduces every element to lowest terms with a positive denominator.
+    """
+    divisor = np.gcd(numerators, denominators)
+    divisor = np.where(denominators < 0, -divisor, divisor)
+    return _pack(numerators // divisor), _pack(denominators // divisor)
+
+
+def _add_kernel(a, b, c, d):
+    """a/b + c/d before reduction; on magnitudes, also bounds a/b - c/d."""
+    return a * d + c * b, b * d
+
+
+def _sub_kernel(a, b, c, d):
+    """a/b - c/d before reduction."""
+    return a * d - c * b, b * d
+
+
+def _mul_kernel(a, b, c, d):
+    """a/b * c/d before reduction."""
+    return a * c, b * d
+
+
+def _div_kernel(a, b, c, d):
+    """a/b / c/d before reduction; also the cross products for comparison."""
+    return a * d, b * c
+
+
+_Kernel = Callable[
+    [np.ndarray, np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, ...]
+]
+
+
+def _apply(
+    kernel: _Kernel,
+    bound: _Kernel,
+    a: np.ndarray,
+    b: np.ndarray,
+    c: np.ndarray,
+    d: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Evaluates ``kernel`` element-wise, in int64 where it cannot overflow.
+
+    ``bound`` is evaluated on the float64 magnitudes of the operands and must
+    bound the magnitude of each kernel output. Elements whose bound is too
+    large are recomputed with exact Python ints.
+    """
+    a, b, c, d = np.broadcast_arrays(a, b, c, d)
+    if all(part.dtype == np.int64 for part in (a, b, c, d)):
+        magnitudes = [np.abs(part.astype(np.float64)) for part in (a, b, c, d)]
+        safe = np.ones(a.shape, dtype=bool)
+        for estimate in bound(*magnitudes):
+            safe &= estimate < _SAFE_BOUND
+        if safe.all():
+            return kernel(a, b, c, d)
+    else:
+        safe = np.zeros(a.shape, dtype=bool)
+    unsafe = ~safe
+    results = (np.empty(a.shape, dtype=object), np.empty(a.shape, dtype=object))
+    exact = kernel(*(part[unsafe].astype(object) for part in (a, b, c, d)))
+    for result, value in zip(results, exact):
+        result[unsafe] = value
+    if safe.any():
+        fast = kernel(a[safe], b[safe], c[safe], d[safe])
+        for result, value in zip(results, fast):
+            result[safe] = value.astype(object)
+    return results
+
+
+class FractionArray:
+    """
+    A one-dimensional array of fractions backed by parallel integer arrays.
+
+    Attributes
+    ----------
+    numerators : numpy.ndarray
+        The reduced numerators (``int64``, or ``object`` for huge values).
+    denominators : numpy.ndarray
+        The reduced, positive denominators.
+
+    Methods
+    -------
+    __init__(self, numerators, denominators=None) -> None:
+        Constructs an array from parallel numerator and denominator sequences.
+
+    from_fractions(cls, fractions: Iterable[Fraction]) -> 'FractionArray':
+        Class method to build an array from Fraction objects.
+
+    __add__, __sub__, __mul__, __truediv__ (and reflected forms):
+        Element-wise arithmetic with arrays, Fractions and ints.
+
+    __eq__, __ne__, __lt__, __le__, __gt__, __ge__:
+        Element-wise exact comparisons returning boolean arrays.
+
+    sum(self) -> Fraction, prod(self) -> Fraction:
+        Exact reductions.
+
+    min(self) -> Fraction, max(self) -> Fraction:
+        Exact extrema.
+
+    to_float(self) -> numpy.ndarray:
+        Converts every element to float64.
+    """
+
+    __slots__ = ("_numerators", "_denominators")
+
+    # Makes NumPy scalars on the left, such as ``np.int64(2) + array``,
+    # defer to the reflected methods instead of broadcasting into an
+    # object ndarray.
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        numerators: Union[Iterable[int], np.ndarray],
+        denominators: Union[Iterable[int], np.ndarray, None] = None,
+    ) -> None:
+        """
+        Constructs a FractionArray and reduces every element.
+
+        Parameters
+        ----------
+        numerators : sequence of int
+            The numerators.
+        denominators : sequence of int, optional
+            The denominators (default is all ones).
+
+        Raises
+        ------
+        ValueError
+            If the parts differ in length or any denominator is zero.
+        TypeError
+            If the parts are not integers.
+        """
+        numerators = _as_parts(numerators).ravel()
+        if denominators is None:
+            denominators = np.ones(numerators.shape, dtype=np.int64)
+        else:
+            denominators = _as_parts(denominators).ravel()
+        if numerators.shape != denominators.shape:
+            raise ValueError("Numerators and denominators must have the same length")
+        if (denominators == 0).any():
+            raise ValueError("Denominator cannot be zero")
+        self._numerators, self._denominators = _reduce(numerators, denominators)
+
+    @classmethod
+    def _from_reduced(
+        cls,
+        numerators: np.ndarray,
+        denominators: np.ndarray,
+    ) -> "FractionArray":
+        """
+        Trusted internal constructor for parts that are already reduced.
+        """
+        result = object.__new__(cls)
+        result._numerators = numerators
+        result._denominators = denominators
+        return result
+
+    @classmethod
+    def from_fractions(
+        cls,
+        fractions: Iterable[Fraction],
+    ) -> "FractionArray":
+        """
+        Builds an array from Fraction objects or ints.
+
+        Parameters
+        ----------
+        fractions : iterable of Fraction or int
+            The values to store.
+
+        Returns
+        -------
+        FractionArray
+            The reduced array.
+        """
+        numerators = []
+        denominators = []
+        for value in fractions:
+            numerators.append(value.numerator)
+            denominators.append(value.denominator)
+        return cls(
+            np.array(numerators, dtype=object),
+            np.array(denominators, dtype=object),
+        )
+
+    @property
+    def numerators(
+        self,
+    ) -> np.ndarray:
+        """
+        The reduced numerators (read-only view).
+        """
+        view = self._numerators.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def denominators(
+        self,
+    ) -> np.ndarray:
+        """
+        The reduced, positive denominators (read-only view).
+        """
+        view = self._denominators.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def dtype(
+        self,
+    ) -> np.dtype:
+        """
+        ``int64`` while every part fits, ``object`` after an exact fallback.
+        """
+        if self._numerators.dtype == object or self._denominators.dtype == object:
+            return np.dtype(object)
+        return np.dtype(np.int64)
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of fractions in the array.
+        """
+        return len(self._numerators)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice, np.ndarray],
+    ) -> Union[Fraction, "FractionArray"]:
+        """
+        Returns a Fraction for an integer index, or a FractionArray otherwise.
+        """
+        numerators = self._numerators[index]
+        denominators = self._denominators[index]
+        if np.ndim(numerators) == 0:
+            return Fraction._from_reduced(int(numerators), int(denominators))
+        return FractionArray._from_reduced(numerators, denominators)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Fraction]:
+        """
+        Iterates over the elements as Fraction objects.
+        """
+        for numerator, denominator in zip(
+            self._numerators.tolist(), self._denominators.tolist()
+        ):
+            yield Fraction._from_reduced(numerator, denominator)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a string representation of the array for debugging purposes.
+        """
+        return "FractionArray([{}])".format(", ".join(str(value) for value in self))
+
+    def _operand(
+        self,
+        other: object,
+        symbol: str,
+    ) -> _Parts:
+        """
+        Returns the numerator and denominator arrays of an operand.
+        """
+        if isinstance(other, FractionArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Operands could not be broadcast together: {len(self)} and {len(other)}"
+                )
+            return other._numerators, other._denominators
+        if isinstance(other, Fraction):
+            numerator, denominator = other.as_integer_ratio()
+            return _as_parts([numerator]), _as_parts([denominator])
+        if isinstance(other, (int, np.integer)) and not isinstance(other, bool):
+            return _as_parts([int(other)]), np.ones(1, dtype=np.int64)
+        raise TypeError(
+            "Unsupported operand types for {}: 'FractionArray' and '{}'".format(
+                symbol, type(other).__name__
+            )
+        )
+
+    def _arithmetic(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        d: np.ndarray,
+        kernel: _Kernel,
+        bound: _Kernel,
+    ) -> "FractionArray":
+        """
+        Applies an arithmetic kernel and reduces the result.
+        """
+        numerators, denominators = _apply(kernel, bound, a, b, c, d)
+        if (denominators == 0).any():
+            raise ValueError("Denominator cannot be zero")
+        return FractionArray._from_reduced(*_reduce(numerators, denominators))
+
+    def __add__(
+        self,
+        other: Union["FractionArray", Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise addition.
+        """
+        c, d = self._operand(other, "+")
+        return self._arithmetic(
+            self._numerators, self._denominators, c, d, _add_kernel, _add_kernel
+        )
+
+    def __radd__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise addition (other + self).
+        """
+        return self.__add__(other)
+
+    def __sub__(
+        self,
+        other: Union["FractionArray", Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise subtraction.
+        """
+        c, d = self._operand(other, "-")
+        return self._arithmetic(
+            self._numerators, self._denominators, c, d, _sub_kernel, _add_kernel
+        )
+
+    def __rsub__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise subtraction (other - self).
+        """
+        a, b = self._operand(other, "-")
+        return self._arithmetic(
+            a, b, self._numerators, self._denominators, _sub_kernel, _add_kernel
+        )
+
+    def __mul__(
+        self,
+        other: Union["FractionArray", Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise multiplication.
+        """
+        c, d = self._operand(other, "*")
+        return self._arithmetic(
+            self._numerators, self._denominators, c, d, _mul_kernel, _mul_kernel
+        )
+
+    def __rmul__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise multiplication (other * self).
+        """
+        return self.__mul__(other)
+
+    def __truediv__(
+        self,
+        other: Union["FractionArray", Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise division.
+
+        Raises
+        ------
+        ValueError
+            If any divisor is zero.
+        """
+        c, d = self._operand(other, "/")
+        return self._arithmetic(
+            self._numerators, self._denominators, c, d, _div_kernel, _div_kernel
+        )
+
+    def __rtruediv__(
+        self,
+        other: Union[Fraction, int],
+    ) -> "FractionArray":
+        """
+        Element-wise division (other / self).
+        """
+        a, b = self._operand(other, "/")
+        return self._arithmetic(
+            a, b, self._numerators, self._denominators, _div_kernel, _div_kernel
+        )
+
+    def __neg__(
+        self,
+    ) -> "FractionArray":
+        """
+        Element-wise negation.
+        """
+        return FractionArray._from_reduced(-self._numerators, self._denominators)
+
+    def __abs__(
+        self,
+    ) -> "FractionArray":
+        """
+        Element-wise absolute value.
+        """
+        return FractionArray._from_reduced(abs(self._numerators), self._denominators)
+
+    def _cross(
+        self,
+        other: object,
+        symbol: str,
+    ) -> _Parts:
+        """
+        Returns ``(a * d, b * c)``; with positive denominators, comparing the
+        two products compares a/b with c/d.
+        """
+        c, d = self._operand(other, symbol)
+        return _apply(
+            _div_kernel, _div_kernel, self._numerators, self._denominators, c, d
+        )
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise equality; reduced parts make this a component check.
+
+        Unsupported operands return ``NotImplemented``, so Python falls back
+        to the other operand or to identity instead of raising.
+        """
+        try:
+            c, d = self._operand(other, "==")
+        except TypeError:
+            return NotImplemented
+        return np.asarray((self._numerators == c) & (self._denominators == d))
+
+    def __ne__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise inequality.
+        """
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return NotImplemented
+        return ~equal
+
+    def __lt__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise exact less-than.
+        """
+        left, right = self._cross(other, "<")
+        return np.asarray(left < right, dtype=bool)
+
+    def __le__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise exact less-than-or-equal.
+        """
+        left, right = self._cross(other, "<=")
+        return np.asarray(left <= right, dtype=bool)
+
+    def __gt__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise exact greater-than.
+        """
+        left, right = self._cross(other, ">")
+        return np.asarray(left > right, dtype=bool)
+
+    def __ge__(
+        self,
+        other: object,
+    ) -> np.ndarray:
+        """
+        Element-wise exact greater-than-or-equal.
+        """
+        left, right = self._cross(other, ">=")
+        return np.asarray(left >= right, dtype=bool)
+
+    __hash__ = None
+
+    def _tree_reduce(
+        self,
+        step: Callable[["FractionArray", "FractionArray"], "FractionArray"],
+        empty: Fraction,
+    ) -> Fraction:
+        """
+        Reduces the array pairwise, halving its length with each vectorized step.
+        """
+        if len(self) == 0:
+            return empty
+        current = self
+        while len(current) > 1:
+            half = len(current) // 2
+            combined = step(current[:half], current[half : 2 * half])
+            if len(current) % 2:
+                combined = FractionArray._from_reduced(
+                    np.concatenate([combined._numerators, current._numerators[-1:]]),
+                    np.concatenate([combined._denominators, current._denominators[-1:]]),
+                )
+            current = combined
+        return current[0]
+
+    def sum(
+        self,
+    ) -> Fraction:
+        """
+        Returns the exact sum of the elements.
+        """
+        return self._tree_reduce(FractionArray.__add__, Fraction(0, 1))
+
+    def prod(
+        self,
+    ) -> Fraction:
+        """
+        Returns the exact product of the elements.
+        """
+        return self._tree_reduce(FractionArray.__mul__, Fraction(1, 1))
+
+    def _select(
+        self,
+        pick_left: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        left: "FractionArray",
+        right: "FractionArray",
+    ) -> "FractionArray":
+        """
+        Keeps, element-wise, the operand chosen by ``pick_left``.
+        """
+        mask = pick_left(left, right)
+        return FractionArray._from_reduced(
+            _pack(np.where(mask, left._numerators, right._numerators)),
+            _pack(np.where(mask, left._denominators, right._denominators)),
+        )
+
+    def min(
+        self,
+    ) -> Fraction:
+        """
+        Returns the smallest element.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        """
+        if len(self) == 0:
+            raise ValueError("min() of an empty FractionArray")
+        return self._tree_reduce(
+            lambda x, y: self._select(FractionArray.__le__, x, y), None
+        )
+
+    def max(
+        self,
+    ) -> Fraction:
+        """
+        Returns the largest element.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        """
+        if len(self) == 0:
+            raise ValueError("max() of an empty FractionArray")
+        return self._tree_reduce(
+            lambda x, y: self._select(FractionArray.__ge__, x, y), None
+        )
+
+    def to_float(
+        self,
+    ) -> np.ndarray:
+        """
+        Converts every element to float64.
+
+        Returns
+        -------
+        numpy.ndarray
+            A float64 array. Elements stored as exact Python ints use
+            correctly rounded integer division.
+        """
+        if self.dtype == object:
+            return np.array(
+                [
+                    numerator / denominator
+                    for numerator, denominator in zip(
+                        self._numerators.tolist(), self._denominators.tolist()
+                    )
+                ],
+                dtype=np.float64,
+            )
+        return self._numerators / self._denominators
+
+    def to_fractions(
+        self,
+    ) -> list:
+        """
+        Returns the elements as a list of Fraction objects.
+        """
+        return list(self)
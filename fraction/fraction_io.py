@@ -0,0 +1,611 @@
+"""
+Bulk text and binary input and output for fractions.
+
+The readers take one literal per line, in any form accepted by
+``Fraction.from_string``, and skip blank lines. Input is consumed in chunks
+of ``chunk_size`` bytes, through ``mmap`` when the source is a regular file,
+so memory use does not grow with the file size.
+
+The writer formats a whole chunk of values with a single ``%`` operation on
+a template assembled from shared pieces, so no intermediate string is built
+per value. Its output matches ``str()`` of each value, one per line.
+
+The binary encoding is a sequence of blocks, so encoded buffers can simply
+be concatenated. Each block is a tag byte, a varint element count and a
+payload:
+
+- ``FIXED`` blocks hold pairs of little-endian signed 64-bit integers, one
+  numerator and one denominator per element. They are written for runs of
+  values whose parts both fit, and are read and written as a whole with
+  ``memoryview.cast`` and ``array``.
+- ``VARIABLE`` blocks hold, per element, a varint ``length << 1 | sign``
+  followed by the numerator magnitude, then a varint length followed by the
+  denominator, both as little-endian bytes.
+
+Varints are unsigned LEB128. Decoding reads straight from the buffer
+through a ``memoryview``, without copying per element, and accepts any
+buffer such as ``bytes``, ``bytearray``, ``memoryview`` or ``mmap``.
+
+Example
+-------
+>>> import fraction_io
+>>> fraction_io.write_fractions([Fraction(1, 3), 2], "values.txt")
+2
+>>> list(fraction_io.iter_fractions("values.txt"))
+[1/3, 2]
+"""
+
+import array
+import io
+import itertools
+import math
+import mmap
+import operator
+import os
+import re
+import sys
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from fraction import Fraction, _parse_fraction
+
+#: Number of bytes read per chunk by the readers.
+DEFAULT_CHUNK_SIZE = 1 << 20
+#: Number of values formatted per write by the writer.
+DEFAULT_BATCH_SIZE = 1 << 14
+
+Source = Union[str, os.PathLike, IO]
+
+#: Tag of a binary block of 64-bit numerator and denominator pairs.
+FIXED = 0x01
+#: Tag of a binary block of length-prefixed numerators and denominators.
+VARIABLE = 0x02
+
+_INT64_LIMIT = 2**63
+_BIG_ENDIAN = sys.byteorder == "big"
+
+#: Matches a block of lines in the canonical ``str()`` format.
+_CANONICAL_BLOCK = re.compile(
+    r"(?:-?[0-9]+(?:/[1-9][0-9]*)?\n)*(?:-?[0-9]+(?:/[1-9][0-9]*)?)?\Z"
+)
+
+
+def _read_chunks(
+    stream: IO,
+    chunk_size: int,
+) -> Iterator[Union[bytes, str]]:
+    """
+    Yields successive chunks of a stream, mapping regular files into memory
+    when the platform allows it.
+    """
+    try:
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        # Pipes, sockets, in-memory and empty files cannot be mapped.
+        mapped = None
+    if mapped is None:
+        read = stream.read
+        chunk = read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = read(chunk_size)
+        return
+    with mapped:
+        for start in range(stream.tell(), len(mapped), chunk_size):
+            yield mapped[start:start + chunk_size]
+
+
+def _iter_blocks(
+    source: Source,
+    chunk_size: int,
+) -> Iterator[str]:
+    """
+    Yields the text of ``source`` in blocks of complete lines.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be at least 1")
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from _iter_blocks(stream, chunk_size)
+        return
+    tail = ""
+    for chunk in _read_chunks(source, chunk_size):
+        if not isinstance(chunk, str):
+            chunk = chunk.decode("ascii")
+        block = tail + chunk
+        end = block.rfind("\n") + 1
+        if end:
+            yield block[:end]
+            tail = block[end:]
+        else:
+            tail = block
+    if tail:
+        yield tail
+
+
+def _iter_parts(
+    source: Source,
+    chunk_size: int,
+) -> Iterator[Tuple[List[int], List[int]]]:
+    """
+    Yields the parsed numerators and denominators of each block of lines.
+
+    Blocks written in the canonical ``str()`` format, as produced by
+    ``write_fractions``, are validated by a single regular expression match
+    and then split with ``int()`` alone; other blocks are parsed line by
+    line with the full literal grammar.
+
+    Raises
+    ------
+    ValueError
+        If a line is not a valid literal; the message gives its line number.
+    """
+    number = 0
+    gcd = math.gcd
+    for block in _iter_blocks(source, chunk_size):
+        lines = block.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        numerators = []
+        denominators = []
+        add_numerator = numerators.append
+        add_denominator = denominators.append
+        if _CANONICAL_BLOCK.match(block):
+            for line in lines:
+                numerator, _, denominator = line.partition("/")
+                numerator = int(numerator)
+                if denominator:
+                    denominator = int(denominator)
+                    divisor = gcd(numerator, denominator)
+                    if divisor != 1:
+                        numerator //= divisor
+                        denominator //= divisor
+                else:
+                    denominator = 1
+                add_numerator(numerator)
+                add_denominator(denominator)
+            number += len(lines)
+            yield numerators, denominators
+            continue
+        for line in lines:
+            number += 1
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                numerator, denominator = _parse_fraction(text)
+            except ValueError as error:
+                raise ValueError(f"Line {number}: {error}") from None
+            add_numerator(numerator)
+            add_denominator(denominator)
+        yield numerators, denominators
+
+
+def iter_fractions(
+    source: Source,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Fraction]:
+    """
+    Lazily parses one fraction per line.
+
+    Parameters
+    ----------
+    source : str, path-like or file object
+        A path, or a binary or text file object open for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time.
+
+    Yields
+    ------
+    Fraction
+        The parsed values, in lowest terms.
+
+    Raises
+    ------
+    ValueError
+        If a line is not a valid literal.
+    """
+    from_reduced = Fraction._from_reduced
+    for numerators, denominators in _iter_parts(source, chunk_size):
+        yield from map(from_reduced, numerators, denominators)
+
+
+def read_parts(
+    source: Source,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[List[int], List[int]]:
+    """
+    Parses one fraction per line into parallel lists of reduced parts,
+    without creating Fraction objects.
+
+    Parameters
+    ----------
+    source : str, path-like or file object
+        A path, or a binary or text file object open for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time.
+
+    Returns
+    -------
+    tuple
+        The ``(numerators, denominators)`` lists.
+    """
+    numerators = []
+    denominators = []
+    for chunk_numerators, chunk_denominators in _iter_parts(source, chunk_size):
+        numerators += chunk_numerators
+        denominators += chunk_denominators
+    return numerators, denominators
+
+
+def read_array(
+    source: Source,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "FractionArray":
+    """
+    Parses one fraction per line into a ``FractionArray``.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+    source : str, path-like or file object
+        A path, or a binary or text file object open for reading.
+    chunk_size : int, optional
+        The number of bytes read at a time.
+
+    Returns
+    -------
+    FractionArray
+        The parsed values.
+    """
+    from fraction_array import FractionArray
+
+    return FractionArray(*read_parts(source, chunk_size))
+
+
+def _format_batch(
+    values: List[Union[Fraction, int]],
+) -> str:
+    """
+    Formats a batch of values, one per line, with a single ``%`` operation.
+    """
+    pieces = []
+    arguments = []
+    add_piece = pieces.append
+    add_argument = arguments.append
+    for value in values:
+        try:
+            if not value._normalized:
+                value._settle()
+            numerator = value._numerator
+            denominator = value._denominator
+        except AttributeError:
+            numerator = operator.index(value)
+            denominator = 1
+        if denominator < 0:
+            numerator = -numerator
+            denominator = -denominator
+        add_argument(numerator)
+        if denominator == 1 or numerator == 0:
+            add_piece("%d\n")
+        else:
+            add_piece("%d/%d\n")
+            add_argument(denominator)
+    return "".join(pieces) % tuple(arguments)
+
+
+def write_fractions(
+    values: Iterable[Union[Fraction, int]],
+    target: Union[str, os.PathLike, IO],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Writes one value per line, as ``numerator/denominator`` or as a plain
+    integer when the denominator is one or the numerator is zero.
+
+    The sign is always written on the numerator, over a positive
+    denominator, so ``Fraction(1, -2)`` is written as ``-1/2`` where
+    ``str()`` gives ``1/-2``. Values are not reduced under ``EAGER``:
+    ``Fraction(-2, -4)`` is written as ``2/4``. Under ``LAZY`` a deferred
+    reduction is done first.
+
+    Parameters
+    ----------
+    values : iterable of Fraction or int
+        The values to write.
+    target : str, path-like or file object
+        A path, which is overwritten, or a binary or text file object open
+        for writing.
+    batch_size : int, optional
+        The number of values formatted per write.
+
+    Returns
+    -------
+    int
+        The number of values written.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size should be at least 1")
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="ascii", newline="\n") as stream:
+            return write_fractions(values, stream, batch_size)
+    binary = not isinstance(target, io.TextIOBase)
+    write = target.write
+    count = 0
+    values = iter(values)
+    while True:
+        batch = [value for _, value in zip(range(batch_size), values)]
+        if not batch:
+            return count
+        text = _format_batch(batch)
+        write(text.encode("ascii") if binary else text)
+        count += len(batch)
+
+
+def _write_varint(
+    buffer: bytearray,
+    value: int,
+) -> None:
+    """
+    Appends an unsigned LEB128 varint.
+    """
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(
+    view: memoryview,
+    position: int,
+) -> Tuple[int, int]:
+    """
+    Returns an unsigned LEB128 varint and the position after it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = view[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+_get_parts = operator.attrgetter("_numerator", "_denominator")
+_get_normalized = operator.attrgetter("_normalized")
+
+
+def _fixed_words(
+    values: List[Union[Fraction, int]],
+) -> Optional[array.array]:
+    """
+    Returns the interleaved parts of the values as 64-bit words, or None
+    unless every value is a reduced Fraction whose parts fit.
+
+    The words are gathered with C-level attribute getters, and the array
+    constructor doubles as the range check.
+    """
+    try:
+        if all(map(_get_normalized, values)):
+            return array.array("q", list(itertools.chain.from_iterable(map(_get_parts, values))))
+    except (AttributeError, OverflowError):
+        pass
+    return None
+
+
+def _binary_parts(
+    values: Iterable[Union[Fraction, int]],
+) -> Tuple[List[int], List[int]]:
+    """
+    Returns the parts of each value with the sign on the numerator.
+    """
+    numerators = []
+    denominators = []
+    for value in values:
+        try:
+            if not value._normalized:
+                value._settle()
+            numerator = value._numerator
+            denominator = value._denominator
+        except AttributeError:
+            numerator = operator.index(value)
+            denominator = 1
+        if denominator < 0:
+            numerator = -numerator
+            denominator = -denominator
+        numerators.append(numerator)
+        denominators.append(denominator)
+    return numerators, denominators
+
+
+def encode_fractions(
+    values: Iterable[Union[Fraction, int]],
+    buffer: Optional[bytearray] = None,
+) -> bytearray:
+    """
+    Encodes values in the binary format.
+
+    Parameters
+    ----------
+    values : iterable of Fraction or int
+        The values to encode.
+    buffer : bytearray, optional
+        The buffer to append to; a new one is created when omitted.
+
+    Returns
+    -------
+    bytearray
+        The buffer holding the encoded values.
+
+    Example
+    -------
+    >>> data = encode_fractions([Fraction(1, 3), 2])
+    >>> decode_fractions(data)
+    [1/3, 2]
+    """
+    if buffer is None:
+        buffer = bytearray()
+    values = values if isinstance(values, list) else list(values)
+    if not values:
+        return buffer
+    words = _fixed_words(values)
+    if words is not None:
+        buffer.append(FIXED)
+        _write_varint(buffer, len(values))
+        if _BIG_ENDIAN:
+            words.byteswap()
+        buffer += words
+        return buffer
+    numerators, denominators = _binary_parts(values)
+    limit = _INT64_LIMIT
+    fits = [
+        -limit <= numerator < limit and denominator < limit
+        for numerator, denominator in zip(numerators, denominators)
+    ]
+    start = 0
+    for fixed, run in itertools.groupby(fits):
+        count = sum(1 for _ in run)
+        stop = start + count
+        buffer.append(FIXED if fixed else VARIABLE)
+        _write_varint(buffer, count)
+        if fixed:
+            pairs = [0] * (2 * count)
+            pairs[0::2] = numerators[start:stop]
+            pairs[1::2] = denominators[start:stop]
+            words = array.array("q", pairs)
+            if _BIG_ENDIAN:
+                words.byteswap()
+            buffer += words
+        else:
+            append = buffer.append
+            for index in range(start, stop):
+                numerator = numerators[index]
+                magnitude = -numerator if numerator < 0 else numerator
+                size = (magnitude.bit_length() + 7) >> 3
+                header = size << 1 | (numerator < 0)
+                if header < 0x80:
+                    append(header)
+                else:
+                    _write_varint(buffer, header)
+                buffer += magnitude.to_bytes(size, "little")
+                denominator = denominators[index]
+                size = (denominator.bit_length() + 7) >> 3
+                if size < 0x80:
+                    append(size)
+                else:
+                    _write_varint(buffer, size)
+                buffer += denominator.to_bytes(size, "little")
+        start = stop
+    return buffer
+
+
+def decode_parts(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> Tuple[List[int], List[int]]:
+    """
+    Decodes a binary buffer into parallel lists of reduced parts, without
+    creating Fraction objects.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The encoded values.
+
+    Returns
+    -------
+    tuple
+        The ``(numerators, denominators)`` lists.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is truncated or malformed, or holds a zero denominator.
+    """
+    view = memoryview(buffer).cast("B")
+    end = len(view)
+    position = 0
+    numerators = []
+    denominators = []
+    from_bytes = int.from_bytes
+    try:
+        while position < end:
+            tag = view[position]
+            if tag != FIXED and tag != VARIABLE:
+                raise ValueError(f"Unknown block tag {tag:#04x} at offset {position}")
+            count, position = _read_varint(view, position + 1)
+            if tag == FIXED:
+                stop = position + 16 * count
+                if stop > end:
+                    raise IndexError
+                if _BIG_ENDIAN:
+                    words = array.array("q", view[position:stop])
+                    words.byteswap()
+                    pairs = words.tolist()
+                else:
+                    pairs = view[position:stop].cast("q").tolist()
+                numerators += pairs[0::2]
+                denominators += pairs[1::2]
+                position = stop
+            elif tag == VARIABLE:
+                add_numerator = numerators.append
+                add_denominator = denominators.append
+                for _ in range(count):
+                    header = view[position]
+                    if header < 0x80:
+                        position += 1
+                    else:
+                        header, position = _read_varint(view, position)
+                    stop = position + (header >> 1)
+                    if stop > end:
+                        raise IndexError
+                    numerator = from_bytes(view[position:stop], "little")
+                    add_numerator(-numerator if header & 1 else numerator)
+                    size = view[stop]
+                    if size < 0x80:
+                        position = stop + 1
+                    else:
+                        size, position = _read_varint(view, stop)
+                    stop = position + size
+                    if stop > end:
+                        raise IndexError
+                    add_denominator(from_bytes(view[position:stop], "little"))
+                    position = stop
+    except IndexError:
+        raise ValueError("Truncated fraction buffer") from None
+    if denominators and min(denominators) <= 0:
+        if min(denominators) == 0:
+            raise ValueError("Denominator cannot be zero")
+        raise ValueError("Negative denominator in fraction buffer")
+    divisors = list(map(math.gcd, numerators, denominators))
+    if divisors.count(1) != len(divisors):
+        for index, divisor in enumerate(divisors):
+            if divisor != 1:
+                numerators[index] //= divisor
+                denominators[index] //= divisor
+    return numerators, denominators
+
+
+def decode_fractions(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> List[Fraction]:
+    """
+    Decodes a binary buffer into Fractions.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The encoded values.
+
+    Returns
+    -------
+    list of Fraction
+        The decoded values, in lowest terms.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is truncated or malformed, or holds a zero denominator.
+    """
+    return list(map(Fraction._from_reduced, *decode_parts(buffer)))
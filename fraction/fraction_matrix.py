@@ -0,0 +1,495 @@
+"""
+Exact linear algebra on fraction matrices.
+
+``FractionMatrix`` stores each row as integers over one shared row
+denominator, the lcm of the row's entry denominators. Determinant, rank,
+inverse and solve then run Bareiss' fraction-free elimination on the
+integer rows: every update ``(p * a_ij - a_ik * a_kj) // previous_pivot``
+divides exactly, entries grow only linearly with the elimination step, and
+no gcd is taken until the final results are built.
+
+Scaling row ``i`` by ``s_i`` multiplies the determinant by ``s_i`` and
+leaves the inverse equal to ``(S A)^-1 S``, so the integer results convert
+back with one division per entry.
+
+The elimination of a square matrix is kept on the (immutable) matrix as a
+fraction-free LU factorization: the row swaps, the pivots, the multipliers
+of each step and the final upper triangle. ``solve`` replays the recorded
+steps on a right-hand side and back-substitutes for ``det * x``, which is
+integral by Cramer's rule, so each further right-hand side costs
+``O(n**2)`` integer operations instead of a new elimination. ``inverse``
+solves for the unit vectors with the same factorization.
+
+Example
+-------
+>>> from fraction_matrix import FractionMatrix
+>>> a = FractionMatrix([[Fraction(1, 2), 1], [Fraction(1, 3), 2]])
+>>> a.determinant()
+2/3
+>>> a.solve([1, 1])
+[3/2, 1/4]
+"""
+
+import math
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+from fraction import Fraction, _parts, _scale_row
+
+Number = Union[Fraction, int]
+
+
+def _reduce_row(
+    values: List[int],
+    denominator: int,
+) -> Tuple[List[int], int]:
+    """
+    Divides a row of integers over a common denominator by their gcd, with
+    one multi-argument gcd for the whole row, and makes the denominator
+    positive.
+    """
+    divisor = math.gcd(denominator, *values)
+    if denominator < 0:
+        divisor = -divisor
+    if divisor == 1:
+        return values, denominator
+    return [value // divisor for value in values], denominator // divisor
+
+
+_Step = Tuple[int, int, List[int]]
+
+
+def _bareiss(
+    rows: List[List[int]],
+    columns: int,
+) -> Tuple[int, int, List[_Step]]:
+    """
+    Runs fraction-free forward elimination in place on the first
+    ``columns`` columns.
+
+    Returns
+    -------
+    tuple
+        The rank; for a square matrix its determinant (0 when singular);
+        and per pivot the row swapped into place, the pivot and the
+        multipliers of the rows below, which ``_replay`` applies to a
+        right-hand side.
+    """
+    count = len(rows)
+    previous = 1
+    sign = 1
+    rank = 0
+    steps = []
+    for k in range(columns):
+        pivot_row = next((i for i in range(rank, count) if rows[i][k]), None)
+        if pivot_row is None:
+            continue
+        if pivot_row != rank:
+            rows[rank], rows[pivot_row] = rows[pivot_row], rows[rank]
+            sign = -sign
+        pivot_line = rows[rank]
+        pivot = pivot_line[k]
+        multipliers = []
+        for i in range(rank + 1, count):
+            row = rows[i]
+            factor = row[k]
+            multipliers.append(factor)
+            if factor:
+                for j in range(k + 1, columns):
+                    row[j] = (pivot * row[j] - factor * pivot_line[j]) // previous
+            elif pivot != previous:
+                for j in range(k + 1, columns):
+                    row[j] = pivot * row[j] // previous
+            row[k] = 0
+        steps.append((pivot_row, pivot, multipliers))
+        previous = pivot
+        rank += 1
+        if rank == count:
+            break
+    determinant = sign * previous if rank == count == columns else 0
+    return rank, determinant, steps
+
+
+def _replay(
+    steps: List[_Step],
+    vector: List[int],
+) -> None:
+    """
+    Applies the recorded elimination steps of a square matrix to an integer
+    right-hand side, in place.
+    """
+    previous = 1
+    for k, (pivot_row, pivot, multipliers) in enumerate(steps):
+        if pivot_row != k:
+            vector[k], vector[pivot_row] = vector[pivot_row], vector[k]
+        head = vector[k]
+        for i, factor in enumerate(multipliers, k + 1):
+            vector[i] = (pivot * vector[i] - factor * head) // previous
+        previous = pivot
+
+
+def _back_substitute(
+    upper: List[List[int]],
+    vector: List[int],
+) -> List[int]:
+    """
+    Returns ``y = d * x`` for the upper triangular system ``upper @ x ==
+    vector``, where ``d`` is the last pivot; every division is exact
+    because ``y`` is integral.
+    """
+    size = len(upper)
+    scale = upper[-1][-1]
+    solution = [0] * size
+    for i in reversed(range(size)):
+        row = upper[i]
+        total = scale * vector[i]
+        for j in range(i + 1, size):
+            total -= row[j] * solution[j]
+        solution[i] = total // row[i]
+    return solution
+
+
+class FractionMatrix:
+    """
+    An immutable matrix of fractions stored as integer rows over per-row
+    denominators.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        The number of rows and columns.
+
+    Methods
+    -------
+    identity(cls, size: int) -> 'FractionMatrix':
+        Class method to build an identity matrix.
+
+    __getitem__(self, index: tuple) -> Fraction:
+        Returns the entry at ``(row, column)``.
+
+    __matmul__(self, other) -> 'FractionMatrix' or list:
+        Multiplies by a matrix or a vector.
+
+    determinant(self) -> Fraction:
+        Returns the determinant of a square matrix.
+
+    rank(self) -> int:
+        Returns the rank.
+
+    inverse(self) -> 'FractionMatrix':
+        Returns the inverse of a square, non-singular matrix.
+
+    solve(self, rhs) -> list or 'FractionMatrix':
+        Solves ``self @ x == rhs`` for a vector or a matrix of right-hand sides.
+    """
+
+    __slots__ = ("_rows", "_scales", "_columns", "_factorization")
+
+    def __init__(
+        self,
+        rows: Iterable[Iterable[Number]],
+    ) -> None:
+        """
+        Constructs a matrix from rows of Fractions and ints.
+
+        Parameters
+        ----------
+        rows : iterable of iterables of Fraction or int
+            The rows, which must all have the same length.
+
+        Raises
+        ------
+        ValueError
+            If the rows have different lengths.
+        """
+        scaled = [_scale_row(row, "Matrix entries") for row in rows]
+        columns = len(scaled[0][0]) if scaled else 0
+        if any(len(row) != columns for row, _ in scaled):
+            raise ValueError("Matrix rows must all have the same length")
+        self._rows = [row for row, _ in scaled]
+        self._scales = [scale for _, scale in scaled]
+        self._columns = columns
+        self._factorization = None
+
+    @classmethod
+    def _from_scaled(
+        cls,
+        rows: List[List[int]],
+        scales: List[int],
+        columns: int,
+    ) -> "FractionMatrix":
+        """
+        Trusted internal constructor for integer rows over positive scales.
+        """
+        result = object.__new__(cls)
+        result._rows = rows
+        result._scales = scales
+        result._columns = columns
+        result._factorization = None
+        return result
+
+    @classmethod
+    def identity(
+        cls,
+        size: int,
+    ) -> "FractionMatrix":
+        """
+        Returns the ``size`` by ``size`` identity matrix.
+        """
+        rows = [[int(i == j) for j in range(size)] for i in range(size)]
+        return cls._from_scaled(rows, [1] * size, size)
+
+    @property
+    def shape(
+        self,
+    ) -> Tuple[int, int]:
+        """
+        The number of rows and columns.
+        """
+        return len(self._rows), self._columns
+
+    def __getitem__(
+        self,
+        index: Tuple[int, int],
+    ) -> Fraction:
+        """
+        Returns the entry at ``(row, column)``, in lowest terms.
+        """
+        i, j = index
+        return Fraction(self._rows[i][j], self._scales[i], True)
+
+    def __iter__(
+        self,
+    ) -> Iterator[List[Fraction]]:
+        """
+        Iterates over the rows as lists of Fractions.
+        """
+        for row, scale in zip(self._rows, self._scales):
+            yield [Fraction(value, scale, True) for value in row]
+
+    def to_lists(
+        self,
+    ) -> List[List[Fraction]]:
+        """
+        Returns the entries as a list of rows of Fractions.
+        """
+        return list(self)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a string representation of the matrix for debugging purposes.
+        """
+        rows = ", ".join("[" + ", ".join(map(str, row)) + "]" for row in self)
+        return f"FractionMatrix([{rows}])"
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks if two matrices have the same shape and entries.
+        """
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            return False
+        return all(
+            a * t == b * s
+            for row, s, other_row, t in zip(self._rows, self._scales, other._rows, other._scales)
+            for a, b in zip(row, other_row)
+        )
+
+    __hash__ = None
+
+    def _require_square(
+        self,
+    ) -> int:
+        """
+        Returns the size of a square matrix.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square.
+        """
+        size, columns = self.shape
+        if size != columns:
+            raise ValueError(f"Expected a square matrix, not {size}x{columns}")
+        return size
+
+    def __matmul__(
+        self,
+        other: Union["FractionMatrix", Sequence[Number]],
+    ) -> Union["FractionMatrix", List[Fraction]]:
+        """
+        Multiplies by a matrix, or by a vector given as a sequence.
+
+        The columns of ``other`` are brought to a common denominator per
+        row of ``other``, so each product entry is an integer dot product
+        followed by a single reduction.
+
+        Raises
+        ------
+        ValueError
+            If the shapes do not match.
+        """
+        if isinstance(other, FractionMatrix):
+            if self._columns != len(other._rows):
+                raise ValueError(f"Cannot multiply {self.shape} by {other.shape}")
+            # Row k of other is other._rows[k] / other._scales[k]; fold that
+            # scale into column k of self.
+            denominator = math.lcm(*other._scales) if other._scales else 1
+            factors = [denominator // scale for scale in other._scales]
+            columns = list(zip(*other._rows)) if other._rows else [()] * other._columns
+            rows = []
+            scales = []
+            for row, scale in zip(self._rows, self._scales):
+                weighted = [value * factor for value, factor in zip(row, factors)]
+                row, scale = _reduce_row(
+                    [sum(map(int.__mul__, weighted, column)) for column in columns],
+                    scale * denominator,
+                )
+                rows.append(row)
+                scales.append(scale)
+            return FractionMatrix._from_scaled(rows, scales, other._columns)
+        vector, scale = _scale_row(other, "Matrix entries")
+        if self._columns != len(vector):
+            raise ValueError(f"Cannot multiply {self.shape} by a vector of length {len(vector)}")
+        return [
+            Fraction(sum(map(int.__mul__, row, vector)), row_scale * scale, True)
+            for row, row_scale in zip(self._rows, self._scales)
+        ]
+
+    def determinant(
+        self,
+    ) -> Fraction:
+        """
+        Returns the determinant, by fraction-free elimination.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square.
+        """
+        return Fraction(self._factor()[0], math.prod(self._scales), True)
+
+    def rank(
+        self,
+    ) -> int:
+        """
+        Returns the rank, by fraction-free elimination.
+        """
+        if len(self._rows) == self._columns:
+            return self._factor()[1]
+        return _bareiss([row[:] for row in self._rows], self._columns)[0]
+
+    def _factor(
+        self,
+    ) -> Tuple[int, int, List[_Step], List[List[int]]]:
+        """
+        Returns the cached elimination of the integer-scaled rows: the
+        determinant, the rank, the recorded steps and the upper triangle.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square.
+        """
+        if self._factorization is None:
+            self._require_square()
+            upper = [row[:] for row in self._rows]
+            rank, determinant, steps = _bareiss(upper, self._columns)
+            self._factorization = (determinant, rank, steps, upper)
+        return self._factorization
+
+    def _solve_scaled(
+        self,
+        vector: List[int],
+    ) -> Tuple[List[int], int]:
+        """
+        Returns ``y`` and ``d`` with ``(S A) @ (y / d) == vector``.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is singular.
+        """
+        determinant, rank, steps, upper = self._factor()
+        if not determinant:
+            raise ValueError("Matrix is singular")
+        _replay(steps, vector)
+        return _back_substitute(upper, vector), upper[-1][-1]
+
+    def inverse(
+        self,
+    ) -> "FractionMatrix":
+        """
+        Returns the inverse matrix.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square or is singular.
+        """
+        size = self._require_square()
+        # A^-1 = (S A)^-1 S: column j is the solution for s_j times the
+        # j-th unit vector.
+        columns = []
+        for j, scale in enumerate(self._scales):
+            unit = [0] * size
+            unit[j] = scale
+            solution, pivot = self._solve_scaled(unit)
+            columns.append(solution)
+        rows = []
+        scales = []
+        for row in zip(*columns):
+            row, scale = _reduce_row(list(row), pivot)
+            rows.append(row)
+            scales.append(scale)
+        return FractionMatrix._from_scaled(rows, scales, size)
+
+    def solve(
+        self,
+        rhs: Union[Sequence[Number], "FractionMatrix"],
+    ) -> Union[List[Fraction], "FractionMatrix"]:
+        """
+        Solves ``self @ x == rhs`` exactly.
+
+        The factorization is computed on the first call and reused, so
+        later right-hand sides cost one integer matrix-vector product each.
+
+        Parameters
+        ----------
+        rhs : sequence of Fraction or int, or FractionMatrix
+            One right-hand side, or one per column of a matrix.
+
+        Returns
+        -------
+        list of Fraction or FractionMatrix
+            The solution, shaped like ``rhs``.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square or is singular, or the shapes do
+            not match.
+        """
+        if isinstance(rhs, FractionMatrix):
+            if len(rhs._rows) != len(self._rows):
+                raise ValueError(f"Cannot solve {self.shape} for {rhs.shape}")
+            return FractionMatrix(zip(*(self.solve(column) for column in zip(*rhs))))
+        size = self._require_square()
+        if len(rhs) != size:
+            raise ValueError(f"Expected a right-hand side of length {size}, not {len(rhs)}")
+        # x = (S A)^-1 (S b); bring S b to one common denominator.
+        parts = [_parts(value, "Matrix entries") for value in rhs]
+        scaled = [
+            (numerator * scale, denominator)
+            for (numerator, denominator), scale in zip(parts, self._scales)
+        ]
+        common = math.lcm(*(denominator for _, denominator in scaled))
+        vector = [numerator * (common // denominator) for numerator, denominator in scaled]
+        solution, pivot = self._solve_scaled(vector)
+        denominator = pivot * common
+        return [Fraction(value, denominator, True) for value in solution]
@@ -0,0 +1,483 @@
+"""
+Exact polynomials with fraction coefficients.
+
+``FractionPolynomial`` stores its coefficients as integers over one shared
+denominator, so ``p(x) = (c_0 + c_1 x + ... + c_n x**n) / D`` with every
+``c_i`` an int. Arithmetic works on the integer coefficients and reduces
+once per result, with a single multi-argument gcd, instead of reducing
+every coefficient after every operation:
+
+- Evaluation at ``x = p/q`` runs Horner's rule on the homogenised integer
+  polynomial ``sum(c_i p**i q**(n-i))`` and divides by ``q**n D`` once at
+  the end. ``evaluate_many`` shares the table of powers of ``q`` between
+  all points with the same denominator, and integer points skip it.
+- Multiplication of long polynomials uses Kronecker substitution: both
+  integer coefficient lists are packed into one big int each, with slots
+  wide enough that no product coefficient can overflow into the next, and
+  a single big-int multiplication (Karatsuba in CPython) yields every
+  product coefficient. Packing and unpacking go through ``bytes``, so they
+  stay linear in the size of the result.
+
+Example
+-------
+>>> from fraction_polynomial import FractionPolynomial
+>>> p = FractionPolynomial([Fraction(1, 2), 0, Fraction(1, 3)])
+>>> p(3)
+7/2
+>>> p * p
+FractionPolynomial([1/4, 0, 1/3, 0, 1/9])
+"""
+
+import math
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from fraction import Fraction, _parts
+
+Number = Union[Fraction, int]
+
+#: Shortest operand, in terms, multiplied by Kronecker substitution.
+KRONECKER_THRESHOLD = 16
+
+
+def _pack(
+    values: Sequence[int],
+    width: int,
+) -> int:
+    """
+    Returns ``sum(v * 256**(width * i))`` for non-negative ``values`` that
+    fit in ``width`` bytes each.
+    """
+    return int.from_bytes(b"".join(value.to_bytes(width, "little") for value in values), "little")
+
+
+def _pack_signed(
+    values: Sequence[int],
+    width: int,
+) -> int:
+    """
+    Returns ``sum(v * 256**(width * i))`` for values of either sign, as the
+    difference of the packed positive and negative parts.
+    """
+    positive = _pack([value if value > 0 else 0 for value in values], width)
+    negative = _pack([-value if value < 0 else 0 for value in values], width)
+    return positive - negative
+
+
+def _kronecker(
+    a: Sequence[int],
+    b: Sequence[int],
+) -> List[int]:
+    """
+    Returns the coefficients of the product of two integer polynomials with
+    one big-int multiplication.
+
+    Every product coefficient is bounded by ``min(len) * max|a| * max|b|``;
+    slots one sign bit wider than that keep the packed coefficients apart.
+    The product has signed digits, so a constant half-slot offset is added
+    to each before unpacking and subtracted again afterwards.
+    """
+    length = len(a) + len(b) - 1
+    bound = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    width = (bound.bit_length() + 8) // 8
+    product = _pack_signed(a, width) * _pack_signed(b, width)
+    half = 1 << (8 * width - 1)
+    offset = int.from_bytes(half.to_bytes(width, "little") * length, "little")
+    data = (product + offset).to_bytes(width * length, "little")
+    return [int.from_bytes(data[i : i + width], "little") - half for i in range(0, width * length, width)]
+
+
+def _schoolbook(
+    a: Sequence[int],
+    b: Sequence[int],
+) -> List[int]:
+    """
+    Returns the coefficients of the product of two integer polynomials by
+    the quadratic method, which is faster for short operands.
+    """
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _multiply(
+    a: Sequence[int],
+    b: Sequence[int],
+) -> List[int]:
+    """
+    Returns the coefficients of the product of two non-empty integer
+    polynomials.
+    """
+    if min(len(a), len(b)) < KRONECKER_THRESHOLD:
+        return _schoolbook(a, b)
+    return _kronecker(a, b)
+
+
+class FractionPolynomial:
+    """
+    An immutable polynomial with fraction coefficients, stored as integer
+    coefficients over one shared denominator.
+
+    Attributes
+    ----------
+    degree : int
+        The degree; -1 for the zero polynomial.
+
+    Methods
+    -------
+    __call__(self, x: Fraction or int) -> Fraction:
+        Evaluates the polynomial at ``x``.
+
+    evaluate_many(self, points) -> list:
+        Evaluates the polynomial at many points.
+
+    __add__(self, other) -> 'FractionPolynomial':
+        Adds a polynomial, a Fraction or an int.
+
+    __sub__(self, other) -> 'FractionPolynomial':
+        Subtracts a polynomial, a Fraction or an int.
+
+    __mul__(self, other) -> 'FractionPolynomial':
+        Multiplies by a polynomial, a Fraction or an int.
+
+    __pow__(self, other: int) -> 'FractionPolynomial':
+        Raises the polynomial to a non-negative integer power.
+
+    __getitem__(self, index: int) -> Fraction:
+        Returns the coefficient of ``x**index``.
+
+    coefficients(self) -> list:
+        Returns the coefficients, lowest degree first.
+    """
+
+    __slots__ = ("_coefficients", "_denominator")
+
+    def __init__(
+        self,
+        coefficients: Iterable[Number] = (),
+    ) -> None:
+        """
+        Constructs a polynomial from its coefficients, lowest degree first.
+
+        Parameters
+        ----------
+        coefficients : iterable of Fraction or int
+            ``c_0, c_1, ...`` for ``c_0 + c_1 x + ...``. Trailing zeros are
+            dropped.
+        """
+        parts = [_parts(value, "Polynomial coefficients") for value in coefficients]
+        denominator = math.lcm(*(denominator for _, denominator in parts)) if parts else 1
+        self._set([numerator * (denominator // part) for numerator, part in parts], denominator)
+
+    def _set(
+        self,
+        coefficients: List[int],
+        denominator: int,
+    ) -> None:
+        """
+        Stores integer coefficients over a positive denominator, dropping
+        trailing zeros and reducing by the gcd of all of them at once.
+        """
+        while coefficients and not coefficients[-1]:
+            coefficients.pop()
+        divisor = math.gcd(denominator, *coefficients)
+        if divisor != 1:
+            coefficients = [value // divisor for value in coefficients]
+            denominator //= divisor
+        self._coefficients = coefficients
+        self._denominator = denominator
+
+    @classmethod
+    def _from_scaled(
+        cls,
+        coefficients: List[int],
+        denominator: int,
+    ) -> "FractionPolynomial":
+        """
+        Internal constructor for integer coefficients over a positive,
+        not necessarily reduced, denominator.
+        """
+        result = object.__new__(cls)
+        result._set(coefficients, denominator)
+        return result
+
+    @property
+    def degree(
+        self,
+    ) -> int:
+        """
+        The degree; -1 for the zero polynomial.
+        """
+        return len(self._coefficients) - 1
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> Fraction:
+        """
+        Returns the coefficient of ``x**index``, which is 0 above the degree.
+        """
+        if index < 0:
+            raise IndexError("Coefficient index cannot be negative")
+        if index >= len(self._coefficients):
+            return Fraction(0, 1)
+        return Fraction(self._coefficients[index], self._denominator, True)
+
+    def coefficients(
+        self,
+    ) -> List[Fraction]:
+        """
+        Returns the coefficients in lowest terms, lowest degree first.
+        """
+        return [Fraction(value, self._denominator, True) for value in self._coefficients]
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a string representation of the polynomial for debugging purposes.
+        """
+        return f"FractionPolynomial([{', '.join(map(str, self.coefficients()))}])"
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks if two polynomials have the same coefficients.
+        """
+        if not isinstance(other, FractionPolynomial):
+            return NotImplemented
+        # Both sides are reduced, so equal polynomials store equal parts.
+        return self._denominator == other._denominator and self._coefficients == other._coefficients
+
+    __hash__ = None
+
+    def _operand(
+        self,
+        other: object,
+        symbol: str,
+    ) -> Tuple[List[int], int]:
+        """
+        Returns the integer coefficients and denominator of an operand.
+
+        Raises
+        ------
+        TypeError
+            If the operand is not a polynomial, Fraction or int.
+        """
+        if isinstance(other, FractionPolynomial):
+            return other._coefficients, other._denominator
+        if isinstance(other, (Fraction, int)):
+            numerator, denominator = _parts(other, "Polynomial coefficients")
+            return [numerator], denominator
+        raise TypeError(
+            f"Unsupported operand types for {symbol}: 'FractionPolynomial' and '{type(other).__name__}'"
+        )
+
+    def _combine(
+        self,
+        other: object,
+        symbol: str,
+        sign: int,
+    ) -> "FractionPolynomial":
+        """
+        Returns ``self + sign * other`` over the lcm of both denominators.
+        """
+        coefficients, denominator = self._operand(other, symbol)
+        common = math.lcm(self._denominator, denominator)
+        left = common // self._denominator
+        right = sign * (common // denominator)
+        length = max(len(self._coefficients), len(coefficients))
+        result = [value * left for value in self._coefficients] + [0] * (length - len(self._coefficients))
+        for i, value in enumerate(coefficients):
+            result[i] += value * right
+        return FractionPolynomial._from_scaled(result, common)
+
+    def __add__(
+        self,
+        other: Union["FractionPolynomial", Number],
+    ) -> "FractionPolynomial":
+        """
+        Adds a polynomial, a Fraction or an int.
+        """
+        return self._combine(other, "+", 1)
+
+    def __radd__(
+        self,
+        other: Number,
+    ) -> "FractionPolynomial":
+        """
+        Adds the polynomial to a Fraction or an int.
+        """
+        return self._combine(other, "+", 1)
+
+    def __sub__(
+        self,
+        other: Union["FractionPolynomial", Number],
+    ) -> "FractionPolynomial":
+        """
+        Subtracts a polynomial, a Fraction or an int.
+        """
+        return self._combine(other, "-", -1)
+
+    def __rsub__(
+        self,
+        other: Number,
+    ) -> "FractionPolynomial":
+        """
+        Subtracts the polynomial from a Fraction or an int.
+        """
+        return (-self)._combine(other, "-", 1)
+
+    def __neg__(
+        self,
+    ) -> "FractionPolynomial":
+        """
+        Returns the negated polynomial.
+        """
+        result = object.__new__(FractionPolynomial)
+        result._coefficients = [-value for value in self._coefficients]
+        result._denominator = self._denominator
+        return result
+
+    def __mul__(
+        self,
+        other: Union["FractionPolynomial", Number],
+    ) -> "FractionPolynomial":
+        """
+        Multiplies by a polynomial, a Fraction or an int.
+
+        The integer coefficient lists are multiplied directly (by Kronecker
+        substitution once both have ``KRONECKER_THRESHOLD`` terms) and the
+        product is reduced once.
+        """
+        coefficients, denominator = self._operand(other, "*")
+        if not self._coefficients or not coefficients or not coefficients[-1]:
+            return FractionPolynomial()
+        product = _multiply(self._coefficients, coefficients)
+        return FractionPolynomial._from_scaled(product, self._denominator * denominator)
+
+    def __rmul__(
+        self,
+        other: Number,
+    ) -> "FractionPolynomial":
+        """
+        Multiplies a Fraction or an int by the polynomial.
+        """
+        return self * other
+
+    def __pow__(
+        self,
+        other: int,
+    ) -> "FractionPolynomial":
+        """
+        Raises the polynomial to a non-negative integer power by repeated
+        squaring.
+
+        Raises
+        ------
+        ValueError
+            If the exponent is negative.
+        """
+        if not isinstance(other, int):
+            raise TypeError(
+                f"Unsupported operand types for **: 'FractionPolynomial' and '{type(other).__name__}'"
+            )
+        if other < 0:
+            raise ValueError("Polynomial exponent cannot be negative")
+        result = FractionPolynomial._from_scaled([1], 1)
+        base = self
+        while other:
+            if other & 1:
+                result = result * base
+            other >>= 1
+            if other:
+                base = base * base
+        return result
+
+    def _horner(
+        self,
+        numerator: int,
+        powers: List[int],
+    ) -> int:
+        """
+        Returns ``sum(c_i * numerator**i * q**(n-i))`` for ``powers`` the
+        powers of ``q`` up to the degree.
+        """
+        coefficients = self._coefficients
+        total = coefficients[-1]
+        for k in range(len(coefficients) - 2, -1, -1):
+            total = total * numerator + coefficients[k] * powers[len(coefficients) - 1 - k]
+        return total
+
+    def __call__(
+        self,
+        x: Number,
+    ) -> Fraction:
+        """
+        Evaluates the polynomial at ``x``.
+
+        Horner's rule runs on integers only, and the result is reduced once.
+
+        Parameters
+        ----------
+        x : Fraction or int
+            The point.
+
+        Returns
+        -------
+        Fraction
+            ``p(x)`` in lowest terms.
+        """
+        return self.evaluate_many([x])[0]
+
+    def evaluate_many(
+        self,
+        points: Iterable[Number],
+    ) -> List[Fraction]:
+        """
+        Evaluates the polynomial at many points, equal to
+        ``[self(x) for x in points]``.
+
+        The powers of a point's denominator, and their product with the
+        shared coefficient denominator, are computed once per distinct
+        denominator; integer points use plain Horner's rule.
+
+        Parameters
+        ----------
+        points : iterable of Fraction or int
+            The points.
+
+        Returns
+        -------
+        list of Fraction
+            The values, in lowest terms.
+        """
+        coefficients = self._coefficients
+        degree = len(coefficients) - 1
+        if degree < 0:
+            return [Fraction(0, 1) for x in points]
+        denominator = self._denominator
+        tables = {}
+        values = []
+        append = values.append
+        for x in points:
+            numerator, q = _parts(x, "Evaluation points")
+            if q == 1:
+                total = coefficients[degree]
+                for k in range(degree - 1, -1, -1):
+                    total = total * numerator + coefficients[k]
+                append(Fraction(total, denominator, True))
+                continue
+            table = tables.get(q)
+            if table is None:
+                powers = [1] * (degree + 1)
+                for k in range(1, degree + 1):
+                    powers[k] = powers[k - 1] * q
+                table = tables[q] = (powers, powers[degree] * denominator)
+            powers, scale = table
+            append(Fraction(self._horner(numerator, powers), scale, True))
+        return values
@@ -0,0 +1,449 @@
+"""
+Exact vectors of fractions.
+
+``FractionVector`` stores its components as integer numerators over one
+shared denominator, so a vector is ``[x_0, x_1, ...] / d`` with every
+``x_i`` an int. The linear algebra then runs on the integer numerators:
+
+- ``dot`` and ``norm_squared`` are one integer sum of products over the
+  product of the denominators, reduced once, instead of a ``Fraction``
+  multiplication and addition, each with its own gcd, per component.
+- ``axpy``, ``scale``, addition and subtraction bring both operands to the
+  lcm of their denominators and reduce the result with a single
+  multi-argument gcd.
+- ``dot_many``, ``norm_squared_many`` and ``axpy_many`` apply the same
+  operations across many vectors with the per-call checks and lookups
+  done once for the whole batch.
+
+Example
+-------
+>>> from fraction_vector import FractionVector
+>>> v = FractionVector([Fraction(1, 2), Fraction(1, 3)])
+>>> v.dot(FractionVector([2, 3]))
+2
+>>> v.norm_squared()
+13/36
+"""
+
+import math
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from fraction import Fraction, _parts
+
+Number = Union[Fraction, int]
+
+
+def _scalar_parts(
+    value: object,
+    symbol: str,
+) -> Tuple[int, int]:
+    """
+    Returns the parts of a scalar operand.
+
+    Raises
+    ------
+    TypeError
+        If the scalar is neither a Fraction nor an int.
+    """
+    if isinstance(value, (Fraction, int)):
+        return _parts(value, "Scalars")
+    raise TypeError(f"Unsupported operand types for {symbol}: 'FractionVector' and '{type(value).__name__}'")
+
+
+def _check_lengths(
+    a: "FractionVector",
+    b: "FractionVector",
+) -> None:
+    """
+    Checks that two vectors have the same length.
+
+    Raises
+    ------
+    ValueError
+        If the vectors have different lengths.
+    """
+    if len(a._components) != len(b._components):
+        raise ValueError(f"Vectors must have the same length, not {len(a._components)} and {len(b._components)}")
+
+
+def _axpy_parts(
+    p: int,
+    q: int,
+    x: "FractionVector",
+    y: "FractionVector",
+) -> "FractionVector":
+    """
+    Returns ``(p / q) * x + y`` over the lcm of ``q * x.d`` and ``y.d``.
+    """
+    scaled = q * x._denominator
+    common = math.lcm(scaled, y._denominator)
+    left = p * (common // scaled)
+    right = common // y._denominator
+    return FractionVector._from_scaled(
+        [left * a + right * b for a, b in zip(x._components, y._components)],
+        common,
+    )
+
+
+class FractionVector:
+    """
+    An immutable vector of fractions stored as integer numerators over one
+    shared denominator.
+
+    Methods
+    -------
+    __getitem__(self, index: int) -> Fraction:
+        Returns the component at ``index``.
+
+    __add__(self, other: 'FractionVector') -> 'FractionVector':
+        Adds two vectors.
+
+    __sub__(self, other: 'FractionVector') -> 'FractionVector':
+        Subtracts two vectors.
+
+    __mul__(self, other: Fraction or int) -> 'FractionVector':
+        Scales the vector.
+
+    __matmul__(self, other: 'FractionVector') -> Fraction:
+        Returns the dot product.
+
+    dot(self, other: 'FractionVector') -> Fraction:
+        Returns the dot product.
+
+    norm_squared(self) -> Fraction:
+        Returns the squared Euclidean norm.
+
+    axpy(self, alpha: Fraction or int, x: 'FractionVector') -> 'FractionVector':
+        Returns ``alpha * x + self``.
+
+    scale(self, alpha: Fraction or int) -> 'FractionVector':
+        Returns ``alpha * self``.
+
+    dot_many(cls, lefts, rights) -> list:
+        Class method for the dot products of many pairs of vectors.
+
+    norm_squared_many(cls, vectors) -> list:
+        Class method for the squared norms of many vectors.
+
+    axpy_many(cls, alpha, xs, ys) -> list:
+        Class method for ``alpha * x + y`` over many pairs of vectors.
+    """
+
+    __slots__ = ("_components", "_denominator")
+
+    def __init__(
+        self,
+        components: Iterable[Number],
+    ) -> None:
+        """
+        Constructs a vector from Fractions and ints.
+
+        Parameters
+        ----------
+        components : iterable of Fraction or int
+            The components.
+        """
+        parts = [_parts(value, "Vector components") for value in components]
+        denominator = math.lcm(*(denominator for _, denominator in parts)) if parts else 1
+        self._set([numerator * (denominator // part) for numerator, part in parts], denominator)
+
+    def _set(
+        self,
+        components: List[int],
+        denominator: int,
+    ) -> None:
+        """
+        Stores integer numerators over a positive denominator, reduced by
+        the gcd of all of them at once.
+        """
+        divisor = math.gcd(denominator, *components)
+        if divisor != 1:
+            components = [value // divisor for value in components]
+            denominator //= divisor
+        self._components = components
+        self._denominator = denominator
+
+    @classmethod
+    def _from_scaled(
+        cls,
+        components: List[int],
+        denominator: int,
+    ) -> "FractionVector":
+        """
+        Internal constructor for integer numerators over a positive, not
+        necessarily reduced, denominator.
+        """
+        result = object.__new__(cls)
+        result._set(components, denominator)
+        return result
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of components.
+        """
+        return len(self._components)
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> Fraction:
+        """
+        Returns the component at ``index``, in lowest terms.
+        """
+        return Fraction(self._components[index], self._denominator, True)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Fraction]:
+        """
+        Iterates over the components as Fractions.
+        """
+        for value in self._components:
+            yield Fraction(value, self._denominator, True)
+
+    def to_list(
+        self,
+    ) -> List[Fraction]:
+        """
+        Returns the components as a list of Fractions.
+        """
+        return list(self)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a string representation of the vector for debugging purposes.
+        """
+        return f"FractionVector([{', '.join(map(str, self))}])"
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks if two vectors have the same components.
+        """
+        if not isinstance(other, FractionVector):
+            return NotImplemented
+        # Both sides are reduced, so equal vectors store equal parts.
+        return self._denominator == other._denominator and self._components == other._components
+
+    __hash__ = None
+
+    def _require_vector(
+        self,
+        other: object,
+        symbol: str,
+    ) -> "FractionVector":
+        """
+        Returns ``other`` if it is a vector of the same length.
+
+        Raises
+        ------
+        TypeError
+            If ``other`` is not a FractionVector.
+        ValueError
+            If the lengths differ.
+        """
+        if not isinstance(other, FractionVector):
+            raise TypeError(
+                f"Unsupported operand types for {symbol}: 'FractionVector' and '{type(other).__name__}'"
+            )
+        _check_lengths(self, other)
+        return other
+
+    def __add__(
+        self,
+        other: "FractionVector",
+    ) -> "FractionVector":
+        """
+        Adds two vectors of the same length.
+        """
+        return _axpy_parts(1, 1, self._require_vector(other, "+"), self)
+
+    def __sub__(
+        self,
+        other: "FractionVector",
+    ) -> "FractionVector":
+        """
+        Subtracts two vectors of the same length.
+        """
+        return _axpy_parts(-1, 1, self._require_vector(other, "-"), self)
+
+    def __neg__(
+        self,
+    ) -> "FractionVector":
+        """
+        Returns the negated vector.
+        """
+        result = object.__new__(FractionVector)
+        result._components = [-value for value in self._components]
+        result._denominator = self._denominator
+        return result
+
+    def scale(
+        self,
+        alpha: Number,
+    ) -> "FractionVector":
+        """
+        Returns ``alpha * self``, reduced once.
+
+        Raises
+        ------
+        TypeError
+            If alpha is neither a Fraction nor an int.
+        """
+        p, q = _scalar_parts(alpha, "*")
+        return FractionVector._from_scaled([p * value for value in self._components], q * self._denominator)
+
+    def __mul__(
+        self,
+        other: Number,
+    ) -> "FractionVector":
+        """
+        Scales the vector by a Fraction or an int.
+        """
+        return self.scale(other)
+
+    def __rmul__(
+        self,
+        other: Number,
+    ) -> "FractionVector":
+        """
+        Scales the vector by a Fraction or an int.
+        """
+        return self.scale(other)
+
+    def dot(
+        self,
+        other: "FractionVector",
+    ) -> Fraction:
+        """
+        Returns the dot product, as one integer sum of products reduced
+        once.
+
+        Raises
+        ------
+        TypeError
+            If other is not a FractionVector.
+        ValueError
+            If the lengths differ.
+        """
+        self._require_vector(other, "@")
+        return Fraction(
+            sum(map(int.__mul__, self._components, other._components)),
+            self._denominator * other._denominator,
+            True,
+        )
+
+    def __matmul__(
+        self,
+        other: "FractionVector",
+    ) -> Fraction:
+        """
+        Returns the dot product.
+        """
+        return self.dot(other)
+
+    def norm_squared(
+        self,
+    ) -> Fraction:
+        """
+        Returns the squared Euclidean norm, ``self.dot(self)``.
+        """
+        components = self._components
+        return Fraction(sum(map(int.__mul__, components, components)), self._denominator**2, True)
+
+    def axpy(
+        self,
+        alpha: Number,
+        x: "FractionVector",
+    ) -> "FractionVector":
+        """
+        Returns ``alpha * x + self`` with a single reduction.
+
+        Parameters
+        ----------
+        alpha : Fraction or int
+            The scale of ``x``.
+        x : FractionVector
+            A vector of the same length.
+
+        Raises
+        ------
+        TypeError
+            If alpha is neither a Fraction nor an int, or x is not a
+            FractionVector.
+        ValueError
+            If the lengths differ.
+        """
+        p, q = _scalar_parts(alpha, "*")
+        return _axpy_parts(p, q, self._require_vector(x, "+"), self)
+
+    @classmethod
+    def dot_many(
+        cls,
+        lefts: Iterable["FractionVector"],
+        rights: Iterable["FractionVector"],
+    ) -> List[Fraction]:
+        """
+        Returns the dot products of many pairs of vectors, equal to
+        ``[a.dot(b) for a, b in zip(lefts, rights)]``.
+
+        Raises
+        ------
+        ValueError
+            If a pair has different lengths.
+        """
+        results = []
+        append = results.append
+        multiply = int.__mul__
+        for a, b in zip(lefts, rights):
+            _check_lengths(a, b)
+            append(Fraction(sum(map(multiply, a._components, b._components)), a._denominator * b._denominator, True))
+        return results
+
+    @classmethod
+    def norm_squared_many(
+        cls,
+        vectors: Iterable["FractionVector"],
+    ) -> List[Fraction]:
+        """
+        Returns the squared norms of many vectors, equal to
+        ``[v.norm_squared() for v in vectors]``.
+        """
+        multiply = int.__mul__
+        return [
+            Fraction(sum(map(multiply, v._components, v._components)), v._denominator**2, True)
+            for v in vectors
+        ]
+
+    @classmethod
+    def axpy_many(
+        cls,
+        alpha: Number,
+        xs: Iterable["FractionVector"],
+        ys: Iterable["FractionVector"],
+    ) -> List["FractionVector"]:
+        """
+        Returns ``alpha * x + y`` for many pairs of vectors, equal to
+        ``[y.axpy(alpha, x) for x, y in zip(xs, ys)]``.
+
+        The parts of ``alpha`` are taken once for the whole batch.
+
+        Raises
+        ------
+        TypeError
+            If alpha is neither a Fraction nor an int.
+        ValueError
+            If a pair has different lengths.
+        """
+        p, q = _scalar_parts(alpha, "*")
+        results = []
+        for x, y in zip(xs, ys):
+            _check_lengths(x, y)
+            results.append(_axpy_parts(p, q, x, y))
+        return results
@@ -0,0 +1,576 @@
+"""
+Exact rational computations by multi-modular arithmetic.
+
+Exact elimination spends most of its time on intermediate numbers far
+larger than the final result. The engine here
+instead runs a computation modulo many word-size primes, where every
+intermediate fits in a machine word, and recovers the exact result:
+
+- ``run`` hands the primes to a ``ProcessPoolExecutor`` in rounds. Each
+  worker task evaluates the computation for a list of primes, so the
+  arguments are pickled once per task rather than once per prime. The
+  number of primes per task starts at ``FIRST_CHUNK`` and doubles every
+  round, so small results finish after a few primes and large ones need
+  at most about twice the primes they strictly require.
+- The residues are combined incrementally by the Chinese remainder theorem,
+  and after every round each value is recovered from its residue by
+  rational reconstruction (integers by the symmetric residue). Once the
+  recovered result fits in the modulus with ``SLACK_BITS`` to spare, a
+  small verification round of ``FIRST_CHUNK`` primes per worker follows,
+  and the run stops if it leaves the result unchanged. That round adds at
+  least ``30 * FIRST_CHUNK * workers`` bits of modulus, so a result that
+  survives it is wrong only with negligible probability.
+- Primes for which the computation is undefined (a pivot that vanishes
+  modulo the prime) are skipped: a task returns ``None`` for them.
+
+The primes are below ``2**31``, so with NumPy installed the elimination
+kernels behind ``determinant`` and ``solve`` process every prime of a
+task at once as a stack of ``int64`` matrices; without NumPy they fall
+back to pure Python, one prime at a time. A task is any module-level
+function ``task(primes, *args)`` returning, per prime, an int, a list of
+ints, or ``None``.
+
+Example
+-------
+>>> import multimodular
+>>> multimodular.determinant([[Fraction(1, 2), 1], [Fraction(1, 3), 2]], workers=1)
+2/3
+>>> multimodular.solve([[Fraction(1, 2), 1], [Fraction(1, 3), 2]], [1, 1], workers=1)
+[3/2, 1/4]
+"""
+
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from fraction import Fraction, _parts, _scale_row
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Number = Union[Fraction, int]
+
+#: Bit length of the primes; every prime is below ``2**PRIME_BITS``, so the
+#: product of two residues fits in a signed 64-bit word.
+PRIME_BITS = 31
+#: Number of primes per worker task in the first round.
+FIRST_CHUNK = 4
+#: The run gives up after this many primes.
+MAX_PRIMES = 100_000
+#: Margin by which a reconstructed result must fit in the modulus before a
+#: verification round is run for it.
+SLACK_BITS = 20
+#: The run gives up after this many primes for which the task is undefined.
+MAX_UNLUCKY = 16
+
+# Deterministic Miller-Rabin bases for every n below 3.3 * 10**24.
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_primes: List[int] = []
+
+
+def _is_prime(
+    n: int,
+) -> bool:
+    """
+    Returns whether ``n`` is prime, for ``n < 3.3 * 10**24``.
+    """
+    if n < 2:
+        return False
+    for witness in _WITNESSES:
+        if n % witness == 0:
+            return n == witness
+    d = n - 1
+    shift = (d & -d).bit_length() - 1
+    d >>= shift
+    for witness in _WITNESSES:
+        x = pow(witness, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(shift - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primes(
+    count: int,
+) -> List[int]:
+    """
+    Returns the ``count`` largest primes below ``2**PRIME_BITS``, in
+    descending order.
+
+    The primes are found once and kept for later calls.
+    """
+    candidate = _primes[-1] - 2 if _primes else (1 << PRIME_BITS) - 1
+    while len(_primes) < count:
+        if _is_prime(candidate):
+            _primes.append(candidate)
+        candidate -= 2
+    return _primes[:count]
+
+
+def _rational_reconstruction(
+    residue: int,
+    modulus: int,
+) -> Optional[Tuple[int, int]]:
+    """
+    Returns the reduced ``(n, d)`` with ``n / d == residue (mod modulus)``
+    and ``|n|, d <= sqrt(modulus / 2)``, or ``None`` if there is none.
+
+    This is the extended Euclidean algorithm stopped halfway: the
+    remainders bound the numerator and the cofactors the denominator.
+    """
+    bound = math.isqrt(modulus >> 1)
+    r0, r1 = modulus, residue
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if not s1 or abs(s1) > bound or math.gcd(r1, s1) != 1:
+        return None
+    return (r1, s1) if s1 > 0 else (-r1, -s1)
+
+
+def _recover(
+    residues: List[int],
+    modulus: int,
+    integer: bool,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Returns the reconstructed parts of every residue, or ``None`` unless
+    all of them are at least ``SLACK_BITS`` smaller than the modulus.
+
+    The reconstruction of a residue that does not yet determine its value
+    is essentially random, and that small only with probability
+    ``2**-SLACK_BITS``.
+    """
+    limit = modulus.bit_length() - SLACK_BITS
+    values = []
+    if integer:
+        half = modulus >> 1
+        for residue in residues:
+            value = residue - modulus if residue > half else residue
+            if value.bit_length() > limit:
+                return None
+            values.append((value, 1))
+        return values
+    # Results often share most of their denominator, as the unknowns of a
+    # linear system share the determinant. Scaling by the denominators
+    # found so far usually leaves a small integer, which skips the
+    # Euclidean reconstruction.
+    common = 1
+    half = modulus >> 1
+    for residue in residues:
+        scaled = residue * common % modulus
+        if scaled > half:
+            scaled -= modulus
+        if scaled.bit_length() + common.bit_length() <= limit:
+            divisor = math.gcd(scaled, common)
+            values.append((scaled // divisor, common // divisor))
+            continue
+        parts = _rational_reconstruction(residue, modulus)
+        if parts is None or parts[0].bit_length() + parts[1].bit_length() > limit:
+            return None
+        values.append(parts)
+        common = math.lcm(common, parts[1])
+    return values
+
+
+def run(
+    task: Callable,
+    args: tuple = (),
+    integer: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    max_primes: int = MAX_PRIMES,
+) -> List[Fraction]:
+    """
+    Runs a computation modulo many primes and returns its exact result.
+
+    Parameters
+    ----------
+    task : callable
+        A module-level function ``task(primes, *args)`` returning, for each
+        prime of the list, the results modulo that prime as an int or a
+        list of ints, or ``None`` when the computation is undefined modulo
+        that prime.
+    args : tuple, optional
+        The remaining arguments of ``task``, sent once to each worker task.
+    integer : bool, optional
+        Whether the results are integers (default is False). Integers need
+        about half the primes of fractions of the same size.
+    workers : int, optional
+        The number of worker processes (default is ``os.cpu_count()``).
+        With one worker and no executor the primes are processed in this
+        process.
+    executor : Executor, optional
+        A running process pool to use instead of starting one per call.
+    max_primes : int, optional
+        The number of primes after which the run gives up (default is
+        ``MAX_PRIMES``).
+
+    Returns
+    -------
+    list of Fraction
+        The results, in lowest terms; one element if the task returns ints.
+
+    Raises
+    ------
+    ValueError
+        If workers is below 1, the task is undefined for ``MAX_UNLUCKY``
+        primes, or the result has not stabilised after ``max_primes``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers should be at least 1")
+    owned = executor is None and workers > 1
+    if owned:
+        executor = ProcessPoolExecutor(workers)
+    try:
+        residues = None
+        modulus = 1
+        used = 0
+        unlucky = 0
+        previous = None
+        verifying = False
+        chunk_size = FIRST_CHUNK
+        while True:
+            if used >= max_primes:
+                raise ValueError(f"Result did not stabilise after {used} primes")
+            size = FIRST_CHUNK if verifying else chunk_size
+            count = min(size * workers, max_primes - used)
+            batch = primes(used + count)[used:]
+            used += count
+            chunks = [batch[start:start + size] for start in range(0, count, size)]
+            if executor is None:
+                results = [result for chunk in chunks for result in task(chunk, *args)]
+            else:
+                futures = [executor.submit(task, chunk, *args) for chunk in chunks]
+                results = [result for future in futures for result in future.result()]
+            for prime, values in zip(batch, results):
+                if values is None:
+                    unlucky += 1
+                    if unlucky >= MAX_UNLUCKY:
+                        raise ValueError(f"Computation is undefined modulo {unlucky} primes")
+                    continue
+                if not isinstance(values, list):
+                    values = [values]
+                if residues is None:
+                    residues = [value % prime for value in values]
+                    modulus = prime
+                    continue
+                # Garner step: r + M * ((v - r) / M mod p) is v mod p and r mod M.
+                inverse = pow(modulus, -1, prime)
+                residues = [
+                    residue + modulus * ((value - residue) * inverse % prime)
+                    for residue, value in zip(residues, values)
+                ]
+                modulus *= prime
+            current = None if residues is None else _recover(residues, modulus, integer)
+            if current is not None and current == previous:
+                return [Fraction._from_reduced(n, d) for n, d in current]
+            previous = current
+            # A candidate result is verified with the smallest round;
+            # otherwise the rounds keep growing.
+            verifying = current is not None
+            if not verifying:
+                chunk_size *= 2
+    finally:
+        if owned:
+            executor.shutdown()
+
+
+def _residues(
+    rows: List[List[int]],
+    primes: List[int],
+) -> "np.ndarray":
+    """
+    Returns the residues of an integer matrix modulo each prime, as an
+    ``int64`` array of shape ``(len(primes), rows, columns)``.
+    """
+    try:
+        matrix = np.array(rows, dtype=np.int64)
+    except OverflowError:
+        return np.array([[[value % prime for value in row] for row in rows] for prime in primes], dtype=np.int64)
+    return matrix[None, :, :] % np.array(primes, dtype=np.int64)[:, None, None]
+
+
+def _eliminate(
+    matrix: "np.ndarray",
+    primes: List[int],
+    size: int,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Runs Gaussian elimination in place on the first ``size`` columns of a
+    stack of matrices, one per prime, all at once.
+
+    Products of two residues below ``2**31`` fit in ``int64``, so every
+    step is a handful of array operations over the whole stack. Only the
+    pivot inverses are computed with Python ints, one per prime and step.
+
+    Returns
+    -------
+    tuple of arrays
+        The determinant modulo each prime, whether the matrix is singular
+        modulo each prime, and the pivot inverses of shape
+        ``(len(primes), size)``.
+    """
+    count = len(primes)
+    modulus = np.array(primes, dtype=np.int64)
+    column_modulus = modulus[:, None]
+    block_modulus = modulus[:, None, None]
+    everyone = np.arange(count)
+    determinant = np.ones(count, dtype=np.int64)
+    singular = np.zeros(count, dtype=bool)
+    inverses = np.zeros((count, size), dtype=np.int64)
+    for k in range(size):
+        nonzero = matrix[:, k:, k] != 0
+        offset = nonzero.argmax(axis=1)
+        singular |= ~nonzero[everyone, offset]
+        swapped = everyone[offset != 0]
+        if swapped.size:
+            # Pivot row swaps differ between primes only where an entry
+            # vanishes modulo one of them.
+            targets = k + offset[swapped]
+            pivot_lines = matrix[swapped, targets].copy()
+            matrix[swapped, targets] = matrix[swapped, k]
+            matrix[swapped, k] = pivot_lines
+            determinant[swapped] = (modulus[swapped] - determinant[swapped]) % modulus[swapped]
+        pivots = matrix[:, k, k]
+        determinant = determinant * pivots % modulus
+        inverses[:, k] = [pow(int(pivot), -1, prime) if pivot else 0 for pivot, prime in zip(pivots, primes)]
+        factors = matrix[:, k + 1 :, k] * inverses[:, k, None] % column_modulus
+        # A residue minus a product of two residues stays above -2**62.
+        updates = factors[:, :, None] * matrix[:, k, None, k + 1 :]
+        np.subtract(matrix[:, k + 1 :, k + 1 :], updates, out=updates)
+        matrix[:, k + 1 :, k + 1 :] = updates % block_modulus
+        matrix[:, k + 1 :, k] = 0
+    determinant[singular] = 0
+    return determinant, singular, inverses
+
+
+def _determinant_mod(
+    primes: List[int],
+    rows: List[List[int]],
+) -> List[int]:
+    """
+    Returns the determinant of an integer matrix modulo each prime.
+    """
+    if np is not None:
+        determinant, _, _ = _eliminate(_residues(rows, primes), primes, len(rows))
+        return determinant.tolist()
+    return [_determinant_mod_python(prime, rows) for prime in primes]
+
+
+def _determinant_mod_python(
+    prime: int,
+    rows: List[List[int]],
+) -> int:
+    """
+    Returns the determinant of an integer matrix modulo ``prime`` without
+    NumPy.
+
+    Each elimination step drops the pivot column, so the remaining rows
+    shrink as the elimination proceeds.
+    """
+    rows = [[value % prime for value in row] for row in rows]
+    determinant = 1
+    while rows:
+        pivot_index = next((i for i, row in enumerate(rows) if row[0]), None)
+        if pivot_index is None:
+            return 0
+        if pivot_index:
+            determinant = -determinant
+        pivot_line = rows.pop(pivot_index)
+        pivot = pivot_line[0]
+        determinant = determinant * pivot % prime
+        inverse = pow(pivot, -1, prime)
+        tail = [value * inverse % prime for value in pivot_line[1:]]
+        rows = [
+            [(x - row[0] * y) % prime for x, y in zip(row[1:], tail)] if row[0] else row[1:]
+            for row in rows
+        ]
+    return determinant % prime
+
+
+def _solve_mod(
+    primes: List[int],
+    rows: List[List[int]],
+    rhs: List[int],
+) -> List[Optional[List[int]]]:
+    """
+    Returns ``[det(A), det(A) * x...]`` for the integer system ``A x = rhs``
+    modulo each prime, or ``None`` for the primes modulo which ``A`` is
+    singular.
+
+    By Cramer's rule ``det(A) * x`` is integral, so the results are
+    recovered as integers, with about half the primes a rational
+    reconstruction of ``x`` would need.
+    """
+    if np is None:
+        return [_solve_mod_python(prime, rows, rhs) for prime in primes]
+    size = len(rows)
+    matrix = _residues([row + [b] for row, b in zip(rows, rhs)], primes)
+    determinant, singular, inverses = _eliminate(matrix, primes, size)
+    modulus = np.array(primes, dtype=np.int64)[:, None]
+    solution = np.zeros((len(primes), size), dtype=np.int64)
+    for i in range(size - 1, -1, -1):
+        # Each product is reduced before summing, so the sum stays below
+        # size * 2**31.
+        known = (matrix[:, i, i + 1 : size] * solution[:, i + 1 :] % modulus).sum(axis=1)
+        solution[:, i] = (matrix[:, i, size] - known) % modulus[:, 0] * inverses[:, i] % modulus[:, 0]
+    scaled = solution * determinant[:, None] % modulus
+    return [
+        None if failed else [det] + values
+        for failed, det, values in zip(singular.tolist(), determinant.tolist(), scaled.tolist())
+    ]
+
+
+def _solve_mod_python(
+    prime: int,
+    rows: List[List[int]],
+    rhs: List[int],
+) -> Optional[List[int]]:
+    """
+    Returns ``[det(A), det(A) * x...]`` modulo ``prime`` without NumPy, or
+    ``None`` if ``A`` is singular modulo ``prime``.
+    """
+    remaining = [[value % prime for value in row] + [b % prime] for row, b in zip(rows, rhs)]
+    upper = []
+    determinant = 1
+    while remaining:
+        pivot_index = next((i for i, row in enumerate(remaining) if row[0]), None)
+        if pivot_index is None:
+            return None
+        if pivot_index:
+            determinant = -determinant
+        pivot_line = remaining.pop(pivot_index)
+        determinant = determinant * pivot_line[0] % prime
+        inverse = pow(pivot_line[0], -1, prime)
+        # Normalised to a leading 1, which is dropped.
+        tail = [value * inverse % prime for value in pivot_line[1:]]
+        upper.append(tail)
+        remaining = [
+            [(x - row[0] * y) % prime for x, y in zip(row[1:], tail)] if row[0] else row[1:]
+            for row in remaining
+        ]
+    solution = []
+    for line in reversed(upper):
+        # line holds the coefficients of the later unknowns, then the rhs.
+        value = line[-1] - sum(map(int.__mul__, line[:-1], solution))
+        solution.insert(0, value % prime)
+    return [determinant] + [value * determinant % prime for value in solution]
+
+
+def _integer_rows(
+    rows: Iterable[Iterable[Number]],
+) -> Tuple[List[List[int]], List[int]]:
+    """
+    Returns the integer-scaled rows of a square matrix and their scales.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is not square.
+    """
+    scaled = [_scale_row(row, "Matrix entries") for row in rows]
+    if any(len(row) != len(scaled) for row, _ in scaled):
+        raise ValueError("Expected a square matrix")
+    return [row for row, _ in scaled], [scale for _, scale in scaled]
+
+
+def determinant(
+    rows: Iterable[Iterable[Number]],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Fraction:
+    """
+    Returns the exact determinant of a square matrix of Fractions and ints.
+
+    The rows are scaled to integers, the integer determinant is computed
+    modulo word-size primes and recovered by the Chinese remainder theorem.
+
+    Parameters
+    ----------
+    rows : iterable of iterables of Fraction or int
+        The rows of the matrix.
+    workers : int, optional
+        The number of worker processes (default is ``os.cpu_count()``).
+    executor : Executor, optional
+        A running process pool to use instead of starting one per call.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is not square.
+    """
+    rows, scales = _integer_rows(rows)
+    if not rows:
+        return Fraction(1, 1)
+    (value,) = run(_determinant_mod, (rows,), integer=True, workers=workers, executor=executor)
+    return Fraction(value._numerator, math.prod(scales), True)
+
+
+def solve(
+    rows: Iterable[Iterable[Number]],
+    rhs: Sequence[Number],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[Fraction]:
+    """
+    Solves the square system ``rows @ x == rhs`` exactly.
+
+    The system is scaled to integers and ``det(A)`` and ``det(A) * x``,
+    which are integral by Cramer's rule, are computed modulo word-size
+    primes and recovered by the Chinese remainder theorem.
+
+    Parameters
+    ----------
+    rows : iterable of iterables of Fraction or int
+        The rows of the matrix.
+    rhs : sequence of Fraction or int
+        The right-hand side.
+    workers : int, optional
+        The number of worker processes (default is ``os.cpu_count()``).
+    executor : Executor, optional
+        A running process pool to use instead of starting one per call.
+
+    Returns
+    -------
+    list of Fraction
+        The solution.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is not square or is singular, or the shapes do not
+        match.
+    """
+    rows, scales = _integer_rows(rows)
+    if len(rhs) != len(rows):
+        raise ValueError(f"Expected a right-hand side of length {len(rows)}, not {len(rhs)}")
+    if not rows:
+        return []
+    # (S A) x = S b, with S b brought to one common denominator.
+    parts = []
+    for value, scale in zip(rhs, scales):
+        numerator, denominator = _parts(value, "Matrix entries")
+        parts.append((numerator * scale, denominator))
+    common = math.lcm(*(denominator for _, denominator in parts))
+    vector = [numerator * (common // denominator) for numerator, denominator in parts]
+    try:
+        determinant, *scaled = run(_solve_mod, (rows, vector), integer=True, workers=workers, executor=executor)
+    except ValueError as error:
+        if str(error).startswith("Computation is undefined"):
+            raise ValueError("Matrix is singular") from None
+        raise
+    denominator = determinant._numerator * common
+    return [Fraction(value._numerator, denominator, True) for value in scaled]
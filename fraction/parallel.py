@@ -0,0 +1,164 @@
+"""
+Exact sums and products of huge fraction datasets on a process pool.
+
+The input is split into chunks. Each chunk is shipped to a
+``ProcessPoolExecutor`` worker as a ``SharedFractions`` block, so only the
+block name crosses the process boundary. Each worker reduces the decoded
+parts of its chunk with ``Fraction.sum_parts`` or ``Fraction.prod_parts``,
+without creating a Fraction per value, and returns one unreduced Fraction.
+The parent merges the partial results with ``Fraction.sum`` or
+``Fraction.prod``, which reduce only the final result.
+
+Chunks are encoded and submitted one at a time, so the parent keeps
+encoding while the first workers are already reducing.
+
+Example
+-------
+>>> import parallel
+>>> parallel.parallel_sum([Fraction(1, n) for n in range(1, 11)], workers=2)
+7381/2520
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, Optional, Union
+
+from fraction import Fraction
+from shared import SharedFractions
+
+#: Inputs are never split into chunks smaller than this.
+MIN_CHUNK_SIZE = 50_000
+#: Number of chunks per worker when the chunk size is chosen automatically.
+CHUNKS_PER_WORKER = 4
+
+_REDUCERS = {"sum": Fraction.sum, "prod": Fraction.prod}
+_PART_REDUCERS = {"sum": Fraction.sum_parts, "prod": Fraction.prod_parts}
+
+
+def _reduce_batch(
+    operation: str,
+    batch: SharedFractions,
+) -> Fraction:
+    """
+    Worker task: reduces one shared chunk.
+    """
+    try:
+        return _PART_REDUCERS[operation](*batch.to_parts(), simplify=False)
+    finally:
+        batch.close()
+
+
+def _parallel_reduce(
+    operation: str,
+    values: Iterable[Union[Fraction, int]],
+    workers: Optional[int],
+    chunk_size: Optional[int],
+    executor: Optional[Executor],
+) -> Fraction:
+    """
+    Splits ``values`` into chunks, reduces them on the pool and merges the
+    partial results.
+    """
+    values = values if isinstance(values, list) else list(values)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers should be at least 1")
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(values) // (workers * CHUNKS_PER_WORKER)))
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be at least 1")
+    local = _REDUCERS[operation]
+    if len(values) <= chunk_size or (workers == 1 and executor is None):
+        return local(values)
+
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(workers)
+    batches = []
+    try:
+        futures = []
+        for start in range(0, len(values), chunk_size):
+            batch = SharedFractions(values[start:start + chunk_size])
+            batches.append(batch)
+            futures.append(executor.submit(_reduce_batch, operation, batch))
+        partials = [future.result() for future in futures]
+    finally:
+        if owned:
+            executor.shutdown()
+        for batch in batches:
+            batch.unlink()
+
+    return local(partials)
+
+
+def parallel_sum(
+    values: Iterable[Union[Fraction, int]],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Fraction:
+    """
+    Returns the exact sum of many fractions and ints, computed on a process
+    pool.
+
+    Parameters
+    ----------
+    values : iterable of Fraction or int
+        The terms to add.
+    workers : int, optional
+        The number of worker processes (default is ``os.cpu_count()``).
+    chunk_size : int, optional
+        The number of values per task (default spreads the input over
+        ``CHUNKS_PER_WORKER`` tasks per worker, but at least
+        ``MIN_CHUNK_SIZE`` values each).
+    executor : Executor, optional
+        A running process pool to use instead of starting one per call.
+
+    Returns
+    -------
+    Fraction
+        The reduced sum, equal to ``Fraction.sum(values)``.
+
+    Raises
+    ------
+    ValueError
+        If workers or chunk_size is below 1.
+    """
+    return _parallel_reduce("sum", values, workers, chunk_size, executor)
+
+
+def parallel_prod(
+    values: Iterable[Union[Fraction, int]],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Fraction:
+    """
+    Returns the exact product of many fractions and ints, computed on a
+    process pool.
+
+    Parameters
+    ----------
+    values : iterable of Fraction or int
+        The factors to multiply.
+    workers : int, optional
+        The number of worker processes (default is ``os.cpu_count()``).
+    chunk_size : int, optional
+        The number of values per task (default spreads the input over
+        ``CHUNKS_PER_WORKER`` tasks per worker, but at least
+        ``MIN_CHUNK_SIZE`` values each).
+    executor : Executor, optional
+        A running process pool to use instead of starting one per call.
+
+    Returns
+    -------
+    Fraction
+        The reduced product, equal to ``Fraction.prod(values)``.
+
+    Raises
+    ------
+    ValueError
+        If workers or chunk_size is below 1.
+    """
+    return _parallel_reduce("prod", values, workers, chunk_size, executor)
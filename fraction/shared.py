@@ -0,0 +1,302 @@
+"""
+Shared-memory transport for large batches of fractions.
+
+``SharedFractions`` encodes a batch once, with the binary format of
+``fraction_io``, into a ``multiprocessing.shared_memory`` block. Pickling it
+sends only the name and size of the block, so passing it to a worker
+process costs the same for ten values as for ten million. The worker maps
+the block and decodes straight from it, without copying per element.
+
+``SharedFractions`` also pickles under protocol 5 with the encoded bytes as
+an out-of-band ``PickleBuffer`` when it is detached from shared memory, for
+transports that carry buffers separately.
+
+Example
+-------
+>>> with SharedFractions([Fraction(1, 3), Fraction(2, 5)]) as batch:
+...     with multiprocessing.Pool() as pool:
+...         pool.apply(Fraction.sum, (batch,))
+11/15
+"""
+
+import pickle
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import fraction_io
+from fraction import Fraction
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:
+    resource_tracker = None
+
+
+def _tracker_pid() -> Optional[int]:
+    """
+    Returns the pid of the resource tracker this process started or
+    inherited by forking, or None when it reports to a tracker passed in by
+    its parent or runs none.
+    """
+    tracker = getattr(resource_tracker, "_resource_tracker", None)
+    return getattr(tracker, "_pid", None)
+
+
+class SharedFractions:
+    """
+    A read-only batch of fractions stored in a shared memory block.
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory block.
+    nbytes : int
+        The size of the encoded batch in bytes.
+
+    Methods
+    -------
+    to_parts(self) -> tuple:
+        Decodes the numerators and denominators without creating Fractions.
+
+    to_fractions(self) -> list:
+        Decodes the batch into Fractions.
+
+    detach(self) -> 'SharedFractions':
+        Returns a copy that holds the encoded bytes in process memory.
+
+    close(self) -> None:
+        Releases this process's mapping of the block.
+
+    unlink(self) -> None:
+        Destroys the block; only the creating process should call it.
+
+    Notes
+    -----
+    The creating process owns the block: leaving the ``with`` statement
+    closes and unlinks it. Copies received by other processes attach to the
+    block lazily on first use and only close their own mapping.
+    """
+
+    __slots__ = ("_name", "_nbytes", "_count", "_memory", "_buffer", "_owner", "_tracker")
+
+    def __init__(
+        self,
+        values: Iterable[Union[Fraction, int]],
+    ) -> None:
+        """
+        Encodes ``values`` into a new shared memory block.
+
+        Parameters
+        ----------
+        values : iterable of Fraction or int
+            The values to share.
+        """
+        values = values if isinstance(values, list) else list(values)
+        encoded = fraction_io.encode_fractions(values)
+        # Zero-sized blocks are not allowed.
+        memory = shared_memory.SharedMemory(create=True, size=max(len(encoded), 1))
+        memory.buf[: len(encoded)] = encoded
+        self._name = memory.name
+        self._nbytes = len(encoded)
+        self._count = len(values)
+        self._memory = memory
+        self._buffer = None
+        self._owner = True
+        self._tracker = _tracker_pid()
+
+    @classmethod
+    def _attach(
+        cls,
+        name: Optional[str],
+        nbytes: int,
+        count: int,
+        tracker: Optional[int] = None,
+        buffer: Optional[Union[bytes, pickle.PickleBuffer]] = None,
+    ) -> "SharedFractions":
+        """
+        Rebuilds a batch received from another process.
+        """
+        result = object.__new__(cls)
+        result._name = name
+        result._nbytes = nbytes
+        result._count = count
+        result._memory = None
+        result._buffer = buffer
+        result._owner = False
+        result._tracker = tracker
+        return result
+
+    def __reduce_ex__(
+        self,
+        protocol: int,
+    ) -> Tuple[object, tuple]:
+        """
+        Pickles a reference to the block, or the encoded bytes of a detached
+        batch, out of band under protocol 5.
+        """
+        if self._buffer is None:
+            return SharedFractions._attach, (self._name, self._nbytes, self._count, self._tracker)
+        buffer = self._buffer
+        if protocol >= 5:
+            buffer = pickle.PickleBuffer(buffer)
+        else:
+            buffer = bytes(buffer)
+        return SharedFractions._attach, (None, self._nbytes, self._count, None, buffer)
+
+    @property
+    def name(
+        self,
+    ) -> Optional[str]:
+        """
+        The name of the shared memory block, or None once detached.
+        """
+        return self._name
+
+    @property
+    def nbytes(
+        self,
+    ) -> int:
+        """
+        The size of the encoded batch in bytes.
+        """
+        return self._nbytes
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Returns the number of values in the batch.
+        """
+        return self._count
+
+    def __iter__(
+        self,
+    ) -> Iterator[Fraction]:
+        """
+        Iterates over the decoded values.
+        """
+        return iter(self.to_fractions())
+
+    def __repr__(
+        self,
+    ) -> str:
+        """
+        Returns a string representation of the batch for debugging purposes.
+        """
+        location = f"name={self._name!r}" if self._buffer is None else "detached"
+        return f"SharedFractions({location}, count={self._count}, nbytes={self._nbytes})"
+
+    def _view(
+        self,
+    ) -> memoryview:
+        """
+        Returns a read-only view of the encoded bytes, attaching to the
+        shared memory block on first use.
+        """
+        if self._buffer is not None:
+            return memoryview(self._buffer).toreadonly()
+        if self._memory is None:
+            if self._name is None:
+                raise ValueError("SharedFractions is closed")
+            self._memory = shared_memory.SharedMemory(name=self._name)
+            tracker = _tracker_pid()
+            if tracker is not None and tracker != self._tracker:
+                # Attaching registered the block with a tracker this process
+                # started itself, rather than the owner's, which would destroy
+                # the block when this process exits.
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+        return self._memory.buf[: self._nbytes].toreadonly()
+
+    def to_parts(
+        self,
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Decodes the batch into parallel lists of reduced parts.
+
+        Returns
+        -------
+        tuple
+            The ``(numerators, denominators)`` lists.
+        """
+        view = self._view()
+        try:
+            return fraction_io.decode_parts(view)
+        finally:
+            view.release()
+
+    def to_fractions(
+        self,
+    ) -> List[Fraction]:
+        """
+        Decodes the batch into Fractions.
+
+        Returns
+        -------
+        list of Fraction
+            The values, in lowest terms.
+        """
+        return list(map(Fraction._from_reduced, *self.to_parts()))
+
+    def detach(
+        self,
+    ) -> "SharedFractions":
+        """
+        Returns a copy of the batch that holds the encoded bytes in process
+        memory and no longer depends on the shared memory block.
+        """
+        view = self._view()
+        try:
+            return SharedFractions._attach(None, self._nbytes, self._count, None, bytes(view))
+        finally:
+            view.release()
+
+    def close(
+        self,
+    ) -> None:
+        """
+        Releases this process's mapping of the block. The batch attaches
+        again on next use unless the block was unlinked.
+        """
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+
+    def unlink(
+        self,
+    ) -> None:
+        """
+        Destroys the shared memory block.
+
+        Raises
+        ------
+        ValueError
+            If this process did not create the block.
+        """
+        if not self._owner:
+            raise ValueError("Only the creating process can unlink SharedFractions")
+        if self._name is not None:
+            memory = self._memory or shared_memory.SharedMemory(name=self._name)
+            memory.close()
+            memory.unlink()
+            self._memory = None
+            self._name = None
+
+    def __enter__(
+        self,
+    ) -> "SharedFractions":
+        """
+        Returns the batch itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        *exc_info: object,
+    ) -> None:
+        """
+        Closes the mapping, and destroys the block if this process owns it.
+        """
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
@@ -0,0 +1,324 @@
+"""
+Sorting and selection for large collections of fractions.
+
+``sorted()`` on Fraction objects calls ``Fraction.__lt__`` O(n log n) times.
+The functions in this module order values by their correctly rounded float
+value first, which runs at C speed, and fall back to exact Fraction
+comparisons only inside groups of values whose float keys collide. Rounding
+to the nearest float is monotonic, so ``x < y`` implies
+``key(x) <= key(y)``, and the results are exactly those of ``sorted()``.
+Like ``sorted()``, every function is stable.
+
+The inputs may mix Fractions, ints and floats.
+
+Example
+-------
+>>> import sorting
+>>> sorting.sort([Fraction(1, 3), Fraction(1, 4), 1])
+[1/4, 1/3, 1]
+"""
+
+import builtins
+import heapq
+import math
+from typing import Iterable, List, Sequence, Union
+
+from fraction import Fraction
+
+Number = Union[Fraction, int, float]
+
+
+def _float_key(
+    value: Number,
+) -> float:
+    """
+    Returns the correctly rounded float value of ``value``; magnitudes beyond
+    the float range map to an infinity of the same sign.
+    """
+    try:
+        return value._numerator / value._denominator
+    except AttributeError:
+        pass
+    except OverflowError:
+        positive = (value._numerator > 0) == (value._denominator > 0)
+        return math.inf if positive else -math.inf
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+def _float_keys(
+    values: Sequence[Number],
+) -> List[float]:
+    """
+    Returns the float keys of every value.
+    """
+    keys = []
+    append = keys.append
+    for value in values:
+        try:
+            append(value._numerator / value._denominator)
+        except (AttributeError, OverflowError):
+            append(_float_key(value))
+    return keys
+
+
+def _order(
+    values: Sequence[Number],
+    keys: List[float],
+    reverse: bool,
+) -> List[int]:
+    """
+    Returns the stable exact ordering of ``values`` as a list of indices.
+
+    The indices are sorted by float key, then each run of equal keys is
+    re-sorted with exact comparisons.
+    """
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    start = 0
+    count = len(order)
+    while start < count:
+        key = keys[order[start]]
+        stop = start + 1
+        while stop < count and keys[order[stop]] == key:
+            stop += 1
+        if stop - start > 1:
+            order[start:stop] = sorted(
+                order[start:stop], key=values.__getitem__, reverse=reverse
+            )
+        start = stop
+    return order
+
+
+def argsort(
+    values: Iterable[Number],
+    reverse: bool = False,
+) -> List[int]:
+    """
+    Returns the indices that would sort ``values``.
+
+    Parameters
+    ----------
+    values : iterable of Fraction, int or float
+        The values to order.
+    reverse : bool, optional
+        Whether to order from largest to smallest (default is False).
+
+    Returns
+    -------
+    list of int
+        The stable sorting permutation.
+    """
+    values = list(values)
+    return _order(values, _float_keys(values), reverse)
+
+
+def sort(
+    values: Iterable[Number],
+    reverse: bool = False,
+) -> List[Number]:
+    """
+    Returns a new sorted list, exactly as ``sorted(values)`` would.
+
+    Parameters
+    ----------
+    values : iterable of Fraction, int or float
+        The values to sort.
+    reverse : bool, optional
+        Whether to sort from largest to smallest (default is False).
+
+    Returns
+    -------
+    list
+        The sorted values.
+    """
+    values = list(values)
+    return [values[index] for index in _order(values, _float_keys(values), reverse)]
+
+
+def nsmallest(
+    k: int,
+    values: Iterable[Number],
+) -> List[Number]:
+    """
+    Returns the ``k`` smallest values in ascending order.
+
+    Equivalent to ``sorted(values)[:k]``. The float keys pick a candidate
+    set containing every value whose key does not exceed the ``k``-th
+    smallest key; only the candidates are sorted exactly.
+
+    Parameters
+    ----------
+    k : int
+        The number of values to return.
+    values : iterable of Fraction, int or float
+        The values to select from.
+
+    Returns
+    -------
+    list
+        Up to ``k`` values.
+    """
+    values = list(values)
+    if k <= 0 or not values:
+        return []
+    keys = _float_keys(values)
+    threshold = heapq.nsmallest(k, keys)[-1]
+    candidates = [index for index, key in enumerate(keys) if key <= threshold]
+    chosen = [values[index] for index in candidates]
+    return sort(chosen)[:k]
+
+
+def nlargest(
+    k: int,
+    values: Iterable[Number],
+) -> List[Number]:
+    """
+    Returns the ``k`` largest values in descending order.
+
+    Equivalent to ``sorted(values, reverse=True)[:k]``.
+
+    Parameters
+    ----------
+    k : int
+        The number of values to return.
+    values : iterable of Fraction, int or float
+        The values to select from.
+
+    Returns
+    -------
+    list
+        Up to ``k`` values.
+    """
+    values = list(values)
+    if k <= 0 or not values:
+        return []
+    keys = _float_keys(values)
+    threshold = heapq.nlargest(k, keys)[-1]
+    candidates = [index for index, key in enumerate(keys) if key >= threshold]
+    chosen = [values[index] for index in candidates]
+    return sort(chosen, reverse=True)[:k]
+
+
+def min(
+    values: Iterable[Number],
+) -> Number:
+    """
+    Returns the smallest value; the first one among exact ties.
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is empty.
+    """
+    values = list(values)
+    if not values:
+        raise ValueError("min() arg is an empty sequence")
+    keys = _float_keys(values)
+    smallest = builtins.min(keys)
+    return builtins.min(
+        values[index] for index, key in enumerate(keys) if key == smallest
+    )
+
+
+def max(
+    values: Iterable[Number],
+) -> Number:
+    """
+    Returns the largest value; the first one among exact ties.
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is empty.
+    """
+    values = list(values)
+    if not values:
+        raise ValueError("max() arg is an empty sequence")
+    keys = _float_keys(values)
+    largest = builtins.max(keys)
+    return builtins.max(
+        values[index] for index, key in enumerate(keys) if key == largest
+    )
+
+
+def _select(
+    values: List[Number],
+    keys: List[float],
+    ordered_keys: List[float],
+    rank: int,
+) -> Number:
+    """
+    Returns the value of the given rank, comparing exactly only the values
+    whose float key ties with the key at that rank.
+    """
+    target = ordered_keys[rank]
+    below = 0
+    ties = []
+    for index, key in enumerate(keys):
+        if key < target:
+            below += 1
+        elif key == target:
+            ties.append(values[index])
+    return sort(ties)[rank - below]
+
+
+def select(
+    values: Iterable[Number],
+    rank: int,
+) -> Number:
+    """
+    Returns the value at position ``rank`` of the sorted values.
+
+    Parameters
+    ----------
+    values : iterable of Fraction, int or float
+        The values to select from.
+    rank : int
+        The zero-based position in ascending order; negative ranks count
+        from the end.
+
+    Raises
+    ------
+    IndexError
+        If the rank is out of range.
+    """
+    values = list(values)
+    count = len(values)
+    if rank < 0:
+        rank += count
+    if not 0 <= rank < count:
+        raise IndexError("select() rank out of range")
+    keys = _float_keys(values)
+    return _select(values, keys, sorted(keys), rank)
+
+
+def median(
+    values: Iterable[Number],
+) -> Number:
+    """
+    Returns the exact median.
+
+    For an even number of values this is the mean of the two middle values:
+    a Fraction, or a float if either middle value is a float.
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is empty.
+    """
+    values = list(values)
+    count = len(values)
+    if not count:
+        raise ValueError("median() arg is an empty sequence")
+    keys = _float_keys(values)
+    ordered_keys = sorted(keys)
+    middle = count // 2
+    if count % 2:
+        return _select(values, keys, ordered_keys, middle)
+    low = _select(values, keys, ordered_keys, middle - 1)
+    high = _select(values, keys, ordered_keys, middle)
+    if isinstance(low, float) or isinstance(high, float):
+        return (_float_key(low) + _float_key(high)) / 2
+    return Fraction.sum([low, high]) / 2
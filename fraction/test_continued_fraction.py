@@ -0,0 +1,129 @@
+import fractions
+import itertools
+import operator
+import random
+
+import pytest
+
+import continued_fraction
+from continued_fraction import ContinuedFraction
+from fraction import Fraction
+
+
+def sqrt2_terms():
+    yield 1
+    while True:
+        yield 2
+
+
+def test_round_trip_and_repr():
+    x = ContinuedFraction.from_fraction(Fraction(415, 93))
+    assert list(x) == [4, 2, 6, 7]
+    assert repr(x) == "ContinuedFraction([4; 2, 6, 7])"
+    assert x.to_fraction() == Fraction(415, 93)
+    assert list(ContinuedFraction.from_fraction(Fraction(-7, 3))) == [-3, 1, 2]
+    assert list(ContinuedFraction.from_fraction(Fraction(6, -4))) == [-2, 2]
+    assert list(ContinuedFraction.from_fraction(5)) == [5]
+    assert ContinuedFraction([1, 2, 1]).to_fraction() == Fraction(4, 3)
+    # A final term of 1 is folded into the previous one
+    assert list(ContinuedFraction([1, 2, 1])) == [1, 3]
+    assert repr(ContinuedFraction(sqrt2_terms())) == "ContinuedFraction([1; 2, 2, 2, 2, 2, 2, 2, ...])"
+
+    with pytest.raises(ValueError, match="at least one term"):
+        list(ContinuedFraction([]))
+    with pytest.raises(ValueError, match="must be positive"):
+        list(ContinuedFraction([1, 0, 2]))
+    with pytest.raises(TypeError):
+        ContinuedFraction.from_fraction(0.5)
+
+
+@pytest.mark.parametrize("op", [operator.add, operator.sub, operator.mul, operator.truediv])
+def test_arithmetic_matches_fractions(op):
+    rng = random.Random(1147)
+    for _ in range(150):
+        a = Fraction(rng.randint(-(10**12), 10**12), rng.randint(1, 10**9), True)
+        b = Fraction(rng.randint(-(10**6), 10**6) or 1, rng.randint(1, 10**6), True)
+        expected = op(fractions.Fraction(a.numerator, a.denominator), fractions.Fraction(b.numerator, b.denominator))
+        x, y = ContinuedFraction.from_fraction(a), ContinuedFraction.from_fraction(b)
+        for result in (op(x, y), op(x, b), op(a, y)):
+            assert isinstance(result, ContinuedFraction)
+            assert list(result) == list(ContinuedFraction.from_fraction(Fraction(expected.numerator, expected.denominator)))
+            assert result.to_fraction() == expected
+        n = rng.randint(-20, 20)
+        assert op(n, y).to_fraction() == op(n, fractions.Fraction(b.numerator, b.denominator))
+    assert (-ContinuedFraction.from_fraction(Fraction(415, 93))).to_fraction() == Fraction(-415, 93)
+    assert (ContinuedFraction.from_fraction(Fraction(2, 3)) - Fraction(2, 3)).to_fraction() == 0
+
+
+def test_division_by_zero_raises_when_pulled():
+    result = ContinuedFraction.from_fraction(Fraction(1, 2)) / 0
+    with pytest.raises(ValueError, match="Denominator cannot be zero"):
+        result.term(0)
+
+
+def test_source_errors_are_raised_on_every_later_access():
+    def failing():
+        yield from (1, 2, 3)
+        raise RuntimeError("source failed")
+
+    x = ContinuedFraction(failing())
+    assert x.term(0) == 1
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="source failed"):
+            x.term(2)
+        with pytest.raises(RuntimeError, match="source failed"):
+            list(x)
+        with pytest.raises(RuntimeError, match="source failed"):
+            repr(x)
+    # Terms computed before the error are still available
+    assert x.term(0) == 1
+
+
+def test_endless_inputs_are_consumed_lazily():
+    pulled = []
+
+    def counting():
+        for term in sqrt2_terms():
+            pulled.append(term)
+            yield term
+
+    root = ContinuedFraction(counting())
+    assert list(itertools.islice(root * 3, 6)) == [4, 4, 8, 4, 8, 4]
+    assert len(pulled) < 20
+    assert list(itertools.islice(1 / root, 4)) == [0, 1, 2, 2]
+    assert root.approximate(Fraction(1, 10**6)) == Fraction(1393, 985)
+    assert Fraction(141421, 100000) < root < Fraction(141422, 100000)
+    assert root.compare(ContinuedFraction(sqrt2_terms()), max_terms=50) == 0
+
+
+def test_undecided_terms_raise(monkeypatch):
+    monkeypatch.setattr(continued_fraction, "MAX_PENDING_TERMS", 200)
+    root = ContinuedFraction(sqrt2_terms())
+    with pytest.raises(ValueError, match="undecided"):
+        (root * root).term(0)
+
+
+def test_comparisons_match_fractions():
+    rng = random.Random(1147)
+    values = [Fraction(rng.randint(-50, 50), rng.randint(1, 12), True) for _ in range(60)] + [0, 3]
+    for a, b in itertools.product(values[:30], values[30:]):
+        x = ContinuedFraction.from_fraction(a)
+        assert x.compare(b) == (a > b) - (a < b)
+        assert (x < ContinuedFraction.from_fraction(b)) == (a < b)
+        assert (x == b) == (a == b)
+        assert (x >= b) == (a >= b)
+
+
+def test_approximate_stops_early_on_huge_operands():
+    rng = random.Random(1147)
+    x, y, z = (Fraction(rng.getrandbits(20000) | 1, rng.getrandbits(20000) | 1, True) for _ in range(3))
+    exact = (x * y + z) / x
+    cx, cy, cz = (ContinuedFraction.from_fraction(value) for value in (x, y, z))
+    lazy = (cx * cy + cz) / cx
+    tolerance = Fraction(1, 10**20)
+    approximation = lazy.approximate(tolerance)
+    assert abs(approximation - exact) <= tolerance
+    assert approximation.denominator < 10**20
+    assert lazy.convergent(3) == ContinuedFraction.from_fraction(exact).convergent(3)
+    with pytest.raises(ValueError):
+        lazy.approximate(0)
@@ -0,0 +1,112 @@
+import decimal
+import itertools
+import random
+
+import pytest
+
+import expansion
+from fraction import Fraction
+
+
+def decimal_digits(numerator, denominator, count):
+    context = decimal.Context(prec=count + 50)
+    quotient = context.divide(abs(numerator), denominator)
+    text = format(quotient, "f")
+    digits = text.partition(".")[2]
+    return [int(digit) for digit in digits[:count]]
+
+
+def test_iter_digits_is_exact_and_lazy():
+    rng = random.Random(1147)
+    for _ in range(100):
+        numerator = rng.randint(-(2**200), 2**200)
+        denominator = rng.randint(1, 2**150)
+        digits = list(itertools.islice(expansion.iter_digits(Fraction(numerator, denominator)), 300))
+        expected = decimal_digits(numerator, denominator, 300)
+        assert digits == expected
+
+    assert list(expansion.iter_digits(Fraction(3, 8))) == [3, 7, 5]
+    assert list(expansion.iter_digits(Fraction(-5, 2))) == [5]
+    assert list(expansion.iter_digits(7)) == []
+    # Terminates exactly after a full block
+    assert list(expansion.iter_digits(Fraction(1, 2**64))) == [int(d) for d in str(5**64).zfill(64)]
+    third = expansion.iter_digits(Fraction(1, 3))
+    assert list(itertools.islice(third, 1000)) == [3] * 1000
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (Fraction(1, 3), "0.(3)"),
+        (Fraction(-7, 6), "-1.1(6)"),
+        (Fraction(1, 7), "0.(142857)"),
+        (Fraction(3, 8), "0.375"),
+        (Fraction(22, 7), "3.(142857)"),
+        (Fraction(1, 12), "0.08(3)"),
+        (Fraction(-1, 2), "-0.5"),
+        (Fraction(5, 1), "5"),
+        (Fraction(0, 4), "0"),
+        (Fraction(2, -4), "-0.5"),
+        (-12, "-12"),
+        (Fraction(1, 81), "0.(012345679)"),
+    ],
+)
+def test_to_repeating_string(value, expected):
+    assert expansion.to_repeating_string(value) == expected
+
+
+def test_expand_round_trips_through_from_string():
+    rng = random.Random(1147)
+    for _ in range(300):
+        denominator = rng.choice(
+            [rng.randint(1, 3000), 2 ** rng.randint(0, 40) * 5 ** rng.randint(0, 40) * rng.randint(1, 300)]
+        )
+        value = Fraction(rng.randint(-(10**30), 10**30), denominator, True)
+        result = expansion.expand(value)
+        parsed = Fraction.from_string(str(result))
+        assert (parsed.numerator, parsed.denominator) == (value.numerator, value.denominator)
+        assert result.negative == (value.numerator < 0)
+
+
+def test_expand_max_digits():
+    assert expansion.expand(Fraction(1, 7), max_digits=6).repetend == "142857"
+    with pytest.raises(ValueError, match="longer than 5 digits"):
+        expansion.expand(Fraction(1, 7), max_digits=5)
+    # A terminating expansion never searches for a cycle
+    assert expansion.expand(Fraction(1, 2**200), max_digits=1).repetend == ""
+    with pytest.raises(TypeError):
+        expansion.expand(0.5)
+
+
+def test_to_fixed_matches_decimal_for_every_rounding_mode():
+    rng = random.Random(1147)
+    values = [Fraction(rng.randint(-(10**40), 10**40), rng.randint(1, 10**12)) for _ in range(200)]
+    # Exact ties at the last place
+    values += [Fraction(n, 2000) for n in range(-30, 30)]
+    for rounding in expansion.ROUNDING_MODES:
+        for places in (0, 1, 3, 25):
+            texts = expansion.to_fixed_many(values, places, rounding)
+            for value, text in zip(values, texts):
+                context = decimal.Context(prec=200, rounding=rounding)
+                quotient = context.divide(decimal.Decimal(value.numerator), value.denominator)
+                expected = format(context.quantize(quotient, decimal.Decimal(1).scaleb(-places)), "f")
+                # Results that round to zero carry no sign
+                if not expected.strip("-0."):
+                    expected = expected.lstrip("-")
+                assert text == expected, (value, places, rounding)
+                assert expansion.to_fixed(value, places, rounding) == text
+
+
+def test_to_fixed_formatting_and_errors():
+    assert expansion.to_fixed(Fraction(2, 3), 5) == "0.66667"
+    assert expansion.to_fixed(Fraction(-1, 3), 2) == "-0.33"
+    assert expansion.to_fixed(Fraction(-1, 1000), 2) == "0.00"
+    assert expansion.to_fixed(Fraction(5, 2), 0) == "2"
+    assert expansion.to_fixed(Fraction(7, 2), 0) == "4"
+    assert expansion.to_fixed(12, 3) == "12.000"
+    assert expansion.to_fixed(Fraction(10**50 + 1, 10**50), 52) == "1." + "0" * 49 + "100"
+    assert expansion.to_fixed_many([], 3) == []
+    with pytest.raises(ValueError):
+        expansion.to_fixed(Fraction(1, 2), -1)
+    with pytest.raises(ValueError):
+        expansion.to_fixed_many([Fraction(1, 2)], 2, "ROUND_SIDEWAYS")
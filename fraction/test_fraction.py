@@ -1,6 +1,22 @@
 import pytest
+import copy
+import fractions
 import math
-from fraction import Fraction
+import operator
+import pickle
+import random
+from fraction import (
+    EAGER,
+    LAZY,
+    Fraction,
+    Instrumentation,
+    InternPool,
+    OperationCache,
+    interning,
+    memoizing,
+    normalization,
+    profiling,
+)
 
 def test_fraction_initialization():
     """
@@ -1143,6 +1159,819 @@ def test_fraction_ipow_method():
     assert x == Fraction(1024, 59049)
 
 
+def test_fraction_slots_layout():
+    frac = Fraction(1, 2)
+    assert not hasattr(frac, "__dict__")
+    with pytest.raises(AttributeError):
+        frac.extra = 1
+
+    # Public attributes are read-only
+    with pytest.raises(AttributeError):
+        frac.numerator = 3
+    with pytest.raises(AttributeError):
+        frac.denominator = 3
+    assert frac.numerator == 1
+    assert frac.denominator == 2
+
+
+def test_fraction_inplace_does_not_mutate_aliases():
+    x = Fraction(1, 2)
+    alias = x
+    x += Fraction(1, 3)
+    assert x == Fraction(5, 6)
+    assert alias.numerator == 1
+    assert alias.denominator == 2
+
+    x = Fraction(2, 3)
+    alias = x
+    x *= Fraction(3, 4)
+    x -= Fraction(1, 4)
+    x /= Fraction(1, 2)
+    x **= 2
+    assert x == Fraction(1, 4)
+    assert alias.numerator == 2
+    assert alias.denominator == 3
+
+
+def test_fraction_hash_method():
+    assert hash(Fraction(1, 2)) == hash(Fraction(2, 4))
+    assert hash(Fraction(-1, 2)) == hash(Fraction(1, -2))
+    assert hash(Fraction(4, 2)) == hash(2)
+    assert hash(Fraction(0, 5)) == hash(0)
+    assert hash(Fraction(-3, 1)) == hash(-3)
+    assert len({Fraction(1, 3), Fraction(2, 6), Fraction(-1, -3)}) == 1
+
+    # Hashing does not rewrite the representation
+    frac = Fraction(5, -10)
+    hash(frac)
+    assert frac.numerator == 5
+    assert frac.denominator == -10
+
+
+def test_fraction_as_integer_ratio_method():
+    assert Fraction(4, 8).as_integer_ratio() == (1, 2)
+    assert Fraction(5, -10).as_integer_ratio() == (-1, 2)
+    assert Fraction(0, 7).as_integer_ratio() == (0, 1)
+    assert Fraction(3, 1).as_integer_ratio() == (3, 1)
+
+
+def test_fraction_lazy_normalization():
+    with normalization(LAZY, threshold=64):
+        result = Fraction(1, 4) + Fraction(1, 4)
+        # The gcd is deferred, so the parts are not yet reduced
+        assert (result._numerator, result._denominator) == (2, 4)
+        assert not result._normalized
+
+        # Observing the value reduces it
+        assert str(result) == "1/2"
+        assert result._normalized
+        # Reading the parts does too, so they always match str()
+        pending = Fraction(1, 2) + Fraction(1, 6)
+        assert (pending.numerator, pending.denominator) == (2, 3)
+        assert str(pending) == "2/3"
+
+        # Comparisons, hashing and export settle pending results
+        product = Fraction(2, 3) * Fraction(3, 4)
+        assert product == Fraction(1, 2)
+        assert (product.numerator, product.denominator) == (1, 2)
+        assert hash(Fraction(1, 3) + Fraction(1, 6)) == hash(Fraction(1, 2))
+        assert (Fraction(1, 6) * 3).as_integer_ratio() == (1, 2)
+        assert (Fraction(3, 4) - Fraction(1, 4)).to_decimal() == 0.5
+
+        # Negative denominators are still fixed up immediately
+        quotient = Fraction(1, 2) / Fraction(-1, 3)
+        assert quotient.denominator > 0
+
+        # Results below the threshold keep their unreduced parts
+        small = Fraction(1, 2**20) + Fraction(1, 2**10)
+        assert (small._numerator, small._denominator) == (2**10 + 2**20, 2**30)
+
+        # Crossing the threshold triggers a reduction
+        large = Fraction(1, 2**40) + Fraction(1, 2**30)
+        assert large._normalized
+        assert (large._numerator, large._denominator) == (1025, 2**40)
+    assert Fraction.normalization == EAGER
+
+
+def test_fraction_set_normalization():
+    previous = Fraction.set_normalization(LAZY, 128)
+    try:
+        assert previous == (EAGER, 512)
+        assert Fraction.normalization == LAZY
+        assert Fraction.normalization_threshold == 128
+        # Keeps the threshold when omitted
+        Fraction.set_normalization(LAZY)
+        assert Fraction.normalization_threshold == 128
+    finally:
+        Fraction.set_normalization(*previous)
+    assert (Fraction.normalization, Fraction.normalization_threshold) == previous
+
+    with pytest.raises(ValueError, match=r"Unknown normalization policy"):
+        Fraction.set_normalization("sometimes")
+    with pytest.raises(ValueError, match=r"threshold cannot be negative"):
+        Fraction.set_normalization(LAZY, -1)
+
+
+def test_fraction_reduced_arithmetic_matches_stdlib():
+    rng = random.Random(1147)
+    for bits in (8, 64, 300):
+        for _ in range(200):
+            a = rng.randint(-(2**bits), 2**bits)
+            b = rng.randint(1, 2**bits) * rng.choice((1, 6, 30))
+            c = rng.randint(-(2**bits), 2**bits) or 1
+            d = rng.randint(1, 2**bits) * rng.choice((1, 10, 42))
+            expected_x = fractions.Fraction(a, b)
+            expected_y = fractions.Fraction(c, d)
+            # Reduced operands take the fast path, raw ones the fallback
+            for x, y in (
+                (Fraction(a, b, True), Fraction(c, d, True)),
+                (Fraction(a, b), Fraction(c, -d)),
+            ):
+                if y.denominator < 0:
+                    expected = (expected_x, -expected_y)
+                else:
+                    expected = (expected_x, expected_y)
+                for result, reference in (
+                    (x + y, expected[0] + expected[1]),
+                    (x - y, expected[0] - expected[1]),
+                    (x * y, expected[0] * expected[1]),
+                    (x / y, expected[0] / expected[1]),
+                ):
+                    assert result.numerator == reference.numerator
+                    assert result.denominator == reference.denominator
+
+
+def test_fraction_from_reduced_constructor():
+    frac = Fraction._from_reduced(3, 4)
+    assert frac.numerator == 3
+    assert frac.denominator == 4
+    assert frac == Fraction(3, 4)
+    assert str(frac) == "3/4"
+
+
+def test_fraction_arithmetic_unsupported_types():
+    frac = Fraction(1, 2)
+    with pytest.raises(TypeError, match=r"Unsupported operand types for -: 'Fraction' and 'str'"):
+        frac - "test"
+    with pytest.raises(TypeError, match=r"Unsupported operand types for \*: 'Fraction' and 'float'"):
+        frac * 1.5
+    with pytest.raises(TypeError, match=r"Unsupported operand types for /: 'Fraction' and 'list'"):
+        frac / []
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        Fraction(1, 2) / 0
+
+
+def test_fraction_sum_method():
+    assert Fraction.sum([Fraction(1, 4), Fraction(1, 4), Fraction(1, 6)]) == Fraction(2, 3)
+    result = Fraction.sum([Fraction(1, 4), Fraction(1, 4)])
+    assert result.numerator == 1
+    assert result.denominator == 2
+
+    # Empty input, ints, negative denominators and unreduced terms
+    assert Fraction.sum([]) == 0
+    assert Fraction.sum(iter([1, 2, Fraction(1, -2)])) == Fraction(5, 2)
+    result = Fraction.sum([Fraction(2, 4), Fraction(-1, -4), Fraction(1, -4)])
+    assert (result.numerator, result.denominator) == (1, 2)
+    result = Fraction.sum([Fraction(1, 3), Fraction(-1, 3)])
+    assert (result.numerator, result.denominator) == (0, 1)
+
+    # Matches the standard library on many mixed denominators
+    rng = random.Random(1147)
+    pairs = [(rng.randint(-10**6, 10**6), rng.randint(1, 60)) for _ in range(2000)]
+    expected = sum(fractions.Fraction(a, b) for a, b in pairs)
+    result = Fraction.sum(Fraction(a, b) for a, b in pairs)
+    assert (result.numerator, result.denominator) == (expected.numerator, expected.denominator)
+
+    with pytest.raises(TypeError, match=r"Unsupported operand types for \+: 'Fraction' and 'float'"):
+        Fraction.sum([Fraction(1, 2), 0.5])
+
+
+def test_fraction_prod_method():
+    assert Fraction.prod([Fraction(2, 3), 3, Fraction(1, -4)]) == Fraction(-1, 2)
+    result = Fraction.prod([Fraction(2, 4), Fraction(4, 6)])
+    assert (result.numerator, result.denominator) == (1, 3)
+    assert Fraction.prod([]) == 1
+    result = Fraction.prod([Fraction(5, 7), Fraction(0, 9), Fraction(3, 2)])
+    assert (result.numerator, result.denominator) == (0, 1)
+
+    rng = random.Random(1147)
+    pairs = [(rng.randint(1, 1000), rng.randint(1, 1000)) for _ in range(500)]
+    expected = fractions.Fraction(1)
+    for a, b in pairs:
+        expected *= fractions.Fraction(a, b)
+    result = Fraction.prod(Fraction(a, b) for a, b in pairs)
+    assert (result.numerator, result.denominator) == (expected.numerator, expected.denominator)
+
+    with pytest.raises(TypeError, match=r"Unsupported operand types for \*: 'Fraction' and 'str'"):
+        Fraction.prod(["2"])
+
+
+def test_fraction_sum_and_prod_of_parts():
+    rng = random.Random(1147)
+    pairs = [(rng.randint(-1000, 1000), rng.choice([-4, 3, 8, rng.randint(1, 10**6)])) for _ in range(500)]
+    numerators, denominators = (list(parts) for parts in zip(*pairs))
+    values = [Fraction(a, b) for a, b in pairs]
+    for method, parts_method in ((Fraction.sum, Fraction.sum_parts), (Fraction.prod, Fraction.prod_parts)):
+        expected = method(values)
+        result = parts_method(numerators, denominators)
+        assert (result.numerator, result.denominator) == (expected.numerator, expected.denominator)
+
+    unreduced = Fraction.sum_parts([1, 1], [4, 4], simplify=False)
+    assert (unreduced.numerator, unreduced.denominator) == (2, 4)
+    assert Fraction.sum_parts([], []) == 0
+    assert Fraction.prod_parts(iter([]), iter([])) == 1
+    assert Fraction.prod_parts([2, 0], [3, 5]).as_integer_ratio() == (0, 1)
+
+
+def test_fraction_pickle_and_copy():
+    for frac in (Fraction(1, 2), Fraction(6, -8), Fraction(2**80, 3, True)):
+        for clone in (pickle.loads(pickle.dumps(frac)), copy.copy(frac), copy.deepcopy(frac)):
+            assert clone.numerator == frac.numerator
+            assert clone.denominator == frac.denominator
+
+    # Pickles hold only the constructor arguments
+    third = Fraction(1, 3, True)
+    assert len(pickle.dumps(third)) <= len(pickle.dumps(fractions.Fraction(1, 3)))
+    assert pickle.loads(pickle.dumps(third)).as_integer_ratio() == (1, 3)
+    unreduced = pickle.loads(pickle.dumps(Fraction(2, 4)))
+    assert (unreduced.numerator, unreduced.denominator) == (2, 4)
+
+
+def test_fraction_interning():
+    with interning(capacity=8, max_part=100) as pool:
+        assert Fraction.intern_pool is pool
+        half = Fraction(1, 2)
+        assert Fraction(1, 2) is half
+        assert Fraction(2, 4, True) is half
+        assert Fraction(1, 4) + Fraction(1, 4) is half
+        assert Fraction(3, 4) * Fraction(2, 3) is half
+
+        # Unreduced and out-of-range fractions are never shared
+        unreduced = Fraction(2, 4)
+        assert unreduced.numerator == 2
+        assert unreduced is not Fraction(2, 4)
+        assert Fraction(1, 1000) is not Fraction(1, 1000)
+
+        stats = pool.stats()
+        assert stats["hits"] >= 4
+        assert stats["size"] <= 8
+
+        # The pool is bounded and evicts its oldest entries
+        for denominator in range(2, 30):
+            Fraction(1, denominator)
+        assert len(pool) == 8
+        assert pool.evictions > 0
+        assert Fraction(1, 29) is Fraction(1, 29)
+
+        pool.clear()
+        assert len(pool) == 0
+        assert pool.stats()["hits"] == 0
+    assert Fraction.intern_pool is None
+    assert Fraction(1, 2) is not Fraction(1, 2)
+
+
+def test_fraction_intern_pool_counts_each_construction_once():
+    with interning() as pool:
+        Fraction(1, 3)
+        Fraction(1, 3)
+        stats = pool.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+        # Non-int parts are never swapped for a pooled instance
+        two = Fraction(2, 1)
+        assert Fraction(2, 1) is two
+        converted = Fraction(2.0, 1)
+        assert converted is not two
+        assert converted.numerator.__class__ is float
+        assert Fraction(2, 1.0) is not two
+
+
+def test_fraction_intern_pool_validation():
+    with pytest.raises(ValueError, match=r"capacity must be positive"):
+        InternPool(capacity=0)
+    with pytest.raises(ValueError, match=r"max_part cannot be negative"):
+        InternPool(max_part=-1)
+
+    pool = InternPool()
+    previous = Fraction.set_intern_pool(pool)
+    try:
+        assert previous is None
+        assert Fraction(3, 5) is Fraction(3, 5)
+    finally:
+        Fraction.set_intern_pool(previous)
+
+
+def test_fraction_operation_cache():
+    with memoizing(capacity=4) as cache:
+        assert Fraction.operation_cache is cache
+        x = Fraction(3, 7)
+        y = Fraction(7, 9)
+        first = x * y
+        assert first == Fraction(1, 3)
+        # Repeated and commuted operands hit the same entry
+        assert x * y is first
+        assert y * x is first
+        assert (x + y) == Fraction(76, 63)
+        assert (x - y) == Fraction(-22, 63)
+        assert (x / y) == Fraction(27, 49)
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 4
+        assert stats["operators"]["*"] == {"hits": 2, "misses": 1}
+        assert stats["hit_rate"] == pytest.approx(2 / 6)
+
+        # Capacity is enforced by evicting the least recently used result
+        x * y
+        Fraction(1, 2) + Fraction(1, 3)
+        assert len(cache) == 4
+        assert cache.evictions == 1
+        assert x * y is first
+
+        # Errors are not cached
+        with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+            x / Fraction(0, 1)
+
+        # Unreduced operands bypass the cache but stay correct
+        assert Fraction(2, 4) * Fraction(2, 3) == Fraction(1, 3)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+    assert Fraction.operation_cache is None
+
+
+def test_fraction_operation_cache_operator_switch():
+    cache = OperationCache(capacity=16, operators=("/",))
+    previous = Fraction.set_operation_cache(cache)
+    try:
+        Fraction(1, 2) * Fraction(1, 3)
+        Fraction(1, 2) / Fraction(1, 3)
+        Fraction(1, 2) / Fraction(1, 3)
+        assert cache.stats()["operators"]["*"] == {"hits": 0, "misses": 0}
+        assert cache.stats()["operators"]["/"] == {"hits": 1, "misses": 1}
+
+        cache.enable("*")
+        Fraction(1, 2) * Fraction(1, 3)
+        assert cache.stats()["operators"]["*"]["misses"] == 1
+
+        cache.disable("/")
+        assert len(cache) == 1
+        Fraction(1, 2) / Fraction(1, 3)
+        assert cache.stats()["operators"]["/"] == {"hits": 1, "misses": 1}
+    finally:
+        Fraction.set_operation_cache(previous)
+
+    with pytest.raises(ValueError, match=r"Unknown operator"):
+        OperationCache(operators=("%",))
+    with pytest.raises(ValueError, match=r"capacity must be positive"):
+        OperationCache(capacity=0)
+
+
+def test_fraction_rich_comparisons_match_stdlib():
+    rng = random.Random(1147)
+    for bits in (4, 60, 200, 3000):
+        for _ in range(300):
+            a = rng.randint(-(2**bits), 2**bits)
+            b = rng.choice((1, -1)) * rng.randint(1, 2**rng.randint(1, bits))
+            if rng.random() < 0.2:
+                c, d = a * 3, b * 3  # equal values, different representation
+            else:
+                c = rng.randint(-(2**bits), 2**bits)
+                d = rng.choice((1, -1)) * rng.randint(1, 2**rng.randint(1, bits))
+            x, y = Fraction(a, b), Fraction(c, d)
+            fx, fy = fractions.Fraction(a, b), fractions.Fraction(c, d)
+            assert (x == y) == (fx == fy)
+            assert (x != y) == (fx != fy)
+            assert (x < y) == (fx < fy)
+            assert (x <= y) == (fx <= fy)
+            assert (x > y) == (fx > fy)
+            assert (x >= y) == (fx >= fy)
+            # Reduced operands use component equality
+            assert (Fraction(a, b, True) == Fraction(c, d, True)) == (fx == fy)
+
+
+def test_fraction_comparisons_with_int_and_float():
+    half = Fraction(1, 2)
+    assert half > 0
+    assert half >= Fraction(2, 4)
+    assert 1 > half
+    assert 0 < half
+    assert Fraction(-6, -3) == 2
+    assert 2 == Fraction(-6, -3)
+    assert Fraction(7, -2) < -3
+
+    # Floats compare exactly, through the float value when it decides
+    assert half == 0.5
+    assert 0.5 == half
+    assert Fraction(1, 3) != 1 / 3
+    assert Fraction(1, 3) > 1 / 3
+    assert Fraction(1, 10) < 0.1
+    assert Fraction(3602879701896397, 36028797018963968) == 0.1
+    assert Fraction(-1, 4) > -0.3
+    assert Fraction(10**400, 3) > 1e308
+    assert Fraction(-(10**400), 3) < -1e308
+
+    # Non-finite floats
+    assert half < math.inf
+    assert half > -math.inf
+    assert not half == math.nan
+    assert half != math.nan
+    assert not half < math.nan
+    assert not half >= math.nan
+
+    # Other rationals and unrelated types
+    assert Fraction(1, 3) == fractions.Fraction(2, 6)
+    assert Fraction(1, 3) < fractions.Fraction(1, 2)
+    assert half != "1/2"
+    with pytest.raises(TypeError):
+        half < "1/2"
+
+    # Equal values hash alike across types
+    assert hash(half) == hash(0.5) == hash(fractions.Fraction(1, 2))
+
+
+def test_from_float_is_exact():
+    for value in (0.29, 0.1, -2.5, 1e-300, 1.7976931348623157e308, 0.0, 3):
+        result = Fraction.from_float(value)
+        assert result.as_integer_ratio() == fractions.Fraction(value).as_integer_ratio()
+        assert result == value
+    assert Fraction.from_float(0.5) is not Fraction.from_float(0.5)
+
+    for value in (math.nan, math.inf, -math.inf):
+        with pytest.raises(ValueError, match=r"Cannot convert"):
+            Fraction.from_float(value)
+    with pytest.raises(TypeError, match=r"only accepts floats"):
+        Fraction.from_float("0.5")
+
+
+def test_limit_denominator_matches_stdlib():
+    assert Fraction.from_float(0.29).limit_denominator(100) == Fraction(29, 100)
+    assert Fraction.from_float(math.pi).limit_denominator(1000).as_integer_ratio() == (355, 113)
+    assert Fraction(3, 7).limit_denominator(7).as_integer_ratio() == (3, 7)
+    assert Fraction(-22, 7).limit_denominator(1).as_integer_ratio() == (-3, 1)
+
+    rng = random.Random(1010)
+    for _ in range(500):
+        numerator = rng.randint(-(10**12), 10**12)
+        denominator = rng.randint(1, 10**12)
+        bound = rng.choice([1, 2, 10, 1000, rng.randint(1, 10**6)])
+        expected = fractions.Fraction(numerator, denominator).limit_denominator(bound)
+        result = Fraction(numerator, denominator).limit_denominator(bound)
+        assert result.as_integer_ratio() == expected.as_integer_ratio()
+
+    with pytest.raises(ValueError, match=r"at least 1"):
+        Fraction(1, 3).limit_denominator(0)
+
+
+def test_from_floats():
+    values = [0.29, 0.1, 0.29, -1.25]
+    assert Fraction.from_floats(values) == [Fraction.from_float(value) for value in values]
+    limited = Fraction.from_floats(values, max_denominator=100)
+    assert [value.as_integer_ratio() for value in limited] == [(29, 100), (1, 10), (29, 100), (-5, 4)]
+    assert Fraction.from_floats([]) == []
+    with pytest.raises(ValueError, match=r"at least 1"):
+        Fraction.from_floats(values, max_denominator=0)
+    with pytest.raises(ValueError, match=r"Cannot convert"):
+        Fraction.from_floats([0.5, math.nan])
+
+
+def test_from_string():
+    cases = {
+        "6/8": (3, 4),
+        "-7/3": (-7, 3),
+        " +42 ": (42, 1),
+        "0/5": (0, 1),
+        "1.25": (5, 4),
+        ".5": (1, 2),
+        "-0.0": (0, 1),
+        "1.5e-3": (3, 2000),
+        "-2.5E2": (-250, 1),
+        "0.1(6)": (1, 6),
+        "0.(142857)": (1, 7),
+        "1.(3)": (4, 3),
+        "-0.0(3)e1": (-1, 3),
+    }
+    for text, expected in cases.items():
+        result = Fraction.from_string(text)
+        assert (result.numerator, result.denominator) == expected
+        assert result.as_integer_ratio() == expected
+
+    for text in ("6/8", "1.25", "-2.5E2", "1e-20"):
+        assert Fraction.from_string(text) == fractions.Fraction(text)
+
+    for text in ("", "abc", "1/-2", "1 /2", "(3)", "1.2.3", "1/2/3", ".e1"):
+        with pytest.raises(ValueError, match=r"Invalid literal for Fraction"):
+            Fraction.from_string(text)
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        Fraction.from_string("1/0")
+    with pytest.raises(TypeError, match=r"only accepts str"):
+        Fraction.from_string(b"1/2")
+
+
+def test_profiling_counts_calls_gcds_and_sizes():
+    originals = {name: vars(Fraction)[name] for name in ("__new__", "__add__", "__lt__", "simplify")}
+    with profiling() as stats:
+        assert Fraction.instrumentation is stats
+        x = Fraction(1, 3) + Fraction(1, 6)
+        x += 2
+        assert x < Fraction(2**40, 3, True)
+        Fraction(6, 8, True)
+    # The original methods are restored on exit
+    assert Fraction.instrumentation is None
+    assert {name: vars(Fraction)[name] for name in originals} == originals
+
+    assert stats.calls["__add__"] == 2
+    assert stats.calls["__iadd__"] == 1
+    assert stats.calls["__lt__"] == 1
+    assert stats.calls["__new__"] == 4
+    assert stats.calls["simplify"] == 2
+    assert stats.gcd_calls > 0
+    assert sum(stats.gcd_bits.values()) == stats.gcd_calls
+    # 2**40 is an operand of __new__, simplify and __lt__
+    assert stats.operand_bits[64] == 3
+    assert stats.result_bits[4] >= 3
+
+    snapshot = stats.stats()
+    assert snapshot["calls"]["__add__"] == 2
+    assert snapshot["operand_bits"]["64"] == 3
+    assert list(snapshot["gcd_bits"]) == sorted(snapshot["gcd_bits"], key=int)
+
+    stats.clear()
+    assert stats.stats() == {"calls": {}, "gcd_calls": 0, "gcd_bits": {}, "operand_bits": {}, "result_bits": {}}
+
+
+def test_instrumentation_callbacks_and_nesting():
+    seen = []
+    recorder = Instrumentation()
+    recorder.add_callback(lambda name, args, result: seen.append((name, result)))
+    previous = Fraction.set_instrumentation(recorder)
+    try:
+        half = Fraction(1, 4) * 2
+        with profiling() as inner:
+            half * half
+        # The outer recorder is reinstalled after the inner block
+        assert Fraction.instrumentation is recorder
+        assert inner.calls["__mul__"] == 1
+        assert recorder.calls["__mul__"] == 1
+    finally:
+        Fraction.set_instrumentation(previous)
+    assert ("__mul__", Fraction(1, 2)) in seen
+    recorder.remove_callback(recorder._callbacks[0])
+    with pytest.raises(ValueError):
+        recorder.remove_callback(print)
+
+
+def test_int_operands_match_stdlib():
+    rng = random.Random(17)
+    ops = [
+        lambda x, n: x + n,
+        lambda x, n: n + x,
+        lambda x, n: x - n,
+        lambda x, n: n - x,
+        lambda x, n: x * n,
+        lambda x, n: n * x,
+        lambda x, n: x / n,
+        lambda x, n: n / x,
+    ]
+    for _ in range(300):
+        a = rng.randint(-10**6, 10**6)
+        b = rng.randint(1, 10**6)
+        n = rng.choice([0, 1, -1, rng.randint(-10**6, 10**6), rng.randint(-50, 50) * b])
+        ours, theirs = Fraction(a, b, True), fractions.Fraction(a, b)
+        for op in ops:
+            try:
+                expected = op(theirs, n)
+            except ZeroDivisionError:
+                with pytest.raises(ValueError, match="Denominator cannot be zero"):
+                    op(ours, n)
+                continue
+            result = op(ours, n)
+            assert isinstance(result, Fraction)
+            assert (result.numerator, result.denominator) == (expected.numerator, expected.denominator)
+            assert result._normalized
+
+
+def test_int_operands_use_at_most_one_gcd():
+    x = Fraction(6, 35, True)
+    for op, calls in [
+        (lambda: x + 7, 0),
+        (lambda: 7 - x, 0),
+        (lambda: x * 14, 1),
+        (lambda: 10 / x, 1),
+        (lambda: x / 9, 1),
+    ]:
+        with profiling() as stats:
+            op()
+        assert stats.gcd_calls == calls
+
+
+def test_numpy_integer_operands():
+    np = pytest.importorskip("numpy")
+    x = Fraction(3, 4)
+    for n in (np.int64(6), np.int8(-3), np.uint16(4)):
+        expected = fractions.Fraction(3, 4)
+        m = int(n)
+        for ours, theirs in [
+            (x + n, expected + m),
+            (n + x, m + expected),
+            (x - n, expected - m),
+            (n - x, m - expected),
+            (x * n, expected * m),
+            (n * x, m * expected),
+            (x / n, expected / m),
+            (n / x, m / expected),
+        ]:
+            assert isinstance(ours, Fraction)
+            assert (ours.numerator, ours.denominator) == (theirs.numerator, theirs.denominator)
+
+
+def test_numpy_integer_comparisons():
+    np = pytest.importorskip("numpy")
+    assert Fraction(2, 1) == np.int64(2)
+    assert Fraction(4, 2) == np.int64(2)
+    assert not Fraction(1, 2) == np.int64(1)
+    assert Fraction(1, 2) != np.int64(1)
+    assert Fraction(1, 2) < np.int64(1)
+    assert Fraction(-1, 2) <= np.int8(0)
+    assert Fraction(7, 2) > np.uint16(3)
+    assert Fraction(6, 2) >= np.int64(3)
+
+
+def test_fraction_comparisons_of_mixed_sign_big_parts():
+    big = 2**100
+    for a, b, c, d in [(-1, 3, big, 7), (big + 1, big, -1, 1), (-big, 1, -1, big), (1, big, 1, big + 1)]:
+        expected = fractions.Fraction(a, b) < fractions.Fraction(c, d)
+        assert (Fraction(a, b) < Fraction(c, d)) == expected
+        assert (Fraction(a, b) == Fraction(c, d)) == (fractions.Fraction(a, b) == fractions.Fraction(c, d))
+
+
+def test_reflected_operators_reject_other_types():
+    with pytest.raises(TypeError):
+        "1" - Fraction(1, 2)
+    with pytest.raises(TypeError):
+        [1] * Fraction(1, 2)
+    with pytest.raises(TypeError):
+        None / Fraction(1, 2)
+
+    # The reflected methods return NotImplemented, so Python reports the
+    # operands in their written order
+    class Other:
+        pass
+
+    half = Fraction(1, 2)
+    for op, symbol in [
+        (operator.add, r"\+"),
+        (operator.sub, "-"),
+        (operator.mul, r"\*"),
+        (operator.truediv, "/"),
+        (operator.floordiv, "//"),
+        (operator.mod, "%"),
+        (divmod, r"divmod\(\)"),
+    ]:
+        with pytest.raises(TypeError, match=rf"for {symbol}: 'Other' and 'Fraction'"):
+            op(Other(), half)
+    for name in ("__radd__", "__rsub__", "__rmul__", "__rtruediv__", "__rfloordiv__", "__rmod__", "__rdivmod__"):
+        assert getattr(half, name)("1") is NotImplemented
+
+
+def test_pow_matches_stdlib_without_gcd():
+    rng = random.Random(1147)
+    for _ in range(200):
+        a = rng.randint(-(10**12), 10**12) or 1
+        b = rng.randint(1, 10**12)
+        k = rng.randint(-12, 12)
+        ours, theirs = Fraction(a, b, True), fractions.Fraction(a, b)
+        with profiling() as stats:
+            result = ours**k
+        expected = theirs**k
+        assert (result.numerator, result.denominator) == (expected.numerator, expected.denominator)
+        assert result._normalized
+        assert stats.gcd_calls == 0
+
+    # Unreduced bases and the lazy policy still give the right value
+    assert Fraction(-6, 4) ** -3 == Fraction(-8, 27)
+    with normalization(LAZY):
+        assert Fraction(2, 4) ** -2 == Fraction(4, 1)
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        Fraction(0, 1) ** -1
+    with pytest.raises(TypeError):
+        Fraction(1, 2) ** 0.5
+
+
+def test_pow_with_modulus():
+    for a, b, k, m in [(2, 3, 5, 7), (2, 3, -1, 7), (-5, 4, 3, 11), (7, 9, 0, 13), (1, 2, 100, 10**9 + 7)]:
+        expected = pow(a, k, m) * pow(b, -k, m) % m
+        assert pow(Fraction(a, b), k, m) == expected
+    # 2/3 is 3 modulo 7, since 3 * 3 = 9 = 2 modulo 7
+    assert pow(Fraction(2, 3), 1, 7) == 3
+    with pytest.raises(ValueError, match=r"no power"):
+        pow(Fraction(1, 2), 1, 4)
+
+
+def test_operation_cache_reuses_neighbouring_powers(monkeypatch):
+    import fraction
+
+    computed = []
+    original = fraction._pow_reduced
+    monkeypatch.setattr(fraction, "_pow_reduced", lambda a, b, k, _=1: computed.append(k) or original(a, b, k))
+    rate = Fraction(20, 21)
+    with memoizing(operators=("**",)) as cache:
+        factors = [rate**k for k in range(1, 31)]
+        assert factors == [Fraction(20**k, 21**k) for k in range(1, 31)]
+        assert all(factor._normalized for factor in factors)
+        # Only the first power was computed from scratch
+        assert computed == [1]
+        assert rate**7 is factors[6]
+        assert cache.stats()["operators"]["**"] == {"hits": 1, "misses": 30}
+
+        inverse = [Fraction(-2, 3) ** -k for k in range(1, 6)]
+        assert inverse == [fractions.Fraction(-3, 2) ** k for k in range(1, 6)]
+        assert computed == [1, -1]
+
+
+def test_floor_ceil_round_are_exact_beyond_float_precision():
+    x = Fraction(10**20 + 1, 10)
+    assert math.floor(x) == Fraction(10**19, 1)
+    assert math.ceil(x) == Fraction(10**19 + 1, 1)
+    assert round(x) == Fraction(10**19, 1)
+    assert math.floor(Fraction(-(2**60) - 1, 2)) == Fraction(-(2**59) - 1, 1)
+    # Unreduced fractions with a negative denominator
+    assert math.floor(Fraction(7, -2)) == Fraction(-4, 1)
+    assert math.ceil(Fraction(7, -2)) == Fraction(-3, 1)
+    assert round(Fraction(5, -2)) == Fraction(-2, 1)
+
+    rng = random.Random(1147)
+    for _ in range(300):
+        a = rng.randint(-(2**200), 2**200)
+        b = rng.randint(1, 2**100) * rng.choice((1, 2, 10))
+        ours, theirs = Fraction(a, b), fractions.Fraction(a, b)
+        assert math.floor(ours) == math.floor(theirs)
+        assert math.ceil(ours) == math.ceil(theirs)
+        assert round(ours) == round(theirs)
+        for ndigits in (-3, 0, 2, 40):
+            assert round(ours, ndigits) == round(theirs, ndigits)
+
+
+def test_round_ties_to_even():
+    assert [round(Fraction(n, 2)) for n in range(-5, 6)] == [round(n / 2) for n in range(-5, 6)]
+    assert round(Fraction(125, 1000), 2) == Fraction(3, 25)
+    assert round(Fraction(135, 1000), 2) == Fraction(7, 50)
+    assert round(Fraction(-1250, 1), -2) == Fraction(-1200, 1)
+    assert round(Fraction(1, 3), 2) == Fraction(33, 100)
+
+
+def test_floordiv_mod_divmod_match_stdlib():
+    rng = random.Random(1147)
+    for _ in range(300):
+        a = rng.randint(-(2**80), 2**80)
+        b = rng.randint(1, 2**40)
+        c = rng.randint(-(2**40), 2**40) or 1
+        d = rng.randint(1, 2**40)
+        x, y = Fraction(a, b, True), Fraction(c, d, True)
+        fx, fy = fractions.Fraction(a, b), fractions.Fraction(c, d)
+        n = rng.choice([c, rng.randint(-50, 50) or 3])
+        for ours, theirs in [
+            (x // y, fx // fy),
+            (x % y, fx % fy),
+            (x // n, fx // n),
+            (x % n, fx % n),
+            (n // x, n // fx) if a else (0, 0),
+            (n % x, n % fx) if a else (0, 0),
+        ]:
+            assert ours == theirs
+        quotient, remainder = divmod(x, y)
+        assert (quotient, remainder) == divmod(fx, fy)
+        assert remainder._normalized and quotient.denominator == 1
+
+    x = Fraction(22, 7, True)
+    with profiling() as stats:
+        divmod(x, 3)
+    assert stats.gcd_calls == 0
+    assert divmod(7, Fraction(2, 3)) == (Fraction(10, 1), Fraction(1, 3))
+    for op in (lambda: Fraction(1, 2) // 0, lambda: Fraction(1, 2) % Fraction(0, 1), lambda: 3 // Fraction(0, 1)):
+        with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+            op()
+    with pytest.raises(TypeError):
+        Fraction(1, 2) // 0.5
+
+
+def test_batch_floor_ceil_round_floordiv():
+    rng = random.Random(1147)
+    values = [Fraction(rng.randint(-(2**70), 2**70), rng.randint(1, 2**30)) for _ in range(500)]
+    values += [Fraction(n, 2) for n in range(-6, 7)] + [7, -3, True]
+    exact = [fractions.Fraction(value.numerator, value.denominator) for value in values]
+    assert Fraction.floor_many(values) == [math.floor(value) for value in exact]
+    assert Fraction.ceil_many(iter(values)) == [math.ceil(value) for value in exact]
+    assert Fraction.round_many(values) == [round(value) for value in exact]
+    assert Fraction.round_many(values, 3) == [round(fractions.Fraction(value), 3) for value in exact]
+    width = Fraction(3, 7)
+    assert Fraction.floordiv_many(values, width) == [value // fractions.Fraction(3, 7) for value in exact]
+    assert Fraction.floordiv_many(values, -2) == [value // -2 for value in exact]
+    assert all(type(value) is int for value in Fraction.floor_many(values))
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        Fraction.floordiv_many(values, Fraction(0, 1))
+
+
 # Run the tests
 if __name__ == "__main__":
     pytest.main()
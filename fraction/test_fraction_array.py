@@ -0,0 +1,190 @@
+import operator
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import fraction
+from fraction import Fraction
+from fraction_array import FractionArray
+
+
+def as_pairs(array):
+    return [(value.numerator, value.denominator) for value in array]
+
+
+def test_fraction_array_initialization():
+    array = FractionArray([2, -3, 0, 5], [4, -9, 7, -10])
+    assert array.numerators.tolist() == [1, 1, 0, -1]
+    assert array.denominators.tolist() == [2, 3, 1, 2]
+    assert array.dtype == np.int64
+    assert len(array) == 4
+
+    # Denominators default to one
+    assert as_pairs(FractionArray([1, 2])) == [(1, 1), (2, 1)]
+
+    # Parts are exposed read-only
+    with pytest.raises(ValueError):
+        array.numerators[0] = 3
+
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        FractionArray([1, 2], [1, 0])
+    with pytest.raises(ValueError, match=r"same length"):
+        FractionArray([1, 2], [1])
+    with pytest.raises(TypeError, match=r"must be integers"):
+        FractionArray([1.5, 2])
+
+
+def test_fraction_array_from_fractions_and_indexing():
+    values = [Fraction(1, 2), Fraction(6, -8), 3, Fraction(2**70, 3)]
+    array = FractionArray.from_fractions(values)
+    assert array.dtype == object
+    assert array[1] == Fraction(-3, 4)
+    assert array[-1] == Fraction(2**70, 3)
+    assert isinstance(array[:2], FractionArray)
+    assert as_pairs(array[:2]) == [(1, 2), (-3, 4)]
+    assert array.to_fractions() == [Fraction(1, 2), Fraction(-3, 4), 3, Fraction(2**70, 3)]
+    assert repr(array[:3]) == "FractionArray([1/2, -3/4, 3])"
+
+
+def test_fraction_array_arithmetic_matches_fraction():
+    rng = random.Random(1147)
+    xs = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000), True) for _ in range(200)]
+    ys = [Fraction(rng.randint(-1000, 1000) or 1, rng.randint(1, 1000), True) for _ in range(200)]
+    left = FractionArray.from_fractions(xs)
+    right = FractionArray.from_fractions(ys)
+    for result, op in (
+        (left + right, lambda x, y: x + y),
+        (left - right, lambda x, y: x - y),
+        (left * right, lambda x, y: x * y),
+        (left / right, lambda x, y: x / y),
+    ):
+        expected = [op(x, y) for x, y in zip(xs, ys)]
+        assert as_pairs(result) == as_pairs(expected)
+
+    # Scalars broadcast on either side
+    half = Fraction(1, 2)
+    assert as_pairs(left + half) == as_pairs([x + half for x in xs])
+    assert as_pairs(2 - left) == as_pairs([Fraction(2, 1) - x for x in xs])
+    assert as_pairs(left * np.int64(3)) == as_pairs([x * 3 for x in xs])
+    assert as_pairs(1 / right) == as_pairs([Fraction(1, 1) / y for y in ys])
+    assert as_pairs(-left) == as_pairs([x * -1 for x in xs])
+    assert as_pairs(abs(left)) == as_pairs([abs(x) for x in xs])
+
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        left / FractionArray([0] * 200)
+    with pytest.raises(TypeError, match=r"Unsupported operand types for \+: 'FractionArray' and 'float'"):
+        left + 1.5
+    with pytest.raises(ValueError, match=r"could not be broadcast"):
+        left + right[:3]
+
+
+def test_fraction_array_scalars_on_the_left():
+    xs = [Fraction(1, 2), Fraction(-3, 4), Fraction(5, 1)]
+    array = FractionArray.from_fractions(xs)
+    for scalar in (Fraction(2, 3), 2, np.int64(2)):
+        exact = scalar if isinstance(scalar, Fraction) else Fraction(int(scalar), 1)
+        for op in (operator.add, operator.sub, operator.mul, operator.truediv):
+            result = op(scalar, array)
+            assert isinstance(result, FractionArray)
+            assert as_pairs(result) == as_pairs([op(exact, x) for x in xs])
+
+
+def test_fraction_array_overflow_falls_back_to_exact_ints():
+    big = 2**62 + 1
+    array = FractionArray([big, 1], [3, 2])
+    assert array.dtype == np.int64
+
+    squared = array * array
+    # Only exact Python ints can hold the first product
+    assert squared.dtype == object
+    assert squared[0] == Fraction(big * big, 9)
+    assert squared[1] == Fraction(1, 4)
+
+    # The array returns to int64 once the values fit again
+    restored = squared / array
+    assert restored.dtype == np.int64
+    assert as_pairs(restored) == [(big, 3), (1, 2)]
+
+    total = FractionArray([big, big], [1, 1]) + FractionArray([big, big], [1, 1])
+    assert total[0] == 2 * big
+
+
+def test_fraction_array_int64_min_is_kept_exact():
+    smallest = -(2**63)
+    array = FractionArray(np.array([smallest, 3]))
+    assert as_pairs(-array) == [(2**63, 1), (-3, 1)]
+    assert as_pairs(abs(array)) == [(2**63, 1), (3, 1)]
+    assert as_pairs(FractionArray(np.array([smallest]), np.array([-1]))) == [(2**63, 1)]
+    assert as_pairs(FractionArray(np.array([-2]), np.array([smallest]))) == [(1, 2**62)]
+    assert FractionArray(np.array([smallest]), np.array([2])).dtype == np.int64
+
+
+def test_fraction_array_comparisons():
+    left = FractionArray([1, 2, 3, 2**62], [2, 3, 4, 1])
+    right = FractionArray([2, 1, 3, 2**62 - 1], [4, 2, 5, 1])
+    assert (left == right).tolist() == [True, False, False, False]
+    assert (left != right).tolist() == [False, True, True, True]
+    assert (left < right).tolist() == [False, False, False, False]
+    assert (left <= right).tolist() == [True, False, False, False]
+    assert (left > right).tolist() == [False, True, True, True]
+    assert (left >= right).tolist() == [True, True, True, True]
+    assert (left < Fraction(2, 3)).tolist() == [True, False, False, False]
+    assert (left == 2**62).tolist() == [False, False, False, True]
+
+    # Equality with unsupported operands falls back instead of raising
+    assert (left == "x") is False
+    assert (left != [1, 2]) is True
+    assert (left == None) is False  # noqa: E711
+    assert left not in [None, "x"]
+    with pytest.raises(TypeError):
+        left < "x"
+
+
+def test_fraction_array_reductions():
+    values = [Fraction(1, n) for n in range(1, 40)]
+    array = FractionArray.from_fractions(values)
+    expected_sum = Fraction(0, 1)
+    expected_prod = Fraction(1, 1)
+    for value in values:
+        expected_sum = expected_sum + value
+        expected_prod = expected_prod * value
+    assert array.sum() == expected_sum
+    assert array.sum().denominator == expected_sum.denominator
+    assert array.prod() == expected_prod
+    assert array.min() == Fraction(1, 39)
+    assert array.max() == Fraction(1, 1)
+
+    mixed = FractionArray([5, -7, 2**70, 0], [3, 2, 9, 1])
+    assert mixed.min() == Fraction(-7, 2)
+    assert mixed.max() == Fraction(2**70, 9)
+
+    empty = FractionArray([], [])
+    assert empty.sum() == 0
+    assert empty.prod() == 1
+    with pytest.raises(ValueError, match=r"empty"):
+        empty.min()
+
+
+def test_fraction_array_to_float():
+    array = FractionArray([1, -3, 2**80], [2, 4, 3])
+    floats = array.to_float()
+    assert floats.dtype == np.float64
+    assert floats.tolist() == [0.5, -0.75, 2**80 / 3]
+    assert FractionArray([1, 1], [3, 8]).to_float().tolist() == [1 / 3, 0.125]
+
+
+def test_fraction_module_import_does_not_load_numpy():
+    code = (
+        "import sys, fraction\n"
+        "assert 'numpy' not in sys.modules\n"
+        "fraction.FractionArray\n"
+        "assert 'numpy' in sys.modules\n"
+    )
+    directory = os.path.dirname(os.path.abspath(fraction.__file__))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=directory)
+    assert fraction.FractionArray is FractionArray
@@ -0,0 +1,148 @@
+import io
+
+import pytest
+
+import fraction_io
+from fraction import LAZY, Fraction, normalization
+
+
+def as_pairs(values):
+    return [(value.numerator, value.denominator) for value in values]
+
+
+def test_write_fractions_matches_str(tmp_path):
+    values = [Fraction(1, 3), 2, Fraction(-5, 4), Fraction(0, 3), Fraction(10**30, 7), Fraction(4, 2, True)]
+    path = tmp_path / "values.txt"
+    assert fraction_io.write_fractions(values, path, batch_size=4) == len(values)
+    expected = "".join(f"{value}\n" for value in values)
+    assert path.read_text() == expected
+
+    binary = io.BytesIO()
+    fraction_io.write_fractions(values, binary)
+    assert binary.getvalue() == expected.encode("ascii")
+
+    text = io.StringIO()
+    assert fraction_io.write_fractions(iter([]), text) == 0
+    assert text.getvalue() == ""
+
+    # Deferred reductions are settled before formatting
+    with normalization(LAZY):
+        pending = Fraction(1, 4) + Fraction(1, 4)
+        fraction_io.write_fractions([pending], text)
+    assert text.getvalue() == "1/2\n"
+
+    with pytest.raises(TypeError):
+        fraction_io.write_fractions([1.5], io.StringIO())
+    with pytest.raises(ValueError, match=r"at least 1"):
+        fraction_io.write_fractions(values, io.StringIO(), batch_size=0)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 20])
+def test_iter_fractions_round_trip(tmp_path, chunk_size):
+    values = [Fraction(n, 7 + n % 5, True) for n in range(-50, 50)] + [Fraction(-(2**80), 3)]
+    path = tmp_path / "values.txt"
+    fraction_io.write_fractions(values, path)
+    assert as_pairs(fraction_io.iter_fractions(path, chunk_size)) == as_pairs(values)
+    with open(path, "rb") as stream:
+        assert as_pairs(fraction_io.iter_fractions(stream, chunk_size)) == as_pairs(values)
+    numerators, denominators = fraction_io.read_parts(str(path), chunk_size)
+    assert list(zip(numerators, denominators)) == as_pairs(values)
+
+
+def test_round_trip_of_negative_denominators_and_unreduced_values():
+    values = [Fraction(1, -2), Fraction(-3, -6), Fraction(4, -8), Fraction(6, 4), Fraction(5, -1), Fraction(0, -3)]
+    stream = io.StringIO()
+    fraction_io.write_fractions(values, stream)
+    # Unreduced parts are kept, as by str(), but the sign moves to the numerator.
+    assert stream.getvalue() == "-1/2\n3/6\n-4/8\n6/4\n-5\n0\n"
+    stream.seek(0)
+    assert list(fraction_io.iter_fractions(stream)) == values
+
+
+def test_readers_accept_every_literal_form():
+    text = "6/8\n\n  -1.5e-3\r\n0.1(6)\n42\n.5"
+    expected = [(3, 4), (-3, 2000), (1, 6), (42, 1), (1, 2)]
+    assert as_pairs(fraction_io.iter_fractions(io.StringIO(text), chunk_size=2)) == expected
+    assert as_pairs(fraction_io.iter_fractions(io.BytesIO(text.encode()))) == expected
+    assert fraction_io.read_parts(io.StringIO("")) == ([], [])
+
+
+def test_readers_report_the_bad_line(tmp_path):
+    path = tmp_path / "bad.txt"
+    path.write_text("1/2\n\n3/4\nthree\n")
+    with pytest.raises(ValueError, match=r"Line 4: Invalid literal for Fraction: 'three'"):
+        list(fraction_io.iter_fractions(path))
+    with pytest.raises(ValueError, match=r"Line 2: Denominator cannot be zero"):
+        fraction_io.read_parts(io.StringIO("1\n1/0\n"))
+    with pytest.raises(ValueError, match=r"at least 1"):
+        fraction_io.read_parts(io.StringIO("1"), chunk_size=0)
+
+
+def test_read_array(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "values.txt"
+    path.write_text("1/2\n-6/8\n3\n")
+    array = fraction_io.read_array(path)
+    assert array.dtype == np.int64
+    assert array.numerators.tolist() == [1, -3, 3]
+    assert array.denominators.tolist() == [2, 4, 1]
+
+
+def test_binary_round_trip():
+    values = [
+        Fraction(1, 3), 2, Fraction(-5, 4), Fraction(0, 1), Fraction(-(2**63), 1), Fraction(2**63 - 1, 2**63 - 2),
+        Fraction(-(10**30), 7), Fraction(7, 2**70), Fraction(2**63, 3), Fraction(1, 2),
+    ]
+    encoded = fraction_io.encode_fractions(values)
+    assert isinstance(encoded, bytearray)
+    for buffer in (encoded, bytes(encoded), memoryview(encoded)):
+        assert as_pairs(fraction_io.decode_fractions(buffer)) == as_pairs(values)
+
+    # Unreduced parts and negative denominators are normalized
+    decoded = fraction_io.decode_fractions(fraction_io.encode_fractions([Fraction(2, 4), Fraction(1, -2), True]))
+    assert as_pairs(decoded) == [(1, 2), (-1, 2), (1, 1)]
+
+    # Encoded buffers concatenate
+    buffer = fraction_io.encode_fractions([Fraction(1, 2)])
+    fraction_io.encode_fractions([Fraction(-(2**80), 3)], buffer)
+    assert fraction_io.decode_parts(buffer) == ([1, -(2**80)], [2, 3])
+
+    assert fraction_io.encode_fractions([]) == bytearray()
+    assert fraction_io.decode_fractions(b"") == []
+    with pytest.raises(TypeError):
+        fraction_io.encode_fractions([0.5])
+
+
+def test_binary_layout():
+    # A FIXED block: tag, varint count, then little-endian int64 pairs
+    assert bytes(fraction_io.encode_fractions([Fraction(-1, 2)])) == (
+        bytes([fraction_io.FIXED, 1]) + (-1).to_bytes(8, "little", signed=True) + (2).to_bytes(8, "little")
+    )
+    # A VARIABLE block: varint length << 1 | sign, magnitude, varint length, denominator
+    assert bytes(fraction_io.encode_fractions([Fraction(-(2**64), 3)])) == (
+        bytes([fraction_io.VARIABLE, 1, 9 << 1 | 1]) + (2**64).to_bytes(9, "little") + bytes([1, 3])
+    )
+    # Counts above 127 take a multi-byte varint
+    encoded = fraction_io.encode_fractions([Fraction(1, 2)] * 300)
+    assert encoded[:3] == bytes([fraction_io.FIXED, 0xAC, 0x02])
+    assert len(fraction_io.decode_fractions(encoded)) == 300
+
+
+def test_binary_rejects_malformed_buffers():
+    encoded = fraction_io.encode_fractions([Fraction(1, 2), Fraction(2**70, 3)])
+    for size in range(1, len(encoded)):
+        if size == 18:
+            # A complete FIXED block on its own is a valid buffer
+            continue
+        with pytest.raises(ValueError, match=r"Truncated"):
+            fraction_io.decode_parts(encoded[:size])
+    with pytest.raises(ValueError, match=r"Unknown block tag 0x07 at offset 0$"):
+        fraction_io.decode_parts(b"\x07\x01")
+    # The tag is checked before its count, and reported at its own offset
+    with pytest.raises(ValueError, match=r"Unknown block tag 0x07 at offset 0$"):
+        fraction_io.decode_parts(b"\x07\x80")
+    with pytest.raises(ValueError, match=r"Unknown block tag 0x07 at offset 18$"):
+        fraction_io.decode_parts(encoded[:18] + b"\x07\xff\xff")
+    zero = bytes([fraction_io.FIXED, 1]) + (1).to_bytes(8, "little") + bytes(8)
+    with pytest.raises(ValueError, match=r"Denominator cannot be zero"):
+        fraction_io.decode_parts(zero)
@@ -0,0 +1,110 @@
+import fractions
+import random
+
+import pytest
+
+from fraction import Fraction
+from fraction_matrix import FractionMatrix
+
+
+def random_rows(rng, rows, columns, spread=9):
+    return [
+        [Fraction(rng.randint(-spread, spread), rng.randint(1, spread), True) for _ in range(columns)]
+        for _ in range(rows)
+    ]
+
+
+def reference_determinant(rows):
+    matrix = [[fractions.Fraction(value.numerator, value.denominator) for value in row] for row in rows]
+    size = len(matrix)
+    determinant = fractions.Fraction(1)
+    for k in range(size):
+        pivot_row = next((i for i in range(k, size) if matrix[i][k]), None)
+        if pivot_row is None:
+            return fractions.Fraction(0)
+        if pivot_row != k:
+            matrix[k], matrix[pivot_row] = matrix[pivot_row], matrix[k]
+            determinant = -determinant
+        determinant *= matrix[k][k]
+        for i in range(k + 1, size):
+            factor = matrix[i][k] / matrix[k][k]
+            for j in range(k, size):
+                matrix[i][j] -= factor * matrix[k][j]
+    return determinant
+
+
+def test_construction_access_and_equality():
+    a = FractionMatrix([[Fraction(1, 2), 1], [Fraction(2, 6), -2]])
+    assert a.shape == (2, 2)
+    assert a[1, 0] == Fraction(1, 3)
+    assert a.to_lists() == [[Fraction(1, 2), Fraction(1, 1)], [Fraction(1, 3), Fraction(-2, 1)]]
+    assert repr(a) == "FractionMatrix([[1/2, 1], [1/3, -2]])"
+    assert a == FractionMatrix([[Fraction(2, 4), Fraction(3, 3)], [Fraction(1, 3), -2]])
+    assert a != FractionMatrix([[1, 1], [1, 1]])
+    assert FractionMatrix.identity(3).to_lists() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    with pytest.raises(ValueError, match="same length"):
+        FractionMatrix([[1, 2], [3]])
+    with pytest.raises(TypeError):
+        FractionMatrix([[0.5]])
+
+
+def test_determinant_and_rank_match_reference():
+    rng = random.Random(1147)
+    for size in (1, 2, 3, 5, 8, 12):
+        rows = random_rows(rng, size, size)
+        assert FractionMatrix(rows).determinant() == reference_determinant(rows)
+        assert FractionMatrix(rows).rank() == size
+    # Row swaps flip the sign
+    assert FractionMatrix([[0, 1], [1, 0]]).determinant() == -1
+    singular = [[1, 2, 3], [2, 4, 6], [Fraction(1, 2), 0, 1]]
+    assert FractionMatrix(singular).determinant() == 0
+    assert FractionMatrix(singular).rank() == 2
+    assert FractionMatrix([[1, 2], [2, 4], [3, 6]]).rank() == 1
+    assert FractionMatrix([[0, 0, 1], [0, 0, 2]]).rank() == 1
+    assert FractionMatrix([[0, 0], [0, 0]]).rank() == 0
+    with pytest.raises(ValueError, match="square"):
+        FractionMatrix([[1, 2, 3], [4, 5, 6]]).determinant()
+
+
+def test_solve_inverse_and_matmul():
+    rng = random.Random(1147)
+    for size in (1, 2, 4, 9, 16):
+        rows = random_rows(rng, size, size)
+        a = FractionMatrix(rows)
+        for _ in range(3):
+            rhs = [Fraction(rng.randint(-20, 20), rng.randint(1, 20)) for _ in range(size)]
+            solution = a.solve(rhs)
+            assert a @ solution == [Fraction(value.numerator, value.denominator, True) for value in rhs]
+            assert all(value._normalized for value in solution)
+        inverse = a.inverse()
+        assert a @ inverse == FractionMatrix.identity(size)
+        assert inverse @ a == FractionMatrix.identity(size)
+        b = FractionMatrix(random_rows(rng, size, 3))
+        assert a @ a.solve(b) == b
+    assert FractionMatrix([[2]]).solve([1]) == [Fraction(1, 2)]
+
+
+def test_solve_reuses_the_factorization():
+    rng = random.Random(1147)
+    a = FractionMatrix(random_rows(rng, 6, 6))
+    determinant = a.determinant()
+    factorization = a._factorization
+    a.solve([1] * 6)
+    a.inverse()
+    assert a._factorization is factorization
+    assert a.determinant() == determinant
+
+
+def test_singular_and_mismatched_systems():
+    singular = FractionMatrix([[1, 2], [2, 4]])
+    with pytest.raises(ValueError, match="singular"):
+        singular.solve([1, 1])
+    with pytest.raises(ValueError, match="singular"):
+        singular.inverse()
+    a = FractionMatrix([[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="length"):
+        a.solve([1, 2, 3])
+    with pytest.raises(ValueError):
+        a @ FractionMatrix([[1, 2, 3]])
+    with pytest.raises(ValueError, match="square"):
+        FractionMatrix([[1, 2, 3], [4, 5, 6]]).solve([1, 2])
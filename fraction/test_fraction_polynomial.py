@@ -0,0 +1,92 @@
+import fractions
+import random
+
+import pytest
+
+import fraction_polynomial
+from fraction import Fraction
+from fraction_polynomial import FractionPolynomial
+
+
+def random_coefficients(rng, count, spread=50):
+    return [Fraction(rng.randint(-spread, spread), rng.randint(1, spread), True) for _ in range(count)]
+
+
+def reference(coefficients, x):
+    x = fractions.Fraction(x.numerator, x.denominator) if isinstance(x, Fraction) else fractions.Fraction(x)
+    total = fractions.Fraction(0)
+    for c in reversed(coefficients):
+        total = total * x + fractions.Fraction(c.numerator, c.denominator)
+    return total
+
+
+def test_construction_access_and_equality():
+    p = FractionPolynomial([Fraction(2, 4), 0, Fraction(1, 3), 0, 0])
+    assert p.degree == 2
+    assert p._denominator == 6 and p._coefficients == [3, 0, 2]
+    assert p.coefficients() == [Fraction(1, 2), Fraction(0, 1), Fraction(1, 3)]
+    assert p[2] == Fraction(1, 3) and p[7] == 0
+    assert repr(p) == "FractionPolynomial([1/2, 0, 1/3])"
+    assert p == FractionPolynomial([Fraction(1, 2), Fraction(0, 5), Fraction(2, 6)])
+    assert p != FractionPolynomial([Fraction(1, 2)])
+    assert FractionPolynomial().degree == FractionPolynomial([0, 0]).degree == -1
+    with pytest.raises(IndexError):
+        p[-1]
+    with pytest.raises(TypeError):
+        FractionPolynomial([0.5])
+
+
+def test_evaluation_matches_reference():
+    rng = random.Random(1147)
+    for count in (1, 2, 5, 20):
+        coefficients = random_coefficients(rng, count)
+        p = FractionPolynomial(coefficients)
+        points = [rng.randint(-9, 9) for _ in range(5)] + [
+            Fraction(rng.randint(-9, 9), rng.choice((2, 3, 7)), True) for _ in range(20)
+        ]
+        values = p.evaluate_many(points)
+        assert values == [reference(coefficients, x) for x in points]
+        assert all(value._normalized for value in values)
+        assert p(points[-1]) == values[-1]
+    assert FractionPolynomial([Fraction(1, 2), 0, Fraction(1, 3)])(3) == Fraction(7, 2)
+    assert FractionPolynomial().evaluate_many([1, Fraction(1, 2)]) == [0, 0]
+
+
+def test_arithmetic():
+    p = FractionPolynomial([Fraction(1, 2), 0, Fraction(1, 3)])
+    q = FractionPolynomial([1, Fraction(-1, 4)])
+    assert p + q == FractionPolynomial([Fraction(3, 2), Fraction(-1, 4), Fraction(1, 3)])
+    assert p - p == FractionPolynomial()
+    assert 1 - p == FractionPolynomial([Fraction(1, 2), 0, Fraction(-1, 3)])
+    assert p + Fraction(1, 2) == FractionPolynomial([1, 0, Fraction(1, 3)])
+    assert 2 + p == FractionPolynomial([Fraction(5, 2), 0, Fraction(1, 3)])
+    assert -q == FractionPolynomial([-1, Fraction(1, 4)])
+    assert p * q == FractionPolynomial([Fraction(1, 2), Fraction(-1, 8), Fraction(1, 3), Fraction(-1, 12)])
+    assert 3 * p == p * 3 == FractionPolynomial([Fraction(3, 2), 0, 1])
+    # Fraction defers to the polynomial's reflected methods.
+    assert Fraction(1, 2) + p == FractionPolynomial([1, 0, Fraction(1, 3)])
+    assert Fraction(1, 2) - p == FractionPolynomial([0, 0, Fraction(-1, 3)])
+    assert Fraction(3, 1) * p == 3 * p
+    assert p * 0 == FractionPolynomial()
+    assert q**3 == q * q * q
+    assert q**0 == FractionPolynomial([1])
+    with pytest.raises(ValueError):
+        q ** -1
+    with pytest.raises(TypeError, match="Unsupported operand types for \\+"):
+        p + 0.5
+
+
+def test_kronecker_matches_schoolbook():
+    rng = random.Random(1147)
+    for length_a, length_b, bits in ((16, 16, 8), (40, 17, 300), (64, 200, 64), (1, 90, 30)):
+        a = [rng.getrandbits(bits) - 2 ** (bits - 1) for _ in range(length_a)]
+        b = [rng.getrandbits(bits) - 2 ** (bits - 1) for _ in range(length_b)]
+        assert fraction_polynomial._kronecker(a, b) == fraction_polynomial._schoolbook(a, b)
+    # Extreme coefficients of one sign produce the largest product terms.
+    a = [-(2**64) + 1] * 40
+    assert fraction_polynomial._kronecker(a, a) == fraction_polynomial._schoolbook(a, a)
+    coefficients = random_coefficients(rng, 50)
+    other = random_coefficients(rng, 30)
+    product = FractionPolynomial(coefficients) * FractionPolynomial(other)
+    for x in (Fraction(1, 3), -2):
+        assert product(x) == reference(coefficients, x) * reference(other, x)
@@ -0,0 +1,77 @@
+import fractions
+import random
+
+import pytest
+
+from fraction import Fraction
+from fraction_vector import FractionVector
+
+
+def random_components(rng, count, spread=50):
+    return [Fraction(rng.randint(-spread, spread), rng.randint(1, spread), True) for _ in range(count)]
+
+
+def exact(values):
+    return [fractions.Fraction(value.numerator, value.denominator) for value in values]
+
+
+def test_construction_access_and_equality():
+    v = FractionVector([Fraction(2, 4), 0, Fraction(-1, 3)])
+    assert len(v) == 3
+    assert v._denominator == 6 and v._components == [3, 0, -2]
+    assert v[2] == Fraction(-1, 3)
+    assert v.to_list() == [Fraction(1, 2), Fraction(0, 1), Fraction(-1, 3)]
+    assert repr(v) == "FractionVector([1/2, 0, -1/3])"
+    assert v == FractionVector([Fraction(1, 2), Fraction(0, 7), Fraction(2, -6)])
+    assert v != FractionVector([Fraction(1, 2), 0, Fraction(1, 3)])
+    assert FractionVector([]).to_list() == []
+    with pytest.raises(TypeError):
+        FractionVector([0.5])
+
+
+def test_dot_norm_and_axpy_match_reference():
+    rng = random.Random(1147)
+    for count in (1, 3, 40):
+        a, b = random_components(rng, count), random_components(rng, count)
+        x, y = FractionVector(a), FractionVector(b)
+        alpha = Fraction(rng.randint(-9, 9), rng.randint(1, 9), True)
+        dot = x.dot(y)
+        assert dot == sum(p * q for p, q in zip(exact(a), exact(b)))
+        assert dot._normalized
+        assert x @ y == dot
+        assert x.norm_squared() == sum(p * p for p in exact(a))
+        expected = [exact([alpha])[0] * p + q for p, q in zip(exact(a), exact(b))]
+        assert y.axpy(alpha, x).to_list() == expected
+        assert y.axpy(alpha, x) == FractionVector(alpha * p + q for p, q in zip(a, b))
+        assert x.scale(alpha) == x * alpha == FractionVector(alpha * p for p in a)
+
+
+def test_vector_arithmetic():
+    v = FractionVector([Fraction(1, 2), Fraction(1, 3)])
+    w = FractionVector([Fraction(1, 2), Fraction(2, 3)])
+    assert v + w == FractionVector([1, 1])
+    assert v - v == FractionVector([0, 0])
+    assert (v - v)._denominator == 1
+    assert -v == FractionVector([Fraction(-1, 2), Fraction(-1, 3)])
+    assert 6 * v == v * 6 == Fraction(6, 1) * v == FractionVector([3, 2])
+    assert v.axpy(0, w) == v
+    with pytest.raises(ValueError, match="same length"):
+        v + FractionVector([1])
+    with pytest.raises(ValueError, match="same length"):
+        v.dot(FractionVector([1, 2, 3]))
+    with pytest.raises(TypeError, match="Unsupported operand types for \\+"):
+        v + [1, 2]
+    with pytest.raises(TypeError, match="Unsupported operand types for \\*"):
+        v * 0.5
+
+
+def test_batched_variants_match_single_calls():
+    rng = random.Random(1147)
+    xs = [FractionVector(random_components(rng, 12)) for _ in range(20)]
+    ys = [FractionVector(random_components(rng, 12)) for _ in range(20)]
+    alpha = Fraction(-3, 7)
+    assert FractionVector.dot_many(xs, ys) == [x.dot(y) for x, y in zip(xs, ys)]
+    assert FractionVector.norm_squared_many(xs) == [x.norm_squared() for x in xs]
+    assert FractionVector.axpy_many(alpha, xs, ys) == [y.axpy(alpha, x) for x, y in zip(xs, ys)]
+    with pytest.raises(ValueError, match="same length"):
+        FractionVector.dot_many([xs[0]], [FractionVector([1])])
@@ -0,0 +1,92 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import multimodular
+from fraction import Fraction
+from fraction_matrix import FractionMatrix
+
+
+def random_rows(rng, size, spread=9):
+    return [
+        [Fraction(rng.randint(-spread, spread), rng.randint(1, spread), True) for _ in range(size)]
+        for _ in range(size)
+    ]
+
+
+def _fixed_ratio(primes, numerator, denominator):
+    return [None if denominator % prime == 0 else numerator * pow(denominator, -1, prime) % prime for prime in primes]
+
+
+def test_primes_and_reconstruction():
+    found = multimodular.primes(5)
+    assert found == sorted(found, reverse=True)
+    assert all(prime < 2**multimodular.PRIME_BITS and multimodular._is_prime(prime) for prime in found)
+    modulus = found[0] * found[1]
+    residue = -7 * pow(12, -1, modulus) % modulus
+    assert multimodular._rational_reconstruction(residue, modulus) == (-7, 12)
+    # Fractions beyond sqrt(modulus / 2) cannot be recovered yet.
+    residue = pow(2**40, -1, modulus)
+    assert multimodular._rational_reconstruction(residue, modulus) != (1, 2**40)
+
+
+def test_run_recovers_fractions_and_integers():
+    numerator, denominator = -(3**200), 7**150
+    (value,) = multimodular.run(_fixed_ratio, (numerator, denominator), workers=1)
+    assert value == Fraction(numerator, denominator, True)
+    assert value._normalized
+    (value,) = multimodular.run(_fixed_ratio, (-(10**300), 1), integer=True, workers=1)
+    assert value == -(10**300)
+    with pytest.raises(ValueError, match="stabilise"):
+        multimodular.run(_fixed_ratio, (1, 3**5000), workers=1, max_primes=20)
+    with pytest.raises(ValueError, match="workers should be at least 1"):
+        multimodular.run(_fixed_ratio, (1, 1), workers=0)
+
+
+def test_determinant_and_solve_match_bareiss():
+    rng = random.Random(1147)
+    for size in (1, 2, 5, 12, 30):
+        rows = random_rows(rng, size)
+        rhs = [Fraction(rng.randint(-20, 20), rng.randint(1, 20), True) for _ in range(size)]
+        matrix = FractionMatrix(rows)
+        assert multimodular.determinant(rows, workers=1) == matrix.determinant()
+        assert multimodular.solve(rows, rhs, workers=1) == matrix.solve(rhs)
+    # Entries too large for int64 take the exact residue path.
+    rows = [[2**70 + 1, 3], [Fraction(1, 3**50), -(5**40)]]
+    assert multimodular.determinant(rows, workers=1) == FractionMatrix(rows).determinant()
+    assert multimodular.solve(rows, [1, 2], workers=1) == FractionMatrix(rows).solve([1, 2])
+    assert multimodular.determinant([], workers=1) == 1
+    assert multimodular.determinant([[1, 2], [2, 4]], workers=1) == 0
+
+
+def test_pure_python_kernels_match(monkeypatch):
+    rng = random.Random(1147)
+    rows = random_rows(rng, 8)
+    rhs = [Fraction(rng.randint(-20, 20), rng.randint(1, 20), True) for _ in range(8)]
+    # A zero leading entry forces a row swap.
+    rows[0][0] = Fraction(0, 1)
+    matrix = FractionMatrix(rows)
+    monkeypatch.setattr(multimodular, "np", None)
+    assert multimodular.determinant(rows, workers=1) == matrix.determinant()
+    assert multimodular.solve(rows, rhs, workers=1) == matrix.solve(rhs)
+
+
+def test_singular_and_mismatched_systems():
+    with pytest.raises(ValueError, match="singular"):
+        multimodular.solve([[1, 2], [2, 4]], [1, 1], workers=1)
+    with pytest.raises(ValueError, match="square"):
+        multimodular.determinant([[1, 2, 3], [4, 5, 6]], workers=1)
+    with pytest.raises(ValueError, match="length"):
+        multimodular.solve([[1, 2], [3, 4]], [1], workers=1)
+
+
+def test_process_pool():
+    rng = random.Random(1147)
+    rows = random_rows(rng, 20)
+    rhs = [Fraction(rng.randint(-20, 20), rng.randint(1, 20), True) for _ in range(20)]
+    matrix = FractionMatrix(rows)
+    with ProcessPoolExecutor(2) as executor:
+        assert multimodular.determinant(rows, executor=executor) == matrix.determinant()
+        assert multimodular.solve(rows, rhs, executor=executor) == matrix.solve(rhs)
+    assert multimodular.solve(rows, rhs, workers=2) == matrix.solve(rhs)
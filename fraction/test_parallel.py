@@ -0,0 +1,49 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import parallel
+from fraction import Fraction
+
+
+def values(count, seed=1147):
+    rng = random.Random(seed)
+    return [Fraction(rng.randint(-1000, 1000), rng.choice([2, 3, 8, 10, 1000, rng.randint(1, 10**6)]), True) for _ in range(count)]
+
+
+def test_parallel_sum_matches_fraction_sum():
+    data = values(2000) + [7, Fraction(2**80, 3)]
+    expected = Fraction.sum(data)
+    result = parallel.parallel_sum(data, workers=2, chunk_size=300)
+    assert result.as_integer_ratio() == expected.as_integer_ratio()
+
+    with ProcessPoolExecutor(2) as executor:
+        for chunk_size in (1, 999, 5000):
+            result = parallel.parallel_sum(iter(data), chunk_size=chunk_size, executor=executor)
+            assert result.as_integer_ratio() == expected.as_integer_ratio()
+
+        # Terms cancelling across chunks still reduce correctly
+        cancelling = [Fraction(1, 6), Fraction(1, 3), Fraction(-1, 2)] * 10
+        assert parallel.parallel_sum(cancelling, chunk_size=4, executor=executor).as_integer_ratio() == (0, 1)
+
+
+def test_parallel_prod_matches_fraction_prod():
+    data = [Fraction(n + 1, n + 2, True) for n in range(1000)] + [Fraction(-3, 7)]
+    expected = Fraction.prod(data)
+    with ProcessPoolExecutor(2) as executor:
+        result = parallel.parallel_prod(data, chunk_size=128, executor=executor)
+        assert result.as_integer_ratio() == expected.as_integer_ratio()
+        assert parallel.parallel_prod(data + [0], chunk_size=128, executor=executor).as_integer_ratio() == (0, 1)
+
+
+def test_parallel_reductions_run_small_inputs_locally():
+    assert parallel.parallel_sum([]).as_integer_ratio() == (0, 1)
+    assert parallel.parallel_prod([]).as_integer_ratio() == (1, 1)
+    assert parallel.parallel_sum([Fraction(1, 2), Fraction(1, 3)], workers=4).as_integer_ratio() == (5, 6)
+    assert parallel.parallel_prod(values(100), workers=1, chunk_size=10) == Fraction.prod(values(100))
+
+    with pytest.raises(ValueError, match=r"workers should be at least 1"):
+        parallel.parallel_sum([1], workers=0)
+    with pytest.raises(ValueError, match=r"chunk_size should be at least 1"):
+        parallel.parallel_sum([1], chunk_size=0)
@@ -0,0 +1,70 @@
+import multiprocessing
+import pickle
+
+import pytest
+
+from fraction import Fraction
+from shared import SharedFractions
+
+
+def as_pairs(values):
+    return [(value.numerator, value.denominator) for value in values]
+
+
+def total(batch):
+    return Fraction.sum(batch.to_fractions())
+
+
+def test_shared_fractions_round_trip():
+    values = [Fraction(n, 7, True) for n in range(-100, 100)] + [Fraction(2**80, 3), 5]
+    with SharedFractions(values) as batch:
+        assert len(batch) == len(values)
+        assert batch.nbytes > 0
+        assert repr(batch).startswith(f"SharedFractions(name={batch.name!r}, count={len(values)}")
+
+        # Pickling sends only a reference to the block
+        payload = pickle.dumps(batch)
+        assert len(payload) < 200
+        received = pickle.loads(payload)
+        assert as_pairs(received.to_fractions()) == as_pairs(values)
+        assert received.to_parts() == batch.to_parts()
+        assert as_pairs(received) == as_pairs(values)
+        with pytest.raises(ValueError, match=r"Only the creating process"):
+            received.unlink()
+        received.close()
+
+        detached = batch.detach()
+    # The block is gone, but the detached copy holds its own bytes
+    assert batch.name is None
+    with pytest.raises(ValueError, match=r"closed"):
+        batch.to_fractions()
+    assert as_pairs(detached) == as_pairs(values)
+    assert repr(detached).startswith("SharedFractions(detached")
+
+    with SharedFractions([]) as empty:
+        assert len(empty) == 0
+        assert empty.to_fractions() == []
+
+
+def test_detached_batches_pickle_out_of_band():
+    values = [Fraction(n, 3, True) for n in range(1000)]
+    with SharedFractions(values) as batch:
+        detached = batch.detach()
+    buffers = []
+    payload = pickle.dumps(detached, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(payload) < 200
+    clone = pickle.loads(payload, buffers=buffers)
+    assert as_pairs(clone) == as_pairs(values)
+
+    # Older protocols carry the bytes in band
+    clone = pickle.loads(pickle.dumps(detached, protocol=4))
+    assert as_pairs(clone) == as_pairs(values)
+
+
+def test_shared_fractions_in_worker_processes():
+    values = [Fraction(n, 7 + n % 3, True) for n in range(5000)]
+    with SharedFractions(values) as batch:
+        with multiprocessing.Pool(2) as pool:
+            results = pool.map(total, [batch] * 4)
+    assert results == [Fraction.sum(values)] * 4
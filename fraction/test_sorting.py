@@ -0,0 +1,100 @@
+import fractions
+import random
+
+import pytest
+
+import sorting
+from fraction import Fraction
+
+
+def random_values(rng, count, bits):
+    values = []
+    for _ in range(count):
+        choice = rng.random()
+        if choice < 0.1:
+            values.append(rng.randint(-5, 5))
+        elif choice < 0.2:
+            # Values that collide on their float key
+            base = rng.randint(1, 2**60)
+            values.append(Fraction(base * 2**bits + rng.randint(0, 3), 2**bits, True))
+        elif choice < 0.25:
+            values.append(Fraction(rng.choice((1, -1)) * 10**400, rng.randint(1, 9)))
+        else:
+            values.append(
+                Fraction(rng.randint(-(2**bits), 2**bits), rng.randint(1, 2**bits) * rng.choice((1, -1)))
+            )
+    return values
+
+
+def exact(values):
+    return [(fractions.Fraction(value.numerator, value.denominator)) for value in values]
+
+
+def test_sort_and_argsort_match_sorted():
+    rng = random.Random(1147)
+    for bits in (8, 80, 600):
+        values = random_values(rng, 400, bits)
+        expected = sorted(values)
+        result = sorting.sort(values)
+        assert exact(result) == exact(expected)
+        # Stable: equal values keep their input order
+        assert [id(value) for value in result] == [id(value) for value in expected]
+
+        expected = sorted(values, reverse=True)
+        result = sorting.sort(iter(values), reverse=True)
+        assert [id(value) for value in result] == [id(value) for value in expected]
+
+        order = sorting.argsort(values)
+        assert [values[index] for index in order] == sorting.sort(values)
+
+
+def test_sort_mixed_types():
+    values = [Fraction(1, 3), 0.25, 1, Fraction(-1, 2), Fraction(1, 4), -1.5]
+    assert sorting.sort(values) == [-1.5, Fraction(-1, 2), 0.25, Fraction(1, 4), Fraction(1, 3), 1]
+    assert sorting.sort([]) == []
+
+
+def test_nsmallest_and_nlargest():
+    rng = random.Random(1147)
+    values = random_values(rng, 500, 80)
+    for k in (0, 1, 7, 100, 600):
+        smallest = sorting.nsmallest(k, values)
+        largest = sorting.nlargest(k, values)
+        assert [id(value) for value in smallest] == [id(value) for value in sorted(values)[:k]]
+        assert [id(value) for value in largest] == [
+            id(value) for value in sorted(values, reverse=True)[:k]
+        ]
+    assert sorting.nsmallest(3, []) == []
+
+
+def test_min_and_max():
+    rng = random.Random(1147)
+    values = random_values(rng, 500, 80)
+    assert sorting.min(values) is min(values)
+    assert sorting.max(values) is max(values)
+
+    close = [Fraction(2**80 + 1, 2**80), Fraction(2**80 + 2, 2**80), Fraction(2**80, 2**80)]
+    assert sorting.min(close) == 1
+    assert sorting.max(close) == Fraction(2**80 + 2, 2**80)
+
+    with pytest.raises(ValueError, match=r"empty"):
+        sorting.min([])
+    with pytest.raises(ValueError, match=r"empty"):
+        sorting.max([])
+
+
+def test_select_and_median():
+    rng = random.Random(1147)
+    values = random_values(rng, 301, 80)
+    ordered = sorted(values)
+    for rank in (0, 1, 150, 299, 300, -1):
+        assert sorting.select(values, rank) == ordered[rank]
+    with pytest.raises(IndexError):
+        sorting.select(values, 301)
+
+    assert sorting.median(values) == ordered[150]
+    assert sorting.median([Fraction(1, 2), Fraction(1, 3), 1, 0]) == Fraction(5, 12)
+    assert sorting.median([1, 2]) == Fraction(3, 2)
+    assert sorting.median([0.5, Fraction(1, 4)]) == 0.375
+    with pytest.raises(ValueError, match=r"empty"):
+        sorting.median([])